@@ -0,0 +1,148 @@
+# BackgroundWorker_v2.py
+# Authors: Group 3 - Vanshika Kukreja, Miloni Mehta
+# Date: October 17, 2026
+# Description: Runs tracker operations off the Tk mainloop and hands results back to the GUI thread
+
+import queue
+from concurrent.futures import ThreadPoolExecutor
+
+
+class _Job:
+    """
+    Bookkeeping for one submitted job.
+    """
+
+    def __init__(self, key, generation, on_done, on_error, on_progress=None):
+        self.key = key
+        self.generation = generation
+        self.on_done = on_done
+        self.on_error = on_error
+        self.on_progress = on_progress
+        self.future = None
+
+
+class BackgroundWorker:
+    """
+    Single background thread for tracker I/O and analytics.
+
+    All tracker work goes through one thread so the tracker is never used
+    concurrently. Results are queued and picked up on the Tk mainloop with
+    root.after, since tkinter widgets must only be touched from that thread.
+
+    Jobs submitted with the same key supersede each other: a newer job cancels
+    an older one that has not started yet, and results of older jobs that did
+    run are dropped instead of being delivered.
+
+    Long jobs can report progress: with on_progress, the function gets a
+    progress callable, and each call is forwarded to on_progress on the GUI thread.
+    """
+
+    def __init__(self, root, poll_interval=25):
+        """
+        Initialize the worker.
+
+        Args:
+            root: tkinter root window used to schedule result callbacks
+            poll_interval (int): Milliseconds between checks for finished jobs
+        """
+        self.root = root
+        self.poll_interval = poll_interval
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='tracker-worker')
+        self._results = queue.Queue()
+        self._generations = {}  # Key -> generation of the newest job with that key
+        self._latest = {}  # Key -> newest job with that key
+        self._pending = 0
+        self._polling = False
+
+    def submit(self, func, *args, on_done=None, on_error=None, on_progress=None, key=None,
+               **kwargs):
+        """
+        Run a function on the worker thread.
+
+        Args:
+            func: Function to run
+            *args: Positional arguments for func
+            on_done: Called on the GUI thread with the result
+            on_error: Called on the GUI thread with the exception if func raised
+            on_progress: Called on the GUI thread with the arguments of every
+                progress(...) call made by func; func receives progress as a keyword argument
+            key (str): Optional job key; a newer job with the same key makes this one stale
+            **kwargs: Keyword arguments for func
+        """
+        generation = 0
+        if key is not None:
+            generation = self._generations.get(key, 0) + 1
+            self._generations[key] = generation
+            previous = self._latest.get(key)
+            if previous is not None and previous.future.cancel():
+                self._pending -= 1
+
+        job = _Job(key, generation, on_done, on_error, on_progress)
+        if key is not None:
+            self._latest[key] = job
+        if on_progress is not None:
+            kwargs['progress'] = lambda *values: self._results.put(('progress', job, values))
+        job.future = self._executor.submit(self._run, job, func, args, kwargs)
+        self._pending += 1
+
+        if not self._polling:
+            self._polling = True
+            self.root.after(self.poll_interval, self._poll)
+
+    def is_stale(self, key, generation):
+        """
+        Check whether a newer job with the same key has been submitted.
+
+        Args:
+            key (str): Job key
+            generation (int): Generation of the job to check
+
+        Returns:
+            bool: True if the job's result would be dropped
+        """
+        return self._generations.get(key, 0) != generation
+
+    def _run(self, job, func, args, kwargs):
+        """
+        Execute one job on the worker thread and queue its outcome.
+        """
+        try:
+            self._results.put(('done', job, func(*args, **kwargs)))
+        except Exception as error:
+            self._results.put(('error', job, error))
+
+    def _poll(self):
+        """
+        Deliver progress and finished jobs on the GUI thread,
+        then poll again while jobs are pending.
+        """
+        while True:
+            try:
+                kind, job, payload = self._results.get_nowait()
+            except queue.Empty:
+                break
+
+            if kind != 'progress':
+                self._pending -= 1
+            if job.key is not None and self.is_stale(job.key, job.generation):
+                continue
+            if kind == 'progress':
+                job.on_progress(*payload)
+            elif kind == 'error':
+                if job.on_error is not None:
+                    job.on_error(payload)
+                else:
+                    self.root.report_callback_exception(type(payload), payload, payload.__traceback__)
+            elif job.on_done is not None:
+                job.on_done(payload)
+
+        if self._pending > 0:
+            self.root.after(self.poll_interval, self._poll)
+        else:
+            self._polling = False
+
+    def shutdown(self):
+        """
+        Wait for queued jobs to finish and stop the worker thread.
+        """
+        self._executor.shutdown(wait=True)
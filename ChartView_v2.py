@@ -0,0 +1,260 @@
+# ChartView_v2.py
+# Authors: Group 3 - Vanshika Kukreja, Miloni Mehta
+# Date: October 17, 2026
+# Description: Persistent Analytics charts that update their artists in place and redraw with blitting
+
+from abc import ABC, abstractmethod
+import numpy as np
+from matplotlib.figure import Figure
+
+
+class Chart(ABC):
+    """
+    One matplotlib figure that stays alive for the whole session.
+
+    New data moves the existing artists (wedge angles, bar heights, line data)
+    instead of building a new figure. The data artists are animated, so when
+    the axes do not change only they are redrawn over a cached background
+    (blitting); a full draw is needed only when the axes limits or the set
+    of labels change, or the widget is resized. Subclasses implement _update.
+    """
+
+    figsize = (10, 6)
+    empty_message = "No data available"
+
+    def __init__(self):
+        """
+        Create the figure and its axes.
+        """
+        self.figure = Figure(figsize=self.figsize, dpi=100)
+        self.ax = self.figure.add_subplot(111)
+        self.canvas = None
+        self.artists = []  # Animated artists, drawn over the background
+        self._background = None
+
+    def attach(self, canvas):
+        """
+        Connect the chart to the canvas that displays it.
+
+        Args:
+            canvas: matplotlib canvas of the figure (e.g. FigureCanvasTkAgg)
+        """
+        self.canvas = canvas
+        canvas.mpl_connect('draw_event', self._on_draw)
+
+    def is_empty(self, data):
+        """
+        Check whether there is nothing to plot.
+
+        Args:
+            data: Chart input from the tracker
+
+        Returns:
+            bool: True if the chart should show empty_message instead
+        """
+        return data.empty
+
+    def show(self, data):
+        """
+        Plot new data, blitting the changed artists when possible.
+
+        Args:
+            data: Chart input from the tracker
+        """
+        redraw = self._update(data)
+        if self.canvas is None:
+            return
+        if redraw or self._background is None:
+            self.canvas.draw_idle()  # The draw event recaptures the background
+        else:
+            self.canvas.restore_region(self._background)
+            self._draw_artists()
+            self.canvas.blit(self.figure.bbox)
+
+    @abstractmethod
+    def _update(self, data):
+        """
+        Move the artists to new data.
+
+        Returns:
+            bool: True if the whole figure has to be drawn again
+        """
+
+    def _animate(self, artists):
+        """
+        Make artists the animated ones, drawn on top of the cached background.
+        """
+        self.artists = list(artists)
+        for artist in self.artists:
+            artist.set_animated(True)
+
+    def _rescale(self):
+        """
+        Fit the axes limits to the data if it no longer fits them well.
+        The limits are kept while the data stays inside them and fills at
+        least half of the height, so small changes can be blitted.
+
+        Returns:
+            bool: True if the limits changed (ticks and background must be redrawn)
+        """
+        self.ax.relim()
+        (left, right), (bottom, top) = self.ax.get_xlim(), self.ax.get_ylim()
+        (x_low, x_high), (y_low, y_high) = self.ax.dataLim.intervalx, self.ax.dataLim.intervaly
+        if (left <= x_low and x_high <= right and bottom <= y_low and y_high <= top and
+                y_high - y_low >= (top - bottom) / 2):
+            return False
+        self.ax.autoscale_view()
+        return True
+
+    def _on_draw(self, event):
+        """
+        After a full draw: keep the background and draw the animated artists on it.
+        """
+        self._background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self._draw_artists()
+
+    def _draw_artists(self):
+        """
+        Draw the animated artists onto the canvas.
+        """
+        for artist in self.artists:
+            self.figure.draw_artist(artist)
+
+
+class CategoryChart(Chart):
+    """
+    Pie chart of expenses by category.
+    """
+
+    figsize = (8, 6)
+    empty_message = "No expense data available"
+    COLORS = ['#ff9999', '#66b3ff', '#99ff99', '#ffcc99', '#ff99cc', '#c2c2f0']
+    START_ANGLE = 90
+    LABEL_DISTANCE = 1.1
+    PCT_DISTANCE = 0.6
+
+    def __init__(self):
+        super().__init__()
+        self.labels = None
+        self.wedges, self.texts, self.autotexts = [], [], []
+
+    def is_empty(self, data):
+        return not data
+
+    def _update(self, categories):
+        labels = list(categories.keys())
+        sizes = list(categories.values())
+
+        if labels != self.labels:
+            # Different categories: build the wedges again
+            self.ax.clear()
+            self.wedges, self.texts, self.autotexts = self.ax.pie(
+                sizes, labels=labels, autopct='%1.1f%%', startangle=self.START_ANGLE,
+                colors=self.COLORS, labeldistance=self.LABEL_DISTANCE,
+                pctdistance=self.PCT_DISTANCE)
+            self.ax.set_title('Expense Distribution by Category', fontsize=14, fontweight='bold')
+            self.labels = labels
+            self._animate(self.wedges + self.texts + self.autotexts)
+            return True
+
+        # Same categories: move the wedge edges, labels and percentages
+        total = sum(sizes)
+        theta = self.START_ANGLE
+        for wedge, text, autotext, size in zip(self.wedges, self.texts, self.autotexts, sizes):
+            span = 360 * size / total
+            wedge.set_theta1(theta)
+            wedge.set_theta2(theta + span)
+            middle = np.deg2rad(theta + span / 2)
+            x, y = float(np.cos(middle)), float(np.sin(middle))
+            text.set_position((self.LABEL_DISTANCE * x, self.LABEL_DISTANCE * y))
+            text.set_horizontalalignment('left' if x > 0 else 'right')
+            autotext.set_position((self.PCT_DISTANCE * x, self.PCT_DISTANCE * y))
+            autotext.set_text(f"{100 * size / total:.1f}%")
+            theta += span
+        return False
+
+
+class MonthlyChart(Chart):
+    """
+    Bar chart of monthly income vs expenses.
+    """
+
+    WIDTH = 0.35
+
+    def __init__(self):
+        super().__init__()
+        self.months = None
+        self.income_bars, self.expense_bars = [], []
+
+    def _update(self, monthly_data):
+        months = list(monthly_data.index)
+        incomes = monthly_data['income'].tolist()
+        expenses = monthly_data['expense'].tolist()
+
+        if months != self.months:
+            # Different months: build the bars and tick labels again
+            self.ax.clear()
+            x = range(len(months))
+            self.income_bars = list(self.ax.bar([i - self.WIDTH / 2 for i in x], incomes,
+                                                self.WIDTH, label='Income', color='green', alpha=0.7))
+            self.expense_bars = list(self.ax.bar([i + self.WIDTH / 2 for i in x], expenses,
+                                                 self.WIDTH, label='Expenses', color='red', alpha=0.7))
+            self.ax.set_xlabel('Month', fontsize=12)
+            self.ax.set_ylabel('Amount ($)', fontsize=12)
+            self.ax.set_title('Monthly Income vs Expenses', fontsize=14, fontweight='bold')
+            self.ax.set_xticks(x)
+            self.ax.set_xticklabels(months, rotation=45)
+            self.ax.legend()
+            self.ax.grid(axis='y', alpha=0.3)
+            self.figure.tight_layout()
+            self.months = months
+            self._animate(self.income_bars + self.expense_bars)
+            return True
+
+        # Same months: only the bar heights change
+        for bar, value in zip(self.income_bars, incomes):
+            bar.set_height(value)
+        for bar, value in zip(self.expense_bars, expenses):
+            bar.set_height(value)
+        return self._rescale()
+
+
+class TrendChart(Chart):
+    """
+    Line chart of daily spending over the last 30 days.
+    """
+
+    empty_message = "No spending data available for last 30 days"
+
+    def __init__(self):
+        super().__init__()
+        self.line = None
+
+    def _update(self, trend_data):
+        dates = trend_data['Date'].to_numpy()
+        amounts = trend_data['Amount'].to_numpy()
+
+        if self.line is None:
+            self.line, = self.ax.plot(dates, amounts, marker='o',
+                                      linewidth=2, markersize=6, color='#ff6b6b')
+            self.ax.set_xlabel('Date', fontsize=12)
+            self.ax.set_ylabel('Daily Spending ($)', fontsize=12)
+            self.ax.set_title('30-Day Spending Trend', fontsize=14, fontweight='bold')
+            self.ax.grid(True, alpha=0.3)
+
+            # Rotate x-axis labels
+            self.figure.autofmt_xdate()
+            self.figure.tight_layout()
+            self._animate([self.line])
+            return True
+
+        self.line.set_data(dates, amounts)
+        return self._rescale()
+
+
+# Chart classes by the name used in the Analytics tab
+CHARTS = {
+    'category': CategoryChart,
+    'monthly': MonthlyChart,
+    'trend': TrendChart,
+}
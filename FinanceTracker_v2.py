@@ -3,9 +3,323 @@
 # Date: December 3, 2025
 # Description: Enhanced FinanceTracker class with advanced analytics and budget management
 
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 from Transaction_v2 import Transaction
+from SearchIndex_v2 import SearchIndex
+from Storage_v2 import (COLUMNS, CATEGORICAL_COLUMNS, ID_COLUMN, TRANSACTION_TYPES, CSVStorage,
+                        TombstoneLog, deletion_log_path, get_exporter, get_storage, has_ids,
+                        normalize_frame, to_cents, validate_frame)
+from Snapshot_v2 import RECENT_ROWS, Snapshot, read_snapshot, remove_snapshot, write_snapshot
+
+
+# Number of buffered new rows that triggers a merge into the DataFrame
+APPEND_BUFFER_SIZE = 10000
+
+# Number of appending saves between fsync calls in append-only mode
+FSYNC_EVERY = 32
+
+# Number of rows read at a time when importing a CSV file
+IMPORT_CHUNK_ROWS = 100000
+
+# Number of rows written at a time when exporting
+EXPORT_CHUNK_ROWS = 100000
+
+# Share of deleted rows in the data file above which saving rewrites it without them
+COMPACT_DEAD_FRACTION = 0.25
+
+# Budget periods: spending is counted over all time, the current month or the current week
+BUDGET_PERIODS = ('total', 'monthly', 'weekly')
+
+
+def _to_dollars(cents_by_key):
+    """
+    Convert a dict of integer cents to dollars.
+    """
+    return {key: cents / 100 for key, cents in cents_by_key.items()}
+
+
+def _type_totals(df):
+    """
+    Sum the amounts of a DataFrame per transaction type, in integer cents.
+
+    Args:
+        df (pandas.DataFrame): Transactions in the tracker's schema
+
+    Returns:
+        dict: Type -> total in cents
+    """
+    cents = pd.Series(to_cents(df['Amount']), index=df.index)
+    totals = cents.groupby(df['Income/Expense'], observed=True).sum()
+    return {str(trans_type): int(total) for trans_type, total in totals.items()}
+
+
+def _transaction_from_values(values):
+    """
+    Build a Transaction from one row of values in COLUMNS order.
+
+    Args:
+        values (tuple): Date, mode, category, sub category, type, amount, notes
+
+    Returns:
+        Transaction: The matching transaction object
+    """
+    date, mode, category, sub_category, trans_type, amount, notes = values
+    return Transaction(date.strftime('%Y-%m-%d'), mode, category, sub_category,
+                       trans_type, amount, notes)
+
+
+class TransactionView:
+    """
+    Lazy, read-only sequence of Transaction objects backed by the tracker's DataFrame.
+    Transaction objects are only built when accessed (in batches when iterating),
+    so the tracker no longer keeps a second full copy of the ledger in memory.
+    """
+
+    # Number of rows converted at a time while iterating
+    BATCH_SIZE = 10000
+
+    def __init__(self, tracker):
+        """
+        Initialize the view.
+
+        Args:
+            tracker (FinanceTracker): Tracker whose rows are exposed
+        """
+        self._tracker = tracker
+
+    def __len__(self):
+        """
+        Returns:
+            int: Number of transactions in the tracker
+        """
+        return len(self._tracker.df)
+
+    def __getitem__(self, index):
+        """
+        Get one transaction (or a list of transactions for a slice).
+
+        Args:
+            index (int or slice): Position of the transaction(s)
+
+        Returns:
+            Transaction or list: The requested transaction(s)
+        """
+        df = self._tracker.df
+        if isinstance(index, slice):
+            rows = df[COLUMNS].iloc[index].itertuples(index=False, name=None)
+            return [_transaction_from_values(values) for values in rows]
+
+        if index < 0:
+            index += len(df)
+        if not 0 <= index < len(df):
+            raise IndexError("transaction index out of range")
+        return _transaction_from_values(tuple(df[COLUMNS].iloc[index]))
+
+    def __iter__(self):
+        """
+        Iterate over all transactions, converting BATCH_SIZE rows at a time.
+
+        Yields:
+            Transaction: Each transaction in file order
+        """
+        df = self._tracker.df[COLUMNS]
+        for start in range(0, len(df), self.BATCH_SIZE):
+            batch = df.iloc[start:start + self.BATCH_SIZE]
+            for values in batch.itertuples(index=False, name=None):
+                yield _transaction_from_values(values)
+
+
+class DateIndex:
+    """
+    Transactions sorted by date with prefix sums of income and expense amounts (in cents).
+    A date range maps to a slice found by binary search, so ranged totals
+    cost O(log N) instead of a scan over the whole DataFrame.
+    """
+
+    def __init__(self, df):
+        """
+        Build the index from the tracker's DataFrame.
+
+        Args:
+            df (pandas.DataFrame): Transactions in the tracker's schema
+        """
+        dates = df['Date'].to_numpy(dtype='datetime64[ns]')
+        self.order = np.argsort(dates, kind='stable')  # Row positions in date order
+        self.dates = dates[self.order]
+
+        cents = to_cents(df['Amount'])[self.order]
+        self.prefix_sums = {}
+        for trans_type in ('Income', 'Expense'):
+            matches = (df['Income/Expense'] == trans_type).to_numpy(dtype=bool)[self.order]
+            sums = np.cumsum(np.where(matches, cents, 0))
+            self.prefix_sums[trans_type] = np.concatenate(([0], sums))
+
+    def bounds(self, start_date=None, end_date=None):
+        """
+        Find the slice of sorted positions inside a date range (both ends inclusive).
+
+        Args:
+            start_date (str): Optional start date
+            end_date (str): Optional end date
+
+        Returns:
+            tuple: (low, high) positions into the sorted dates
+        """
+        low, high = 0, len(self.dates)
+        if start_date:
+            low = np.searchsorted(self.dates, pd.Timestamp(start_date).to_datetime64(), 'left')
+        if end_date:
+            high = np.searchsorted(self.dates, pd.Timestamp(end_date).to_datetime64(), 'right')
+        return low, max(low, high)
+
+    def positions(self, start_date=None, end_date=None):
+        """
+        Row positions of the transactions inside a date range, in file order.
+
+        Args:
+            start_date (str): Optional start date
+            end_date (str): Optional end date
+
+        Returns:
+            numpy.ndarray: Sorted row positions into the DataFrame
+        """
+        low, high = self.bounds(start_date, end_date)
+        return np.sort(self.order[low:high])
+
+    def total(self, trans_type, start_date=None, end_date=None):
+        """
+        Sum the amounts of one transaction type inside a date range.
+
+        Args:
+            trans_type (str): "Income" or "Expense"
+            start_date (str): Optional start date
+            end_date (str): Optional end date
+
+        Returns:
+            float: Total amount
+        """
+        low, high = self.bounds(start_date, end_date)
+        sums = self.prefix_sums[trans_type]
+        return int(sums[high] - sums[low]) / 100
+
+
+class Rollup:
+    """
+    Materialized sum (in integer cents) and count of amounts per (month, category, type).
+    Kept up to date as transactions are added and deleted, so category,
+    monthly and budget queries never have to touch the raw rows.
+    """
+
+    def __init__(self):
+        """
+        Initialize an empty rollup.
+        """
+        self.cells = {}  # (month, category, type) -> [sum in cents, count]
+
+    @classmethod
+    def from_frame(cls, df):
+        """
+        Build a rollup from a DataFrame in one grouped pass.
+
+        Args:
+            df (pandas.DataFrame): Transactions in the tracker's schema
+
+        Returns:
+            Rollup: Rollup over all rows of the frame
+        """
+        rollup = cls()
+        if df.empty:
+            return rollup
+
+        # Group on integer month numbers and format only the distinct months,
+        # since strftime over every row dominates the load time of large ledgers
+        months = pd.Series(df['Date'].to_numpy().astype('datetime64[M]').astype(np.int64),
+                           index=df.index, name='Month')
+        cents = pd.Series(to_cents(df['Amount']), index=df.index, name='Cents')
+        grouped = (cents.groupby([months, df['Category'], df['Income/Expense']], observed=True)
+                   .agg(['sum', 'count']))
+        labels = {}
+        for (month, category, trans_type), total, count in zip(
+                grouped.index, grouped['sum'], grouped['count']):
+            if month not in labels:
+                labels[month] = str(np.datetime64(int(month), 'M'))
+            rollup.cells[(labels[month], str(category), str(trans_type))] = [int(total), int(count)]
+        return rollup
+
+    def add(self, month, category, trans_type, cents):
+        """
+        Add one transaction to its cell.
+
+        Args:
+            month (str): Month in format YYYY-MM
+            category (str): Transaction category
+            trans_type (str): "Income" or "Expense"
+            cents (int): Transaction amount in cents
+        """
+        cell = self.cells.setdefault((month, category, trans_type), [0, 0])
+        cell[0] += cents
+        cell[1] += 1
+
+    def remove(self, month, category, trans_type, cents):
+        """
+        Remove one transaction from its cell, dropping the cell when it empties.
+
+        Args:
+            month (str): Month in format YYYY-MM
+            category (str): Transaction category
+            trans_type (str): "Income" or "Expense"
+            cents (int): Transaction amount in cents
+        """
+        key = (month, category, trans_type)
+        cell = self.cells[key]
+        cell[0] -= cents
+        cell[1] -= 1
+        if cell[1] == 0:
+            del self.cells[key]
+
+    def merge(self, other):
+        """
+        Add every cell of another rollup to this one.
+
+        Args:
+            other (Rollup): Rollup of newly added transactions
+        """
+        for key, (total, count) in other.cells.items():
+            cell = self.cells.setdefault(key, [0, 0])
+            cell[0] += total
+            cell[1] += count
+
+    def category_totals(self, trans_type='Expense', month=None):
+        """
+        Total amount per category for one transaction type.
+
+        Args:
+            trans_type (str): "Income" or "Expense"
+            month (str): Optional month (YYYY-MM) to restrict the totals to
+
+        Returns:
+            dict: Category -> total in cents, sorted by category
+        """
+        totals = {}
+        for (cell_month, category, cell_type), (total, _) in self.cells.items():
+            if cell_type == trans_type and (month is None or cell_month == month):
+                totals[category] = totals.get(category, 0) + total
+        return dict(sorted(totals.items()))
+
+    def month_totals(self):
+        """
+        Total amount per month and transaction type.
+
+        Returns:
+            dict: Month -> {type: total in cents}, in chronological order
+        """
+        totals = {}
+        for (month, _, trans_type), (total, _) in self.cells.items():
+            month_totals = totals.setdefault(month, {})
+            month_totals[trans_type] = month_totals.get(trans_type, 0) + total
+        return dict(sorted(totals.items()))
 
 
 class FinanceTracker:
@@ -14,51 +328,132 @@ class FinanceTracker:
     Manages all financial transactions for the student finance tracker.
     """
 
-    def __init__(self, csv_file='transactions.csv'):
+    # Incremented on every change to the transactions, so callers can cache query results
+    version = 0
+
+    def __init__(self, csv_file='transactions.csv', append_only=True):
         """
-        Initialize the FinanceTracker with a CSV file.
+        Initialize the FinanceTracker with a data file.
 
         Args:
-            csv_file (str): Path to the CSV file storing transactions
+            csv_file (str): Path to the file storing transactions; the extension picks
+                the format (.csv, .feather/.arrow or .parquet)
+            append_only (bool): If True, save_data appends new rows to the file
+                instead of rewriting it
         """
         self.csv_file = csv_file
-        self.transactions = []
-        self.df = None
+        self.storage = get_storage(csv_file)
+        self.append_only = append_only
+        self._saved_id = -1  # Highest transaction ID already in the file
+        self._saved_size = None  # File size after our last write (None forces a rewrite)
+        self._file_size = None  # File size when it last held every row (None: it does not)
+        self._unsynced_saves = 0
+        self.transactions = TransactionView(self)
+        self._df = None  # Indexed by transaction ID, in increasing order
+        self._next_id = 0
+        self._pending = {col: [] for col in COLUMNS}  # Columnar buffer of new rows
+        self._pending_count = 0
+        self._deleted = set()  # Positions in _df of deleted rows not dropped yet
+        self._deletion_log = TombstoneLog(deletion_log_path(csv_file))
+        self._durable_id = -1  # Highest ID in the data file or the deletion log
+        self._unsaved_deletes = []  # IDs of deleted rows of the file not logged yet
+        self._file_rows = 0  # Rows in the data file, including deleted ones
+        self._dead_rows = 0  # Deleted rows still in the data file
+        self._totals = {}  # Running total in cents per transaction type
+        self._date_index = None  # Built on the first date-ranged query
+        self._rollup = Rollup()  # Per (month, category, type) sums and counts
+        self._search_index = None  # Built on the first search
+        self._snapshot_state = None  # (Data version, file size) the snapshot file was written for
         self.budgets = {}  # Dictionary to store category budgets
+        self.budget_periods = {}  # Budget period per category ('total' if not set)
         self.load_data()
 
+    @property
+    def df(self):
+        """
+        All transactions as a DataFrame, indexed by transaction ID.
+        Buffered rows from add_transaction are merged in and deleted rows
+        dropped, each batch at once, before it is returned.
+
+        Returns:
+            pandas.DataFrame: Transactions in file order
+        """
+        if self._pending_count:
+            self._flush_pending()
+        if self._deleted:
+            self._drop_deleted()
+        return self._df
+
+    @df.setter
+    def df(self, value):
+        """
+        Replace the transactions DataFrame, discarding any buffered rows.
+        Running totals are recomputed and the next save rewrites the whole file.
+        Rows are numbered from 0 unless the frame is already indexed by unique,
+        increasing transaction IDs.
+
+        Args:
+            value (pandas.DataFrame): New transactions frame
+        """
+        if not has_ids(value):
+            value = value.set_axis(pd.RangeIndex(len(value), name=ID_COLUMN))
+        self._df = value
+        self._next_id = int(value.index[-1]) + 1 if len(value) else 0
+        self._saved_size = None
+        self._file_size = None
+        self._pending = {col: [] for col in COLUMNS}
+        self._pending_count = 0
+        self._deleted = set()
+        self._unsaved_deletes = []
+        self._dead_rows = 0
+        self._date_index = None
+        self._search_index = None
+        self._totals = _type_totals(value)
+        self._rollup = Rollup.from_frame(value)
+        self._changed()
+
+    def _changed(self):
+        """
+        Record that the transactions changed (bumps the data version).
+        """
+        self.version += 1
+
     def load_data(self):
         """
-        Load transaction data from CSV file.
+        Load transaction data from the data file.
         Creates a new file with sample data if it doesn't exist.
         """
         try:
-            # Read CSV file using pandas
-            self.df = pd.read_csv(self.csv_file)
-
-            # Add Notes column if it doesn't exist (backward compatibility)
-            if 'Notes' not in self.df.columns:
-                self.df['Notes'] = ''
-
-            # Convert DataFrame rows to Transaction objects
-            for _, row in self.df.iterrows():
-                trans = Transaction(
-                    date=row['Date'],
-                    mode=row['Mode'],
-                    category=row['Category'],
-                    sub_category=row['Sub Category'],
-                    trans_type=row['Income/Expense'],
-                    amount=row['Amount'],
-                    notes=row.get('Notes', '')
-                )
-                self.transactions.append(trans)
+            # The storage backend reads the file with explicit column types
+            df = normalize_frame(self.storage.read())
+            file_rows = len(df)
+
+            # Files written before transactions had IDs are numbered now and
+            # rewritten with an ID column on the next save
+            numbered = has_ids(df)
+            deleted = self._deletion_log.read() if numbered else np.empty(0, dtype=np.int64)
+            if len(deleted):
+                df = df[~df.index.isin(deleted)]
+            self.df = df
+            # Appended rows are written as ID + COLUMNS, so any other header
+            # (a missing Notes column, a different order) is rewritten first
+            self._mark_saved(appendable=numbered and self.storage.can_append() and
+                             self.storage.columns() == [ID_COLUMN] + COLUMNS)
+            self._file_rows = file_rows
+            self._dead_rows = file_rows - len(df)
+            if len(deleted):
+                # Never hand out an ID that is still in the log
+                self._next_id = max(self._next_id, int(deleted.max()) + 1)
+            self._durable_id = self._next_id - 1
+
+            # No need to write the snapshot again on sync if it still matches the file
+            snapshot = read_snapshot(self.csv_file)
+            if snapshot is not None and snapshot.rows == len(self._df):
+                self._snapshot_state = (self.version, self._file_size)
 
         except FileNotFoundError:
             # Create empty DataFrame if file doesn't exist
-            self.df = pd.DataFrame(columns=[
-                'Date', 'Mode', 'Category', 'Sub Category',
-                'Income/Expense', 'Amount', 'Notes'
-            ])
+            self.df = normalize_frame(pd.DataFrame(columns=COLUMNS))
             # Create sample data for demonstration
             self._create_sample_data()
 
@@ -109,20 +504,336 @@ class FinanceTracker:
             amount (float): Transaction amount
             notes (str): Optional notes
         """
-        # Create new transaction object
+        # Create new transaction object (validates the amount)
         new_trans = Transaction(date, mode, category, sub_category, trans_type, amount, notes)
-        self.transactions.append(new_trans)
 
-        # Update DataFrame - use loc to avoid FutureWarning
-        new_index = len(self.df)
-        trans_dict = new_trans.to_dict()
-        self.df.loc[new_index] = trans_dict
+        # Buffer the row; it is merged into the DataFrame in batches
+        self._buffer_transaction(new_trans)
+        if self._pending_count >= APPEND_BUFFER_SIZE:
+            self._flush_pending()
+
+    def add_transactions(self, transactions):
+        """
+        Add many transactions at once.
+
+        Args:
+            transactions (iterable): Transaction objects, or tuples in the
+                argument order of add_transaction
+
+        Returns:
+            int: Number of transactions added
+        """
+        count = 0
+        for trans in transactions:
+            if not isinstance(trans, Transaction):
+                trans = Transaction(*trans)
+            self._buffer_transaction(trans)
+            count += 1
+            if self._pending_count >= APPEND_BUFFER_SIZE:
+                self._flush_pending()
+
+        self._flush_pending()
+        return count
+
+    def import_csv(self, path, chunksize=IMPORT_CHUNK_ROWS, progress=None):
+        """
+        Stream transactions from an external CSV file (e.g. a bank export).
+
+        The file is read chunksize rows at a time. Each chunk is validated,
+        normalized and appended in bulk, so the file itself never has to fit
+        in memory. If a chunk is invalid the import stops with an error;
+        rows of the earlier chunks stay imported.
+
+        Args:
+            path (str): CSV file with the tracker's columns (Notes is optional)
+            chunksize (int): Number of rows read at a time
+            progress: Optional callable, called after every chunk with
+                (rows imported, bytes read, total bytes)
+
+        Returns:
+            int: Number of transactions imported
+
+        Raises:
+            ValueError: If the file has missing columns or invalid rows
+        """
+        source = CSVStorage(path)
+        total_bytes = source.size()
+        count = 0
+        for chunk, bytes_read in source.read_chunks(chunksize):
+            rows = validate_frame(chunk)
+            self._append_rows(rows)
+            count += len(rows)
+            if progress is not None:
+                progress(count, bytes_read, total_bytes)
+        return count
+
+    def _append_rows(self, rows):
+        """
+        Append a normalized DataFrame of new transactions in bulk.
+
+        Args:
+            rows (pandas.DataFrame): Rows already passed through normalize_frame
+        """
+        self._flush_pending()
+        rows = rows.set_axis(pd.RangeIndex(self._next_id, self._next_id + len(rows), name=ID_COLUMN))
+        self._next_id += len(rows)
+        for trans_type, cents in _type_totals(rows).items():
+            self._totals[trans_type] = self._totals.get(trans_type, 0) + cents
+        self._rollup.merge(Rollup.from_frame(rows))
+        self._append_frame(rows)
+        self._date_index = None
+        if self._search_index is not None:
+            self._search_index.add_rows(rows.index, rows['Sub Category'], rows['Notes'])
+        self._changed()
+
+    def _buffer_transaction(self, trans):
+        """
+        Append one transaction to the columnar buffer of new rows.
+
+        Args:
+            trans (Transaction): Transaction to buffer
+
+        Raises:
+            ValueError: If the date is not a valid YYYY-MM-DD date
+        """
+        # Reject bad dates now rather than when the buffer is merged
+        trans.date = datetime.strptime(trans.date, '%Y-%m-%d').strftime('%Y-%m-%d')
+
+        for col, value in trans.to_dict().items():
+            self._pending[col].append(value)
+        self._pending_count += 1
+        self._next_id += 1
+
+        self._totals[trans.trans_type] = self._totals.get(trans.trans_type, 0) + trans.amount_cents
+        self._rollup.add(trans.get_month(), trans.category, trans.trans_type, trans.amount_cents)
+        self._date_index = None
+        self._changed()
+        if self._search_index is not None:
+            self._search_index.add(self._next_id - 1, trans.sub_category, trans.notes)
+
+    def _pending_frame(self, pending, first_id):
+        """
+        Build a DataFrame from buffered rows, which have consecutive IDs.
+
+        Args:
+            pending (dict): Column -> list of buffered values
+            first_id (int): ID of the first row
+
+        Returns:
+            pandas.DataFrame: Normalized rows indexed by ID
+        """
+        rows = normalize_frame(pd.DataFrame(pending, columns=COLUMNS))
+        return rows.set_axis(pd.RangeIndex(first_id, first_id + len(rows), name=ID_COLUMN))
+
+    def _flush_pending(self):
+        """
+        Merge all buffered rows into the DataFrame with a single concat.
+        """
+        if not self._pending_count:
+            return
+        new_rows = self._pending_frame(self._pending, self._next_id - self._pending_count)
+        self._pending = {col: [] for col in COLUMNS}
+        self._pending_count = 0
+        self._append_frame(new_rows)
+
+    def _drop_deleted(self):
+        """
+        Remove all deleted rows from the DataFrame with a single selection.
+        """
+        keep = np.ones(len(self._df), dtype=bool)
+        keep[list(self._deleted)] = False
+        self._df = self._df[keep]
+        self._deleted = set()
+
+    def _append_frame(self, new_rows):
+        """
+        Append normalized rows to the DataFrame, keeping categorical dtypes.
+
+        Unknown labels are added to the existing categories first so the
+        concatenated columns stay categorical instead of falling back to object.
+        The previous frame is never modified in place, so frames handed out
+        earlier (for example to the GUI thread) stay valid.
+
+        Args:
+            new_rows (pandas.DataFrame): Rows already passed through normalize_frame,
+                indexed by IDs above those of the current rows
+        """
+        base = self._df
+        for col in CATEGORICAL_COLUMNS:
+            unseen = new_rows[col].cat.categories.difference(base[col].cat.categories)
+            if len(unseen):
+                base = base.assign(**{col: base[col].cat.add_categories(unseen)})
+            new_rows[col] = new_rows[col].astype(base[col].dtype)
+
+        if base.empty:
+            self._df = new_rows
+        else:
+            self._df = pd.concat([base, new_rows])
 
     def save_data(self):
         """
-        Save all transactions to the CSV file.
+        Save all transactions to the data file.
+
+        In append-only mode only the rows added since the last save are
+        appended, and the IDs of deleted rows are appended to the deletion
+        log, so the cost does not depend on the size of the ledger.
+        The file is rewritten in full once deleted rows make up more than
+        COMPACT_DEAD_FRACTION of it, when the file changed on disk since it
+        was last written, or when the storage format cannot append (Feather
+        and Parquet).
+        """
+        if (not (self.append_only and self.storage.supports_append and self._can_append()) or
+                self._dead_rows > COMPACT_DEAD_FRACTION * self._file_rows):
+            self.compact()
+            return
+
+        new_rows = self._unsaved_rows()
+        if new_rows.empty and not self._unsaved_deletes and self._next_id - 1 <= self._durable_id:
+            self._mark_saved()
+            return
+
+        # fsync is expensive, so only force the data to disk every few saves
+        self._unsynced_saves += 1
+        sync = self._unsynced_saves >= FSYNC_EVERY
+        if not new_rows.empty:
+            self.storage.append(new_rows.reset_index(), sync=sync)
+            self._file_rows += len(new_rows)
+            self._durable_id = max(self._durable_id, int(new_rows.index[-1]))
+        if self._next_id - 1 > self._durable_id:
+            # The newest IDs went to rows deleted before they were saved; log
+            # the highest so it is not handed out again after a reload
+            self._unsaved_deletes.append(self._next_id - 1)
+            self._durable_id = self._next_id - 1
+        if self._unsaved_deletes:
+            self._deletion_log.append(self._unsaved_deletes, sync=sync)
+            self._unsaved_deletes = []
+            remove_snapshot(self.csv_file)  # Its stamp only covers the data file
+        if sync:
+            self._unsynced_saves = 0
+
+        self._mark_saved()
+
+    def compact(self):
+        """
+        Rewrite the whole data file from the in-memory transactions.
+        The storage backend writes to a temporary file first so a crash never
+        leaves a half-written ledger.
+        """
+        self.storage.write(self.df.reset_index())
+        # The deleted rows are gone from the rewritten file; the log only has to
+        # keep the highest ID handed out if no row has it, so it is never reused
+        last_id = int(self._df.index[-1]) if len(self._df) else -1
+        if self._next_id - 1 > last_id:
+            self._deletion_log.replace([self._next_id - 1])
+        else:
+            self._deletion_log.remove()
+        self._durable_id = self._next_id - 1
+
+        self._unsaved_deletes = []
+        self._file_rows = len(self._df)
+        self._dead_rows = 0
+        self._unsynced_saves = 0
+        self._mark_saved()
+
+    def sync(self):
         """
-        self.df.to_csv(self.csv_file, index=False)
+        Force appended rows that have not been fsynced yet onto disk,
+        then bring the summary snapshot up to date.
+        """
+        if self._unsynced_saves:
+            self.storage.sync()
+            self._deletion_log.sync()
+            self._unsynced_saves = 0
+        self.save_snapshot()
+
+    def snapshot(self):
+        """
+        Summarize the transactions: totals, rollups and the most recent rows.
+
+        Returns:
+            Snapshot: Summary that can be shown before the ledger is loaded
+        """
+        recent = self.get_recent_transactions(RECENT_ROWS)
+        recent_rows = [
+            [date.strftime('%Y-%m-%d'), mode, category, sub_category, trans_type, int(cents), notes]
+            for date, mode, category, sub_category, trans_type, cents, notes in zip(
+                recent['Date'], recent['Mode'], recent['Category'], recent['Sub Category'],
+                recent['Income/Expense'], to_cents(recent['Amount']), recent['Notes'])]
+        return Snapshot(len(self.df), dict(self._totals),
+                        {trans_type: self._rollup.category_totals(trans_type)
+                         for trans_type in TRANSACTION_TYPES},
+                        self._rollup.month_totals(), recent_rows)
+
+    def save_snapshot(self):
+        """
+        Write the summary snapshot next to the data file.
+        Skipped while the file does not hold every transaction, since the
+        snapshot must describe the file, and when nothing changed since the
+        last snapshot. Files that cannot be appended to as they are (e.g.
+        written before transactions had IDs) still get their snapshot.
+
+        Returns:
+            bool: True if the snapshot file was written
+        """
+        if (self._file_size is None or self._saved_id != self._next_id - 1 or
+                self._unsaved_deletes or self.storage.size() != self._file_size):
+            return False
+        if self._snapshot_state == (self.version, self._file_size):
+            return False
+
+        write_snapshot(self.csv_file, self.snapshot())
+        self._snapshot_state = (self.version, self._file_size)
+        return True
+
+    def _unsaved_rows(self):
+        """
+        Collect the rows added since the last save without merging the buffer,
+        so appending never copies the whole DataFrame.
+
+        Returns:
+            pandas.DataFrame: Rows that are not in the file yet
+        """
+        frames = []
+        start = int(self._df.index.searchsorted(self._saved_id, side='right'))
+        if start < len(self._df):
+            rows = self._df.iloc[start:]
+            deleted = [position - start for position in self._deleted if position >= start]
+            if deleted:
+                rows = rows.drop(rows.index[deleted])
+            frames.append(rows)
+
+        first_pending = self._next_id - self._pending_count
+        start = max(self._saved_id + 1 - first_pending, 0)
+        if start < self._pending_count:
+            pending = {col: values[start:] for col, values in self._pending.items()}
+            frames.append(self._pending_frame(pending, first_pending + start))
+
+        if not frames:
+            return self._df.iloc[0:0]
+        return frames[0] if len(frames) == 1 else pd.concat(frames)
+
+    def _can_append(self):
+        """
+        Check whether new rows can be appended to the file as it is on disk.
+
+        Returns:
+            bool: True if the file still matches what this tracker last wrote
+        """
+        if self._saved_size is None:
+            return False
+        return self.storage.size() == self._saved_size
+
+    def _mark_saved(self, appendable=True):
+        """
+        Record that the file now holds every row, including buffered ones.
+
+        Args:
+            appendable (bool): False if the file cannot be appended to as it is
+                (e.g. its last line is unterminated), which forces the next save to rewrite it
+        """
+        self._saved_id = self._next_id - 1
+        self._file_size = self.storage.size()
+        self._saved_size = self._file_size if appendable else None
 
     def get_total_income(self, start_date=None, end_date=None):
         """
@@ -135,44 +846,64 @@ class FinanceTracker:
         Returns:
             float: Total income amount
         """
-        if self.df.empty:
-            return 0.0
+        return self._get_total('Income', start_date, end_date)
 
-        df_filtered = self.df.copy()
+    def get_total_expenses(self, start_date=None, end_date=None):
+        """
+        Calculate total expenses from all transactions or within date range.
 
-        # Apply date filters if provided
-        if start_date:
-            df_filtered = df_filtered[df_filtered['Date'] >= start_date]
-        if end_date:
-            df_filtered = df_filtered[df_filtered['Date'] <= end_date]
+        Args:
+            start_date (str): Optional start date filter
+            end_date (str): Optional end date filter
 
-        income_df = df_filtered[df_filtered['Income/Expense'] == 'Income']
-        return float(income_df['Amount'].sum()) if not income_df.empty else 0.0
+        Returns:
+            float: Total expense amount
+        """
+        return self._get_total('Expense', start_date, end_date)
 
-        def get_total_expenses(self, start_date=None, end_date=None):
+    def _get_total(self, trans_type, start_date=None, end_date=None):
         """
-        Calculate total expenses from all transactions or within date range.
+        Total amount of one transaction type.
+        Unfiltered totals come from the running totals; date-ranged totals
+        come from the prefix sums of the date index. Both are summed in integer cents.
 
         Args:
+            trans_type (str): "Income" or "Expense"
             start_date (str): Optional start date filter
             end_date (str): Optional end date filter
 
         Returns:
-            float: Total expense amount
+            float: Total amount
         """
-        if self.df.empty:
-            return 0.0
+        if not (start_date or end_date):
+            return self._totals.get(trans_type, 0) / 100
+        return self._get_date_index().total(trans_type, start_date, end_date)
 
-        df_filtered = self.df.copy()
+    def _get_date_index(self):
+        """
+        Get the date index, rebuilding it if transactions changed since it was built.
 
-        # Apply date filters if provided
-        if start_date:
-            df_filtered = df_filtered[df_filtered['Date'] >= start_date]
-        if end_date:
-            df_filtered = df_filtered[df_filtered['Date'] <= end_date]
+        Returns:
+            DateIndex: Index over the current transactions
+        """
+        if self._date_index is None:
+            self._date_index = DateIndex(self.df)
+        return self._date_index
+
+    def _filter_dates(self, start_date=None, end_date=None):
+        """
+        Select the transactions inside a date range using the date index.
+
+        Args:
+            start_date (str): Optional start date (inclusive)
+            end_date (str): Optional end date (inclusive)
 
-        expense_df = df_filtered[df_filtered['Income/Expense'] == 'Expense']
-        return float(expense_df['Amount'].sum()) if not expense_df.empty else 0.0
+        Returns:
+            pandas.DataFrame: Matching transactions in file order
+        """
+        if not (start_date or end_date):
+            return self.df
+        return self.df.iloc[self._get_date_index().positions(start_date, end_date)]
 
     def get_balance(self):
         """
@@ -181,7 +912,7 @@ class FinanceTracker:
         Returns:
             float: Current balance
         """
-        return self.get_total_income() - self.get_total_expenses()
+        return (self._totals.get('Income', 0) - self._totals.get('Expense', 0)) / 100
 
     def get_expense_by_category(self, start_date=None, end_date=None):
         """
@@ -194,49 +925,52 @@ class FinanceTracker:
         Returns:
             dict: Dictionary with categories as keys and total amounts as values
         """
+        # Unfiltered totals come straight from the rollup
+        if not (start_date or end_date):
+            return _to_dollars(self._rollup.category_totals('Expense'))
+
         if self.df.empty:
             return {}
 
-        df_filtered = self.df.copy()
-
-        # Apply date filters if provided
-        if start_date:
-            df_filtered = df_filtered[df_filtered['Date'] >= start_date]
-        if end_date:
-            df_filtered = df_filtered[df_filtered['Date'] <= end_date]
-
-        expense_df = df_filtered[df_filtered['Income/Expense'] == 'Expense']
-        if expense_df.empty:
+        # Gather only the three needed columns, and only for the rows in the date range
+        positions = self._get_date_index().positions(start_date, end_date)
+        types = self.df['Income/Expense'].array.take(positions)
+        positions = positions[types == 'Expense']
+        if len(positions) == 0:
             return {}
 
-        # Use pandas groupby to sum amounts by category
-        category_totals = expense_df.groupby('Category')['Amount'].sum()
-        return category_totals.to_dict()
+        # Use pandas groupby to sum amounts by category, in integer cents
+        cents = pd.Series(to_cents(self.df['Amount'].to_numpy()[positions]))
+        category_totals = cents.groupby(self.df['Category'].array.take(positions), observed=True).sum()
+        return {category: int(total) / 100 for category, total in category_totals.items()}
 
-    def get_monthly_summary(self):
+    def get_monthly_summary(self, as_frame=False):
         """
         Get income and expense summary by month.
+        Read from the per-month rollup instead of scanning the transactions.
+
+        Args:
+            as_frame (bool): If True, return a DataFrame instead of a dict
 
         Returns:
-            dict: Dictionary with month as key and {income, expense, balance} as value
+            dict: Dictionary with month as key and {income, expense, balance} as value,
+                in chronological order. With as_frame=True, a DataFrame indexed by
+                month with income, expense and balance columns.
         """
-        if self.df.empty:
-            return {}
-
-        df_copy = self.df.copy()
-        df_copy['Month'] = pd.to_datetime(df_copy['Date']).dt.to_period('M')
-
         summary = {}
-        for month in df_copy['Month'].unique():
-            month_data = df_copy[df_copy['Month'] == month]
-            income = float(month_data[month_data['Income/Expense'] == 'Income']['Amount'].sum())
-            expense = float(month_data[month_data['Income/Expense'] == 'Expense']['Amount'].sum())
-            summary[str(month)] = {
-                'income': income,
-                'expense': expense,
-                'balance': income - expense
+        for month, totals in self._rollup.month_totals().items():
+            income = totals.get('Income', 0)
+            expense = totals.get('Expense', 0)
+            summary[month] = {
+                'income': income / 100,
+                'expense': expense / 100,
+                'balance': (income - expense) / 100
             }
 
+        if as_frame:
+            frame = pd.DataFrame.from_dict(summary, orient='index',
+                                           columns=['income', 'expense', 'balance'])
+            return frame.astype('float64').rename_axis('Month')
         return summary
 
     def get_recent_transactions(self, n=10):
@@ -267,11 +1001,8 @@ class FinanceTracker:
         if self.df.empty:
             return self.df
 
-        filtered_df = self.df[
-            (self.df['Date'] >= start_date) &
-            (self.df['Date'] <= end_date)
-            ]
-        return filtered_df
+        # Binary search on the sorted date index instead of scanning every row
+        return self._filter_dates(start_date, end_date)
 
     def filter_by_category(self, category):
         """
@@ -303,12 +1034,15 @@ class FinanceTracker:
 
         return self.df[self.df['Income/Expense'] == trans_type]
 
-    def search_transactions(self, keyword):
+    def search_transactions(self, keyword, rank=False):
         """
         Search transactions by keyword in subcategory or notes.
+        Several space-separated terms must all match. Uses the keyword index,
+        which is built on the first search and kept up to date afterwards.
 
         Args:
-            keyword (str): Keyword to search for
+            keyword (str): Keyword(s) to search for
+            rank (bool): If True, order results by number of term matches
 
         Returns:
             pandas.DataFrame: Matching transactions
@@ -316,23 +1050,26 @@ class FinanceTracker:
         if self.df.empty:
             return self.df
 
-        keyword_lower = keyword.lower()
-        mask = (
-                self.df['Sub Category'].str.lower().str.contains(keyword_lower, na=False) |
-                self.df['Notes'].str.lower().str.contains(keyword_lower, na=False)
-        )
-        return self.df[mask]
+        df = self.df
+        if self._search_index is None:
+            self._search_index = SearchIndex(df.index, df['Sub Category'], df['Notes'])
+        # Every ID the index returns is a row of the frame, whose index is sorted
+        return df.iloc[df.index.searchsorted(self._search_index.search(keyword, rank))]
 
-        def set_budget(self, category, amount):
+    def set_budget(self, category, amount, period='total'):
         """
         Set a budget limit for a category.
 
         Args:
             category (str): Category name
             amount (float): Budget amount
+            period (str): 'total', 'monthly' or 'weekly'
         """
+        if period not in BUDGET_PERIODS:
+            raise ValueError(f"Unknown budget period: {period}")
         self.budgets[category] = float(amount)
-    
+        self.budget_periods[category] = period
+
     def get_budget(self, category):
         """
         Get budget for a category.
@@ -345,12 +1082,13 @@ class FinanceTracker:
         """
         return self.budgets.get(category)
 
-    def check_budget_status(self, category):
+    def check_budget_status(self, category, as_of=None):
         """
         Check if spending is within budget for a category.
 
         Args:
             category (str): Category name
+            as_of (str): Date that defines the current month/week (default: today)
 
         Returns:
             dict: Status with spent amount, budget, remaining, and percentage
@@ -358,8 +1096,66 @@ class FinanceTracker:
         if category not in self.budgets:
             return None
 
+        period = self.budget_periods.get(category, 'total')
+        spent = self._get_period_spending(period, as_of).get(category, 0.0)
+        return self._budget_status(category, spent)
+
+    def check_all_budgets(self, as_of=None):
+        """
+        Check every budget at once.
+        Spending per category is looked up once per budget period, no matter
+        how many budgets there are.
+
+        Args:
+            as_of (str): Date that defines the current month/week (default: today)
+
+        Returns:
+            dict: Category -> status dict (see check_budget_status)
+        """
+        spending = {}
+        statuses = {}
+        for category in self.budgets:
+            period = self.budget_periods.get(category, 'total')
+            if period not in spending:
+                spending[period] = self._get_period_spending(period, as_of)
+            statuses[category] = self._budget_status(category, spending[period].get(category, 0.0))
+        return statuses
+
+    def _get_period_spending(self, period, as_of=None):
+        """
+        Expenses per category for a budget period.
+        All-time and monthly totals come from the rollup; weekly totals from
+        one grouped pass over the week's rows in the date index.
+
+        Args:
+            period (str): 'total', 'monthly' or 'weekly'
+            as_of (str): Date that defines the current month/week (default: today)
+
+        Returns:
+            dict: Category -> amount spent in the period
+        """
+        today = pd.Timestamp(as_of) if as_of else pd.Timestamp(datetime.now().date())
+        if period == 'monthly':
+            month = today.strftime('%Y-%m')
+            return _to_dollars(self._rollup.category_totals('Expense', month=month))
+        if period == 'weekly':
+            week_start = today - timedelta(days=today.weekday())
+            return self.get_expense_by_category(week_start.strftime('%Y-%m-%d'),
+                                                today.strftime('%Y-%m-%d'))
+        return _to_dollars(self._rollup.category_totals('Expense'))
+
+    def _budget_status(self, category, spent):
+        """
+        Build the status dictionary for one budget.
+
+        Args:
+            category (str): Category name
+            spent (float): Amount spent in the budget's period
+
+        Returns:
+            dict: Status with spent amount, budget, remaining, and percentage
+        """
         budget = self.budgets[category]
-        spent = self.get_expense_by_category().get(category, 0.0)
         remaining = budget - spent
         percentage = (spent / budget * 100) if budget > 0 else 0
 
@@ -368,7 +1164,8 @@ class FinanceTracker:
             'spent': spent,
             'remaining': remaining,
             'percentage': percentage,
-            'over_budget': spent > budget
+            'over_budget': spent > budget,
+            'period': self.budget_periods.get(category, 'total')
         }
 
     def get_spending_trend(self, category=None, days=30):
@@ -382,9 +1179,6 @@ class FinanceTracker:
         Returns:
             pandas.DataFrame: Daily spending data
         """
-        if self.df.empty:
-            return pd.DataFrame()
-
         # Get date range
         end_date = datetime.now().strftime('%Y-%m-%d')
         start_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
@@ -402,14 +1196,14 @@ class FinanceTracker:
         if df_filtered.empty:
             return pd.DataFrame()
 
-        # Group by date and sum amounts
-        df_filtered['Date'] = pd.to_datetime(df_filtered['Date'])
-        trend = df_filtered.groupby('Date')['Amount'].sum().reset_index()
+        # Group by date and sum amounts in cents (dates are already datetime64)
+        cents = pd.Series(to_cents(df_filtered['Amount']), index=df_filtered.index)
+        trend = (cents.groupby(df_filtered['Date']).sum() / 100).reset_index()
         trend.columns = ['Date', 'Amount']
 
         return trend
 
-        def export_to_csv(self, filename, start_date=None, end_date=None):
+    def export_to_csv(self, filename, start_date=None, end_date=None):
         """
         Export transactions to a CSV file.
 
@@ -418,27 +1212,127 @@ class FinanceTracker:
             start_date (str): Optional start date filter
             end_date (str): Optional end date filter
         """
-        df_export = self.df.copy()
+        self.export(filename, start_date, end_date)
 
-        if start_date:
-            df_export = df_export[df_export['Date'] >= start_date]
-        if end_date:
-            df_export = df_export[df_export['Date'] <= end_date]
+    def export(self, filename, start_date=None, end_date=None, category=None, trans_type=None,
+               chunksize=EXPORT_CHUNK_ROWS, progress=None):
+        """
+        Export the matching transactions, writing chunksize rows at a time.
+
+        The extension of the file picks the format: .csv, .csv.gz (gzip-compressed
+        CSV), .parquet or .jsonl (JSON Lines). The file is only replaced once the
+        export has finished, so a failed export leaves no partial file behind.
+
+        Args:
+            filename (str): Output filename
+            start_date (str): Optional start date filter
+            end_date (str): Optional end date filter
+            category (str): Optional category filter
+            trans_type (str): Optional "Income" or "Expense" filter
+            chunksize (int): Number of rows written at a time
+            progress: Optional callable, called after every chunk with
+                (rows written, total rows)
 
-        df_export.to_csv(filename, index=False)
+        Returns:
+            int: Number of transactions exported
+        """
+        total, chunks = self._export_chunks(chunksize, start_date, end_date, category, trans_type)
+        with get_exporter(filename) as exporter:
+            for chunk in chunks:
+                exporter.write(chunk)
+                if progress is not None:
+                    progress(exporter.rows, total)
+        return exporter.rows
+
+    def _export_chunks(self, chunksize, start_date=None, end_date=None, category=None,
+                       trans_type=None):
+        """
+        Select the transactions to export, using the date index for the date range
+        and the category codes for the other filters.
+
+        Returns:
+            tuple: (number of rows, iterator of DataFrames with at most chunksize rows)
+        """
+        df = self.df
+        if not (start_date or end_date or category or trans_type):
+            return len(df), (df.iloc[start:start + chunksize]
+                             for start in range(0, len(df), chunksize))
+
+        if start_date or end_date:
+            positions = self._get_date_index().positions(start_date, end_date)
+        else:
+            positions = np.arange(len(df))
+        for col, label in (('Category', category), ('Income/Expense', trans_type)):
+            if label:
+                positions = positions[df[col].array.take(positions) == label]
+        return len(positions), (df.iloc[positions[start:start + chunksize]]
+                                for start in range(0, len(positions), chunksize))
 
     def delete_transaction(self, index):
         """
-        Delete a transaction by index.
+        Delete a transaction by its position in the transaction list and save.
 
         Args:
             index (int): Index of transaction to delete
         """
-        if 0 <= index < len(self.transactions):
-            del self.transactions[index]
-            self.df = self.df.drop(index).reset_index(drop=True)
+        listed = len(self._df) - len(self._deleted)
+        if not 0 <= index < listed + self._pending_count:
+            return
+        if index >= listed:
+            self._flush_pending()
+
+        # Skip rows already marked deleted without dropping them from the DataFrame:
+        # deleted[k] - k listed rows come before the k-th deleted position
+        deleted = np.sort(np.fromiter(self._deleted, dtype=np.int64, count=len(self._deleted)))
+        position = index + int(np.searchsorted(deleted - np.arange(len(deleted)), index, 'right'))
+        self.delete_transactions([self._df.index[position]])
+        self.save_data()
+
+    def delete_transactions(self, ids):
+        """
+        Delete transactions by ID.
+
+        Running totals and the rollup are updated at once, but the rows are
+        only marked: they leave the DataFrame together the next time it is
+        read, and leave the file through the deletion log on the next save
+        (see save_data), so deleting never rewrites the ledger by itself.
 
-            self.save_data()
+        Args:
+            ids (iterable): IDs of the transactions to delete (the DataFrame index);
+                unknown and already deleted IDs are ignored
+
+        Returns:
+            int: Number of transactions deleted
+        """
+        ids = np.unique(np.asarray(list(ids), dtype=np.int64))
+        if len(ids) and ids[-1] >= self._next_id - self._pending_count:
+            self._flush_pending()  # Some are still buffered
+
+        index = self._df.index
+        positions = index.searchsorted(ids)
+        found = positions < len(index)
+        found[found] = index[positions[found]] == ids[found]
+        positions = [position for position in positions[found].tolist()
+                     if position not in self._deleted]
+        if not positions:
+            return 0
+
+        rows = self._df[['Date', 'Category', 'Income/Expense', 'Amount']].iloc[positions]
+        for month, category, trans_type, cents in zip(
+                rows['Date'].dt.strftime('%Y-%m').tolist(), rows['Category'].tolist(),
+                rows['Income/Expense'].tolist(), to_cents(rows['Amount']).tolist()):
+            self._totals[trans_type] -= cents
+            self._rollup.remove(month, category, trans_type, cents)
+
+        self._deleted.update(positions)
+        saved = rows.index[rows.index <= self._saved_id]
+        self._unsaved_deletes.extend(saved.tolist())
+        self._dead_rows += len(saved)
+        self._date_index = None
+        if self._search_index is not None:
+            self._search_index.remove(rows.index)
+        self._changed()
+        return len(positions)
 
 
 
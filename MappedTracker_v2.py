@@ -0,0 +1,1103 @@
+# MappedTracker_v2.py
+# Authors: Group 3 - Vanshika Kukreja, Miloni Mehta
+# Date: October 17, 2026
+# Description: Out-of-core FinanceTracker over memory-mapped column files.
+# Run as a script to import a ledger: python MappedTracker_v2.py transactions.csv transactions.cols
+
+import argparse
+import json
+import os
+import re
+import shutil
+import numpy as np
+import pandas as pd
+from datetime import datetime, timedelta
+from Transaction_v2 import Transaction
+from FinanceTracker_v2 import (COMPACT_DEAD_FRACTION, FinanceTracker, TransactionView,
+                               _transaction_from_values)
+from Storage_v2 import (COLUMNS, ID_COLUMN, TombstoneLog, has_ids, normalize_frame, read_ledger,
+                        to_cents)
+
+
+# Rows mapped at a time by aggregations; bounds resident memory for any ledger size
+CHUNK_ROWS = 1000000
+
+# File and dtype of every fixed-width column. IDs are the transaction IDs (increasing),
+# dates are days since 1970-01-01, amounts are integer cents, labels are codes
+# into the dictionaries, and Notes holds the end offset of each row's text in the notes blob.
+COLUMN_FILES = {
+    ID_COLUMN: ('id.bin', 'int64'),
+    'Date': ('date.bin', 'int32'),
+    'Mode': ('mode.bin', 'int16'),
+    'Category': ('category.bin', 'int16'),
+    'Sub Category': ('sub_category.bin', 'int32'),
+    'Income/Expense': ('type.bin', 'int8'),
+    'Amount': ('amount_cents.bin', 'int64'),
+    'Notes': ('notes_end.bin', 'int64'),
+}
+
+# Dictionary-encoded columns
+CODE_COLUMNS = ['Mode', 'Category', 'Sub Category', 'Income/Expense']
+
+NOTES_BLOB = 'notes.bin'
+DICTIONARY_FILE = 'dictionaries.json'
+
+# IDs of deleted rows not yet compacted out of the column files
+DELETION_LOG = 'deleted.bin'
+
+# Amount column of stores written before amounts became integer cents (float64 dollars)
+LEGACY_AMOUNT_FILE = 'amount.bin'
+
+# Low bits summed separately by _sum_cents so float64 bincount sums stay exact
+_LOW_BITS = 20
+
+
+def _to_days(date):
+    """
+    Convert a date string to days since 1970-01-01.
+    """
+    return int(pd.Timestamp(date).to_datetime64().astype('datetime64[D]').astype(np.int64))
+
+
+def _sum_cents(codes, cents, minlength):
+    """
+    Exact integer sums of cents per code.
+
+    np.bincount only sums float64 weights, which is exact below 2**53. Splitting
+    every amount into high and low bits keeps each partial sum far below that.
+
+    Args:
+        codes (numpy.ndarray): Non-negative group codes
+        cents (numpy.ndarray): int64 amounts in cents
+        minlength (int): Minimum number of groups
+
+    Returns:
+        numpy.ndarray: int64 sum per code
+    """
+    cents = np.asarray(cents, dtype=np.int64)
+    high = np.bincount(codes, weights=cents >> _LOW_BITS, minlength=minlength)
+    low = np.bincount(codes, weights=cents & ((1 << _LOW_BITS) - 1), minlength=minlength)
+    return (high.astype(np.int64) << _LOW_BITS) + low.astype(np.int64)
+
+
+class ColumnStore:
+    """
+    A ledger stored column by column in raw little-endian files (like headerless .npy files).
+
+    Columns are memory-mapped on demand, a range of rows at a time, so they are
+    read straight from the page cache without copies and never have to fit in
+    memory. New rows are appended to the end of each file.
+
+    Deleted rows stay in the files as tombstones: their IDs go to a deletion
+    log and they are skipped by every read until compact() rewrites the store.
+    """
+
+    def __init__(self, directory):
+        """
+        Open (or create) a column store.
+
+        Args:
+            directory (str): Directory holding the column files
+        """
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self._open()
+
+    def _path(self, name):
+        """
+        Path of a file inside the store.
+        """
+        return os.path.join(self.directory, name)
+
+    def _open(self):
+        """
+        Read the dictionaries, row count and deleted rows, dropping rows a
+        crash left half-written.
+        """
+        self.dictionaries = {col: [] for col in CODE_COLUMNS}
+        if os.path.exists(self._path(DICTIONARY_FILE)):
+            with open(self._path(DICTIONARY_FILE)) as file:
+                self.dictionaries.update(json.load(file))
+        self._codes = {col: {label: code for code, label in enumerate(labels)}
+                       for col, labels in self.dictionaries.items()}
+        if os.path.exists(self._path(LEGACY_AMOUNT_FILE)):
+            self._convert_legacy_amounts()
+        if not os.path.exists(self._path(COLUMN_FILES[ID_COLUMN][0])):
+            self._number_rows()
+
+        # A row exists once it is in every column file
+        sizes = []
+        for name, dtype in COLUMN_FILES.values():
+            with open(self._path(name), 'ab') as file:
+                sizes.append(file.tell() // np.dtype(dtype).itemsize)
+        self.count = min(sizes)
+        for name, dtype in COLUMN_FILES.values():
+            os.truncate(self._path(name), self.count * np.dtype(dtype).itemsize)
+        with open(self._path(NOTES_BLOB), 'ab'):
+            pass
+        os.truncate(self._path(NOTES_BLOB), self._notes_end())
+
+        ids = self.mapped(ID_COLUMN)
+        self.deletion_log = TombstoneLog(self._path(DELETION_LOG))
+        logged = self.deletion_log.read()
+        self.dead = np.unique(self._find(logged))  # Sorted positions of deleted rows
+        self.next_id = max(int(ids[-1]) + 1 if self.count else 0,
+                           int(logged.max()) + 1 if len(logged) else 0)
+
+    def _number_rows(self):
+        """
+        Write IDs 0, 1, 2, ... for a store written before rows had IDs.
+        """
+        rows = min(os.path.getsize(self._path(name)) // np.dtype(dtype).itemsize
+                   if os.path.exists(self._path(name)) else 0
+                   for col, (name, dtype) in COLUMN_FILES.items() if col != ID_COLUMN)
+        temp_file = self._path(COLUMN_FILES[ID_COLUMN][0] + '.tmp')
+        with open(temp_file, 'wb') as file:
+            for start in range(0, rows, CHUNK_ROWS):
+                file.write(np.arange(start, min(start + CHUNK_ROWS, rows), dtype=np.int64).tobytes())
+        os.replace(temp_file, self._path(COLUMN_FILES[ID_COLUMN][0]))
+
+    def _find(self, ids):
+        """
+        Positions of the rows with some IDs (binary search in the ID column).
+
+        Args:
+            ids (numpy.ndarray): Transaction IDs
+
+        Returns:
+            numpy.ndarray: Positions of the IDs that exist, in the order of ids
+        """
+        column = self.mapped(ID_COLUMN)
+        positions = np.searchsorted(column, ids)
+        found = positions < self.count
+        found[found] = column[positions[found]] == ids[found]
+        return positions[found]
+
+    def _convert_legacy_amounts(self):
+        """
+        Rewrite a float64 dollar amount file as integer cents, a chunk at a time.
+        """
+        legacy = self._path(LEGACY_AMOUNT_FILE)
+        temp_file = self._path(COLUMN_FILES['Amount'][0] + '.tmp')
+        rows = os.path.getsize(legacy) // 8
+        with open(temp_file, 'wb') as file:
+            for start in range(0, rows, CHUNK_ROWS):
+                stop = min(start + CHUNK_ROWS, rows)
+                dollars = np.memmap(legacy, dtype=np.float64, mode='r',
+                                    offset=start * 8, shape=(stop - start,))
+                file.write(to_cents(dollars).tobytes())
+                del dollars
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_file, self._path(COLUMN_FILES['Amount'][0]))
+        os.remove(legacy)
+
+    def __len__(self):
+        """
+        Returns:
+            int: Number of rows in the store, not counting deleted ones
+        """
+        return self.count - len(self.dead)
+
+    def live(self, start, stop):
+        """
+        Mask of the rows start..stop-1 that are not deleted.
+
+        Returns:
+            numpy.ndarray: Boolean mask, or None if none of the rows is deleted
+        """
+        low, high = np.searchsorted(self.dead, [start, stop])
+        if low == high:
+            return None
+        mask = np.ones(stop - start, dtype=bool)
+        mask[self.dead[low:high] - start] = False
+        return mask
+
+    def positions(self, indices):
+        """
+        Convert indices among the rows that are not deleted into file positions.
+
+        Args:
+            indices (array-like): Indices from 0 to len(self) - 1
+
+        Returns:
+            numpy.ndarray: Row positions in the column files
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        if not len(self.dead):
+            return indices
+        # dead[k] - k live rows come before the k-th deleted row
+        return indices + np.searchsorted(self.dead - np.arange(len(self.dead)), indices, 'right')
+
+    def mapped(self, col, start=0, stop=None):
+        """
+        Memory-map a range of rows of one column.
+
+        Args:
+            col (str): Column name
+            start (int): First row
+            stop (int): Row after the last one (default: end of the store)
+
+        Returns:
+            numpy.ndarray: Read-only view of the rows
+        """
+        name, dtype = COLUMN_FILES[col]
+        dtype = np.dtype(dtype)
+        stop = self.count if stop is None else stop
+        if stop <= start:
+            return np.empty(0, dtype=dtype)
+        return np.memmap(self._path(name), dtype=dtype, mode='r',
+                         offset=start * dtype.itemsize, shape=(stop - start,))
+
+    def chunks(self, columns, chunk_rows=None):
+        """
+        Iterate over the store a block of rows at a time.
+
+        Args:
+            columns (list): Columns to map
+            chunk_rows (int): Rows per block (default: CHUNK_ROWS)
+
+        Yields:
+            tuple: (first row of the block, dict of column name -> mapped array)
+        """
+        chunk_rows = chunk_rows or CHUNK_ROWS
+        for start in range(0, self.count, chunk_rows):
+            stop = min(start + chunk_rows, self.count)
+            yield start, {col: self.mapped(col, start, stop) for col in columns}
+
+    def code(self, col, label):
+        """
+        Get the code of a label, or None if no row uses it.
+        """
+        return self._codes[col].get(label)
+
+    def _encode(self, col, values):
+        """
+        Dictionary-encode a column, adding new labels to its dictionary.
+        """
+        codes, uniques = pd.factorize(values.astype(str))
+        lookup = []
+        for label in uniques:
+            if label not in self._codes[col]:
+                self._codes[col][label] = len(self.dictionaries[col])
+                self.dictionaries[col].append(label)
+            lookup.append(self._codes[col][label])
+        dtype = COLUMN_FILES[col][1]
+        if len(codes) == 0:
+            return np.empty(0, dtype=dtype)
+        return np.asarray(lookup, dtype=dtype)[codes]
+
+    def _notes_end(self):
+        """
+        Size of the used part of the notes blob.
+        """
+        if self.count == 0:
+            return 0
+        return int(self.mapped('Notes', self.count - 1)[0])
+
+    def _notes(self, starts, ends):
+        """
+        Decode notes from byte ranges of the notes blob.
+        """
+        if len(ends) == 0 or ends.max() == 0:
+            return [''] * len(ends)
+        blob = np.memmap(self._path(NOTES_BLOB), dtype=np.uint8, mode='r')
+        low, high = int(starts.min()), int(ends.max())
+        data = blob[low:high].tobytes()
+        return [data[start - low:end - low].decode('utf-8')
+                for start, end in zip(starts.tolist(), ends.tolist())]
+
+    def notes(self, start, stop):
+        """
+        Notes of the rows start..stop-1.
+
+        Returns:
+            list: Note strings
+        """
+        ends = np.asarray(self.mapped('Notes', start, stop))
+        starts = np.concatenate(([self.mapped('Notes', start - 1, start)[0] if start else 0],
+                                 ends[:-1])).astype(np.int64)
+        return self._notes(starts, ends)
+
+    def take(self, positions):
+        """
+        Decode the rows at some positions into a DataFrame.
+
+        Args:
+            positions (array-like): Row positions
+
+        Returns:
+            pandas.DataFrame: Rows in the tracker's schema, indexed by ID
+        """
+        positions = np.asarray(positions, dtype=np.int64)
+        ids = pd.Index(np.asarray(self.mapped(ID_COLUMN)[positions]), name=ID_COLUMN)
+        data = {}
+        for col in COLUMNS:
+            values = np.asarray(self.mapped(col)[positions])
+            if col == 'Date':
+                data[col] = values.astype('datetime64[D]').astype('datetime64[ns]')
+            elif col == 'Amount':
+                data[col] = values / 100
+            elif col == 'Notes':
+                ends = self.mapped('Notes')
+                starts = np.where(positions > 0, ends[np.maximum(positions - 1, 0)], 0)
+                data[col] = self._notes(np.asarray(starts, dtype=np.int64), values)
+            else:
+                data[col] = pd.Categorical.from_codes(values, categories=self.dictionaries[col])
+        return normalize_frame(pd.DataFrame(data, columns=COLUMNS, index=ids))
+
+    def append(self, df, ids=None):
+        """
+        Append rows to the end of every column file.
+
+        Args:
+            df (pandas.DataFrame): Rows already passed through normalize_frame
+            ids (array-like): Increasing IDs above every ID in the store
+                (default: the next unused IDs)
+        """
+        if df.empty:
+            return
+        if ids is None:
+            ids = np.arange(self.next_id, self.next_id + len(df))
+        encoded = {
+            ID_COLUMN: np.asarray(ids, dtype=np.int64),
+            'Date': df['Date'].to_numpy(dtype='datetime64[ns]').astype('datetime64[D]')
+                              .astype(np.int32),
+            'Amount': to_cents(df['Amount']),
+        }
+        for col in CODE_COLUMNS:
+            encoded[col] = self._encode(col, df[col])
+
+        notes = [note.encode('utf-8') for note in df['Notes'].tolist()]
+        lengths = np.fromiter((len(note) for note in notes), dtype=np.int64, count=len(notes))
+        encoded['Notes'] = self._notes_end() + np.cumsum(lengths)
+
+        # Labels must be saved before any code that refers to them
+        self._save_dictionaries()
+        with open(self._path(NOTES_BLOB), 'ab') as file:
+            file.write(b''.join(notes))
+        for col, (name, dtype) in COLUMN_FILES.items():
+            with open(self._path(name), 'ab') as file:
+                file.write(encoded[col].astype(dtype).tobytes())
+        self.count += len(df)
+        self.next_id = int(encoded[ID_COLUMN][-1]) + 1
+
+    def _save_dictionaries(self):
+        """
+        Write the label dictionaries atomically.
+        """
+        temp_file = self._path(DICTIONARY_FILE + '.tmp')
+        with open(temp_file, 'w') as file:
+            json.dump(self.dictionaries, file)
+        os.replace(temp_file, self._path(DICTIONARY_FILE))
+
+    def write(self, df):
+        """
+        Replace the whole store with new rows. Rows keep their IDs if the
+        frame is indexed by them and are numbered from 0 otherwise.
+
+        Args:
+            df (pandas.DataFrame): Rows already passed through normalize_frame
+        """
+        temp = ColumnStore(self._fresh_temp())
+        temp.append(df, df.index if has_ids(df) else None)
+        self._swap(temp.directory)
+
+    def tombstone(self, ids):
+        """
+        Mark rows deleted by appending their IDs to the deletion log.
+        The column files are not touched.
+
+        Args:
+            ids (array-like): IDs of the rows to delete
+
+        Returns:
+            int: Number of rows deleted (unknown and already deleted IDs are skipped)
+        """
+        ids = np.unique(np.asarray(ids, dtype=np.int64))
+        positions = np.setdiff1d(self._find(ids), self.dead)
+        if len(positions):
+            self.deletion_log.append(np.asarray(self.mapped(ID_COLUMN)[positions]))
+            self.dead = np.union1d(self.dead, positions)
+        return len(positions)
+
+    def compact(self):
+        """
+        Rewrite the store without its deleted rows and drop the deletion log
+        (keeping only the highest ID handed out, if no row has it any more).
+        """
+        if len(self.dead):
+            self.delete([])
+
+    def delete(self, positions):
+        """
+        Remove rows, copying the others into a new store a chunk at a time.
+        Rows already marked deleted are removed too, and the deletion log with
+        them; if the highest ID handed out goes, the new log keeps just that ID
+        so it is never handed out again.
+
+        Args:
+            positions (array-like): Row positions to remove
+        """
+        positions = np.union1d(np.asarray(positions, dtype=np.int64), self.dead)
+        directory = self._fresh_temp()
+        if os.path.exists(self._path(DICTIONARY_FILE)):
+            shutil.copy(self._path(DICTIONARY_FILE), os.path.join(directory, DICTIONARY_FILE))
+
+        files = {col: open(os.path.join(directory, name), 'wb')
+                 for col, (name, _) in COLUMN_FILES.items()}
+        blob_out = open(os.path.join(directory, NOTES_BLOB), 'wb')
+        blob = np.memmap(self._path(NOTES_BLOB), dtype=np.uint8, mode='r') if self._notes_end() else None
+        written = 0
+        try:
+            for start, chunk in self.chunks(list(COLUMN_FILES)):
+                stop = start + len(chunk['Date'])
+                keep = ~np.isin(np.arange(start, stop), positions)
+                for col, file in files.items():
+                    if col != 'Notes':
+                        file.write(np.asarray(chunk[col])[keep].tobytes())
+
+                ends = np.asarray(chunk['Notes'])
+                first = int(self.mapped('Notes', start - 1, start)[0]) if start else 0
+                lengths = np.diff(np.concatenate(([first], ends)))
+                if blob is not None:
+                    blob_out.write(blob[first:int(ends[-1])][np.repeat(keep, lengths)].tobytes())
+                kept_ends = written + np.cumsum(lengths[keep])
+                files['Notes'].write(kept_ends.astype(np.int64).tobytes())
+                if len(kept_ends):
+                    written = int(kept_ends[-1])
+        finally:
+            for file in files.values():
+                file.close()
+            blob_out.close()
+            del blob
+
+        last = self.count - 1
+        for position in positions[::-1]:
+            if position != last:
+                break
+            last -= 1
+        last_id = int(self.mapped(ID_COLUMN, last, last + 1)[0]) if last >= 0 else -1
+        if self.next_id - 1 > last_id:
+            TombstoneLog(os.path.join(directory, DELETION_LOG)).replace([self.next_id - 1])
+        self._swap(directory)
+
+    def _fresh_temp(self):
+        """
+        Create an empty directory next to the store for a rewrite.
+        """
+        directory = self.directory.rstrip(os.sep) + '.tmp'
+        shutil.rmtree(directory, ignore_errors=True)
+        os.makedirs(directory)
+        return directory
+
+    def _swap(self, directory):
+        """
+        Replace the store's files with a rewritten copy and reopen it.
+        """
+        old = self.directory.rstrip(os.sep) + '.old'
+        shutil.rmtree(old, ignore_errors=True)
+        os.replace(self.directory, old)
+        os.replace(directory, self.directory)
+        shutil.rmtree(old)
+        self._open()
+
+    def sync(self):
+        """
+        Force every column file and the deletion log onto disk.
+        """
+        for name in [name for name, _ in COLUMN_FILES.values()] + [NOTES_BLOB]:
+            with open(self._path(name), 'ab') as file:
+                os.fsync(file.fileno())
+        self.deletion_log.sync()
+
+
+class MappedTransactionView(TransactionView):
+    """
+    Lazy sequence of Transaction objects decoded from the column files on demand.
+    """
+
+    def __len__(self):
+        """
+        Returns:
+            int: Number of transactions in the store
+        """
+        return len(self._tracker._store())
+
+    def __getitem__(self, index):
+        """
+        Get one transaction (or a list of transactions for a slice).
+
+        Args:
+            index (int or slice): Position of the transaction(s)
+
+        Returns:
+            Transaction or list: The requested transaction(s)
+        """
+        count = len(self)
+        store = self._tracker.store
+        if isinstance(index, slice):
+            rows = store.take(store.positions(np.arange(*index.indices(count))))
+            return [_transaction_from_values(values)
+                    for values in rows.itertuples(index=False, name=None)]
+
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError("transaction index out of range")
+        return _transaction_from_values(tuple(store.take(store.positions([index])).iloc[0]))
+
+    def __iter__(self):
+        """
+        Iterate over all transactions, decoding BATCH_SIZE rows at a time.
+
+        Yields:
+            Transaction: Each transaction in file order
+        """
+        count = len(self)
+        store = self._tracker.store
+        for start in range(0, count, self.BATCH_SIZE):
+            rows = store.take(store.positions(np.arange(start, min(start + self.BATCH_SIZE, count))))
+            for values in rows.itertuples(index=False, name=None):
+                yield _transaction_from_values(values)
+
+
+class MappedFinanceTracker(FinanceTracker):
+    """
+    Finance tracker for ledgers bigger than RAM.
+
+    Dates, amounts, types and categories live in memory-mapped column files,
+    and totals, category and monthly aggregates run over them one chunk of
+    CHUNK_ROWS rows at a time, so resident memory stays bounded however
+    many rows the ledger has. Only rows returned by filters and searches
+    are decoded into DataFrames.
+    """
+
+    def __init__(self, directory='transactions.cols'):
+        """
+        Open (or create) the column store.
+
+        Args:
+            directory (str): Directory holding the column files
+        """
+        self.directory = directory
+        self.transactions = MappedTransactionView(self)
+        self._pending = {col: [] for col in COLUMNS}  # New rows not written yet
+        self._pending_count = 0
+        self.budgets = {}  # Dictionary to store category budgets
+        self.budget_periods = {}  # Budget period per category ('total' if not set)
+
+        is_new = not os.path.exists(directory)
+        self.store = ColumnStore(directory)
+        if is_new:
+            self._create_sample_data()
+
+    def _store(self):
+        """
+        Get the column store after writing out any buffered rows.
+
+        Returns:
+            ColumnStore: The tracker's store
+        """
+        self._flush_pending()
+        return self.store
+
+    @property
+    def df(self):
+        """
+        All transactions as a DataFrame (decodes the whole ledger).
+
+        Returns:
+            pandas.DataFrame: Transactions in file order
+        """
+        store = self._store()
+        return store.take(store.positions(np.arange(len(store))))
+
+    @df.setter
+    def df(self, value):
+        """
+        Replace every transaction in the store.
+
+        Args:
+            value (pandas.DataFrame): New transactions frame
+        """
+        self._pending = {col: [] for col in COLUMNS}
+        self._pending_count = 0
+        self.store.write(normalize_frame(value))
+        self._changed()
+
+    def load_data(self):
+        """
+        Reopen the column files.
+        """
+        self.store = ColumnStore(self.directory)
+
+    def add_transaction(self, date, mode, category, sub_category, trans_type, amount, notes=""):
+        """
+        Add a new transaction (appended to the column files in batches).
+
+        Args:
+            date (str): Date of transaction
+            mode (str): Payment method
+            category (str): Transaction category
+            sub_category (str): Transaction subcategory
+            trans_type (str): "Income" or "Expense"
+            amount (float): Transaction amount
+            notes (str): Optional notes
+        """
+        new_trans = Transaction(date, mode, category, sub_category, trans_type, amount, notes)
+        new_trans.date = datetime.strptime(new_trans.date, '%Y-%m-%d').strftime('%Y-%m-%d')
+        for col, value in new_trans.to_dict().items():
+            self._pending[col].append(value)
+        self._pending_count += 1
+        self._changed()
+
+    def add_transactions(self, transactions):
+        """
+        Add many transactions at once.
+
+        Args:
+            transactions (iterable): Transaction objects, or tuples in the
+                argument order of add_transaction
+
+        Returns:
+            int: Number of transactions added
+        """
+        count = 0
+        for trans in transactions:
+            if isinstance(trans, Transaction):
+                trans = (trans.date, trans.mode, trans.category, trans.sub_category,
+                         trans.trans_type, trans.amount, trans.notes)
+            self.add_transaction(*trans)
+            count += 1
+        self._flush_pending()
+        return count
+
+    def _flush_pending(self):
+        """
+        Append all buffered rows to the column files.
+        """
+        if not self._pending_count:
+            return
+        new_rows = normalize_frame(pd.DataFrame(self._pending, columns=COLUMNS))
+        self._pending = {col: [] for col in COLUMNS}
+        self._pending_count = 0
+        self.store.append(new_rows)
+
+    def _append_rows(self, rows):
+        """
+        Append a normalized DataFrame of new transactions to the column files.
+
+        Args:
+            rows (pandas.DataFrame): Rows already passed through normalize_frame
+        """
+        self._flush_pending()
+        self.store.append(rows)
+        self._changed()
+
+    def save_data(self):
+        """
+        Append buffered rows and force the column files onto disk.
+        """
+        self._store().sync()
+
+    def compact(self):
+        """
+        Rewrite the column files without deleted rows and save.
+        """
+        self._store().compact()
+        self.save_data()
+
+    def sync(self):
+        """
+        Force the column files onto disk.
+        """
+        self.save_data()
+
+    def _masked_chunks(self, columns, trans_type=None, start_date=None, end_date=None):
+        """
+        Iterate over chunks with a mask of the rows matching a type and date range.
+        Deleted rows never match.
+
+        Args:
+            columns (list): Columns to map besides the filter columns
+            trans_type (str): Optional "Income" or "Expense"
+            start_date (str): Optional start date (inclusive)
+            end_date (str): Optional end date (inclusive)
+
+        Yields:
+            tuple: (first row, dict of mapped columns, boolean mask or None for all rows)
+        """
+        store = self._store()
+        type_code = None
+        if trans_type is not None:
+            type_code = store.code('Income/Expense', trans_type)
+            if type_code is None:
+                return
+
+        low = _to_days(start_date) if start_date else None
+        high = _to_days(end_date) if end_date else None
+        for start, chunk in store.chunks(list(columns) + ['Date', 'Income/Expense']):
+            mask = store.live(start, start + len(chunk['Date']))
+            if type_code is not None:
+                match = chunk['Income/Expense'] == type_code
+                mask = match if mask is None else mask & match
+            if low is not None:
+                mask = (chunk['Date'] >= low) if mask is None else mask & (chunk['Date'] >= low)
+            if high is not None:
+                mask = (chunk['Date'] <= high) if mask is None else mask & (chunk['Date'] <= high)
+            yield start, chunk, mask
+
+    def _type_totals(self, start_date=None, end_date=None):
+        """
+        Total amount per transaction type, optionally inside a date range.
+
+        Returns:
+            dict: Type -> total in integer cents
+        """
+        labels = self._store().dictionaries['Income/Expense']
+        sums = np.zeros(len(labels), dtype=np.int64)
+        for _, chunk, mask in self._masked_chunks(['Amount'], None, start_date, end_date):
+            codes, cents = chunk['Income/Expense'], chunk['Amount']
+            if mask is not None:
+                codes, cents = codes[mask], cents[mask]
+            sums += _sum_cents(codes, cents, len(labels))
+        return dict(zip(labels, sums.tolist()))
+
+    def _get_total(self, trans_type, start_date=None, end_date=None):
+        """
+        Total amount of one transaction type, summed over the mapped columns.
+
+        Args:
+            trans_type (str): "Income" or "Expense"
+            start_date (str): Optional start date filter
+            end_date (str): Optional end date filter
+
+        Returns:
+            float: Total amount
+        """
+        return self._type_totals(start_date, end_date).get(trans_type, 0) / 100
+
+    def get_balance(self):
+        """
+        Calculate current balance (income - expenses).
+
+        Returns:
+            float: Current balance
+        """
+        totals = self._type_totals()
+        return (totals.get('Income', 0) - totals.get('Expense', 0)) / 100
+
+    def get_expense_by_category(self, start_date=None, end_date=None):
+        """
+        Group expenses by category and calculate totals, one chunk at a time.
+
+        Args:
+            start_date (str): Optional start date filter
+            end_date (str): Optional end date filter
+
+        Returns:
+            dict: Dictionary with categories as keys and total amounts as values
+        """
+        labels = self._store().dictionaries['Category']
+        sums = np.zeros(len(labels), dtype=np.int64)
+        counts = np.zeros(len(labels), dtype=np.int64)
+        for _, chunk, mask in self._masked_chunks(['Category', 'Amount'], 'Expense',
+                                                  start_date, end_date):
+            codes, cents = chunk['Category'][mask], chunk['Amount'][mask]
+            sums += _sum_cents(codes, cents, len(labels))
+            counts += np.bincount(codes, minlength=len(labels))
+        return {labels[code]: int(sums[code]) / 100
+                for code in sorted(np.flatnonzero(counts), key=lambda code: labels[code])}
+
+    def get_monthly_summary(self, as_frame=False):
+        """
+        Get income and expense summary by month, one chunk at a time.
+
+        Args:
+            as_frame (bool): If True, return a DataFrame instead of a dict
+
+        Returns:
+            dict: Dictionary with month as key and {income, expense, balance} as value,
+                in chronological order. With as_frame=True, a DataFrame indexed by
+                month with income, expense and balance columns.
+        """
+        labels = self._store().dictionaries['Income/Expense']
+        totals = {}  # (month number, type code) -> total in cents
+        for _, chunk, mask in self._masked_chunks(['Amount']):
+            dates, codes, cents = chunk['Date'], chunk['Income/Expense'], chunk['Amount']
+            if mask is not None:
+                dates, codes, cents = dates[mask], codes[mask], cents[mask]
+            months = (np.asarray(dates).astype('datetime64[D]').astype('datetime64[M]')
+                      .astype(np.int64))
+            keys = months * len(labels) + codes
+            uniques, inverse = np.unique(keys, return_inverse=True)
+            sums = _sum_cents(inverse, cents, len(uniques))
+            for key, total in zip(uniques.tolist(), sums.tolist()):
+                totals[key] = totals.get(key, 0) + total
+
+        cents = {}  # Month -> {'income': cents, 'expense': cents}
+        for key in sorted(totals):
+            month = str(np.datetime64(key // len(labels), 'M'))
+            entry = cents.setdefault(month, {'income': 0, 'expense': 0})
+            trans_type = labels[key % len(labels)]
+            if trans_type in ('Income', 'Expense'):
+                entry[trans_type.lower()] += totals[key]
+
+        summary = {}
+        for month, entry in cents.items():
+            summary[month] = {
+                'income': entry['income'] / 100,
+                'expense': entry['expense'] / 100,
+                'balance': (entry['income'] - entry['expense']) / 100
+            }
+
+        if as_frame:
+            frame = pd.DataFrame.from_dict(summary, orient='index',
+                                           columns=['income', 'expense', 'balance'])
+            return frame.astype('float64').rename_axis('Month')
+        return summary
+
+    def _positions(self, predicate, columns, start_date=None, end_date=None):
+        """
+        Row positions matching a per-chunk predicate and an optional date range.
+
+        Args:
+            predicate: Function (first row, chunk) returning a boolean mask, or None
+            columns (list): Columns the predicate needs
+            start_date (str): Optional start date (inclusive)
+            end_date (str): Optional end date (inclusive)
+
+        Returns:
+            numpy.ndarray: Matching row positions in file order
+        """
+        found = []
+        for start, chunk, mask in self._masked_chunks(columns, None, start_date, end_date):
+            if predicate is not None:
+                match = predicate(start, chunk)
+                mask = match if mask is None else mask & match
+            if mask is None:
+                found.append(np.arange(start, start + len(chunk['Date'])))
+            else:
+                found.append(np.flatnonzero(mask) + start)
+        if not found:
+            return np.array([], dtype=np.int64)
+        return np.concatenate(found)
+
+    def _filter_dates(self, start_date=None, end_date=None):
+        """
+        Select the transactions inside a date range.
+
+        Args:
+            start_date (str): Optional start date (inclusive)
+            end_date (str): Optional end date (inclusive)
+
+        Returns:
+            pandas.DataFrame: Matching transactions in file order
+        """
+        return self.store.take(self._positions(None, [], start_date, end_date))
+
+    def _export_chunks(self, chunksize, start_date=None, end_date=None, category=None,
+                       trans_type=None):
+        """
+        Find the transactions to export chunk by chunk over the mapped columns,
+        then read them back chunksize rows at a time.
+
+        Returns:
+            tuple: (number of rows, iterator of DataFrames with at most chunksize rows)
+        """
+        store = self._store()
+        codes = {}
+        for col, label in (('Category', category), ('Income/Expense', trans_type)):
+            if label:
+                codes[col] = store.code(col, label)
+                if codes[col] is None:
+                    return 0, iter(())
+
+        predicate = None
+        if codes:
+            def predicate(start, chunk):
+                mask = None
+                for col, code in codes.items():
+                    mask = (chunk[col] == code) if mask is None else mask & (chunk[col] == code)
+                return mask
+
+        positions = self._positions(predicate, list(codes), start_date, end_date)
+        return len(positions), (store.take(positions[start:start + chunksize])
+                                for start in range(0, len(positions), chunksize))
+
+    def filter_by_date_range(self, start_date, end_date):
+        """
+        Filter transactions by date range.
+
+        Args:
+            start_date (str): Start date in YYYY-MM-DD format
+            end_date (str): End date in YYYY-MM-DD format
+
+        Returns:
+            pandas.DataFrame: Filtered transactions
+        """
+        return self._filter_dates(start_date, end_date)
+
+    def _filter_code(self, col, label):
+        """
+        Select the transactions whose dictionary-encoded column equals a label.
+        """
+        code = self._store().code(col, label)
+        if code is None:
+            return self.store.take([])
+        return self.store.take(self._positions(lambda start, chunk: chunk[col] == code, [col]))
+
+    def filter_by_category(self, category):
+        """
+        Filter transactions by category.
+
+        Args:
+            category (str): Category to filter by
+
+        Returns:
+            pandas.DataFrame: Filtered transactions
+        """
+        return self._filter_code('Category', category)
+
+    def filter_by_type(self, trans_type):
+        """
+        Filter transactions by type (Income or Expense).
+
+        Args:
+            trans_type (str): "Income" or "Expense"
+
+        Returns:
+            pandas.DataFrame: Filtered transactions
+        """
+        return self._filter_code('Income/Expense', trans_type)
+
+    def get_recent_transactions(self, n=10):
+        """
+        Get the most recent n transactions.
+
+        Args:
+            n (int): Number of recent transactions to retrieve
+
+        Returns:
+            pandas.DataFrame: DataFrame containing recent transactions
+        """
+        store = self._store()
+        count = len(store)
+        return store.take(store.positions(np.arange(max(0, count - n), count)))
+
+    def search_transactions(self, keyword, rank=False):
+        """
+        Search transactions by keyword in subcategory or notes.
+        Several space-separated terms must all match.
+
+        Args:
+            keyword (str): Keyword(s) to search for
+            rank (bool): If True, order results by number of term matches
+
+        Returns:
+            pandas.DataFrame: Matching transactions
+        """
+        terms = keyword.lower().split()
+        store = self._store()
+        sub_categories = np.asarray([label.lower() for label in store.dictionaries['Sub Category']],
+                                    dtype=object)
+
+        def matches(start, chunk):
+            texts = (pd.Series(sub_categories[chunk['Sub Category']]) + '\n' +
+                     pd.Series(store.notes(start, start + len(chunk['Date']))).str.lower())
+            mask = np.ones(len(texts), dtype=bool)
+            for term in terms:
+                mask &= texts.str.contains(term, regex=False).to_numpy()
+            return mask
+
+        df = store.take(self._positions(matches, ['Sub Category']))
+        if rank and terms and not df.empty:
+            texts = df['Sub Category'].str.lower() + '\n' + df['Notes'].str.lower()
+            scores = sum(texts.str.count(re.escape(term)) for term in terms)
+            df = df.iloc[(-scores).argsort(kind='stable')]
+        return df
+
+    def _get_period_spending(self, period, as_of=None):
+        """
+        Expenses per category for a budget period.
+
+        Args:
+            period (str): 'total', 'monthly' or 'weekly'
+            as_of (str): Date that defines the current month/week (default: today)
+
+        Returns:
+            dict: Category -> amount spent in the period
+        """
+        today = pd.Timestamp(as_of) if as_of else pd.Timestamp(datetime.now().date())
+        if period == 'monthly':
+            start, end = today.replace(day=1), today + pd.offsets.MonthEnd(0)
+        elif period == 'weekly':
+            start, end = today - timedelta(days=today.weekday()), today
+        else:
+            return self.get_expense_by_category()
+        return self.get_expense_by_category(start.strftime('%Y-%m-%d'), end.strftime('%Y-%m-%d'))
+
+    def delete_transaction(self, index):
+        """
+        Delete a transaction by its position in the transaction list.
+
+        Args:
+            index (int): Index of transaction to delete
+        """
+        store = self._store()
+        if 0 <= index < len(store):
+            self.delete_transactions(store.mapped(ID_COLUMN)[store.positions([index])])
+
+    def delete_transactions(self, ids):
+        """
+        Delete transactions by ID. Their IDs are appended to the deletion log;
+        the column files are rewritten only once deleted rows make up more
+        than COMPACT_DEAD_FRACTION of them.
+
+        Args:
+            ids (iterable): IDs of the transactions to delete
+
+        Returns:
+            int: Number of transactions deleted (unknown and already deleted IDs are skipped)
+        """
+        store = self._store()
+        deleted = store.tombstone(list(ids))
+        if deleted:
+            if len(store.dead) > COMPACT_DEAD_FRACTION * store.count:
+                store.compact()
+            self._changed()
+        return deleted
+
+
+def import_ledger(source, directory):
+    """
+    Copy an existing ledger (CSV, Feather or Parquet) into a column store.
+
+    Args:
+        source (str): Existing data file
+        directory (str): Column store directory to create or replace
+
+    Returns:
+        int: Number of transactions copied
+    """
+    df = read_ledger(source)
+    ColumnStore(directory).write(df)
+    return len(df)
+
+
+def main():
+    """
+    Command line entry point for importing a ledger.
+    """
+    parser = argparse.ArgumentParser(description="Import a transactions file into a column store")
+    parser.add_argument('source', help="existing data file (e.g. transactions.csv)")
+    parser.add_argument('target', help="column store directory to create (e.g. transactions.cols)")
+    args = parser.parse_args()
+
+    count = import_ledger(args.source, args.target)
+    print(f"Copied {count} transactions from {args.source} to {args.target}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+# RefreshScheduler_v2.py
+# Authors: Group 3 - Vanshika Kukreja, Miloni Mehta
+# Date: October 17, 2026
+# Description: Coalesces refreshes of the GUI views into one idle pass and skips views that are not shown
+
+
+class RefreshScheduler:
+    """
+    Refreshes GUI views lazily.
+
+    Changes only mark views dirty; the dirty views are refreshed together in
+    one pass scheduled with root.after_idle, so a burst of changes (many quick
+    entries, an import) costs one refresh per view instead of one per change.
+    Views that are not visible, such as those on a hidden notebook tab, stay
+    dirty and are refreshed when they are shown again.
+    """
+
+    def __init__(self, root):
+        """
+        Initialize the scheduler.
+
+        Args:
+            root: tkinter root window used to schedule the refresh pass
+        """
+        self.root = root
+        self._views = {}  # View name -> (refresh function, visibility check)
+        self._dirty = set()
+        self._scheduled = False
+
+    def register(self, name, refresh, is_visible=None):
+        """
+        Add a view. Views are refreshed in the order they were registered.
+
+        Args:
+            name (str): View name
+            refresh: Function that redraws the view
+            is_visible: Function returning False while the view is hidden (default: always shown)
+        """
+        self._views[name] = (refresh, is_visible)
+
+    def mark_dirty(self, *names):
+        """
+        Schedule views for the next refresh pass.
+
+        Args:
+            *names (str): Views that need refreshing (default: all views)
+        """
+        self._dirty.update(names or self._views)
+        self._schedule()
+
+    def visibility_changed(self):
+        """
+        Refresh dirty views that may have just been shown (e.g. on a tab change).
+        """
+        if self._dirty:
+            self._schedule()
+
+    def _schedule(self):
+        """
+        Schedule one refresh pass for when the GUI is idle.
+        """
+        if not self._scheduled:
+            self._scheduled = True
+            self.root.after_idle(self._refresh)
+
+    def _refresh(self):
+        """
+        Refresh every dirty view that is visible; hidden ones stay dirty.
+        """
+        self._scheduled = False
+        for name, (refresh, is_visible) in self._views.items():
+            if name in self._dirty and (is_visible is None or is_visible()):
+                self._dirty.discard(name)
+                refresh()
@@ -0,0 +1,698 @@
+# SQLiteTracker_v2.py
+# Authors: Group 3 - Vanshika Kukreja, Miloni Mehta
+# Date: October 17, 2026
+# Description: FinanceTracker backed by a local SQLite database with indexed queries.
+# Run as a script to import a ledger: python SQLiteTracker_v2.py transactions.csv transactions.db
+
+import argparse
+import os
+import re
+import sqlite3
+import pandas as pd
+from datetime import datetime, timedelta
+from Transaction_v2 import Transaction
+from FinanceTracker_v2 import FinanceTracker, TransactionView, _transaction_from_values
+from Storage_v2 import COLUMNS, ID_COLUMN, has_ids, normalize_frame, read_ledger, to_cents
+
+
+# Table column for each tracker column, in COLUMNS order
+SQL_COLUMNS = ['date', 'mode', 'category', 'sub_category', 'trans_type', 'amount', 'notes']
+
+# SELECT list that returns rows under the tracker's column names (amounts back in dollars),
+# with the row id as the transaction ID
+SELECT_ROWS = f'SELECT id AS "{ID_COLUMN}", ' + ", ".join(
+    f'{sql_col} AS "{col}"' if sql_col != 'amount' else f'amount / 100.0 AS "{col}"'
+    for sql_col, col in zip(SQL_COLUMNS, COLUMNS)) + " FROM transactions"
+
+# Database format, kept in PRAGMA user_version
+# (1: amounts are integer cents, 2: IDs of deleted rows are never handed out again)
+SCHEMA_VERSION = 2
+
+SCHEMA = [
+    """CREATE TABLE IF NOT EXISTS transactions (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        date TEXT NOT NULL,
+        mode TEXT NOT NULL,
+        category TEXT NOT NULL,
+        sub_category TEXT NOT NULL,
+        trans_type TEXT NOT NULL,
+        amount INTEGER NOT NULL,
+        notes TEXT NOT NULL DEFAULT ''
+    )""",
+    "CREATE INDEX IF NOT EXISTS idx_transactions_date ON transactions (date)",
+    "CREATE INDEX IF NOT EXISTS idx_transactions_category ON transactions (category)",
+    # Also covers category and amount, so ranged totals never read the table rows
+    "CREATE INDEX IF NOT EXISTS idx_transactions_type "
+    "ON transactions (trans_type, date, category, amount)",
+]
+
+# Sum (in cents) and count of amounts per (month, category, type), kept up to date
+# by triggers so unfiltered totals and monthly summaries never scan the ledger
+ROLLUP_SCHEMA = [
+    """CREATE TABLE rollup (
+        month TEXT NOT NULL,
+        category TEXT NOT NULL,
+        trans_type TEXT NOT NULL,
+        total INTEGER NOT NULL,
+        count INTEGER NOT NULL,
+        PRIMARY KEY (month, category, trans_type)
+    )""",
+    """INSERT INTO rollup
+        SELECT substr(date, 1, 7), category, trans_type, SUM(amount), COUNT(*)
+        FROM transactions GROUP BY 1, 2, 3""",
+    """CREATE TRIGGER rollup_insert AFTER INSERT ON transactions BEGIN
+        INSERT INTO rollup VALUES (substr(NEW.date, 1, 7), NEW.category, NEW.trans_type, NEW.amount, 1)
+        ON CONFLICT (month, category, trans_type)
+        DO UPDATE SET total = total + excluded.total, count = count + 1;
+    END""",
+    """CREATE TRIGGER rollup_delete AFTER DELETE ON transactions BEGIN
+        UPDATE rollup SET total = total - OLD.amount, count = count - 1
+        WHERE month = substr(OLD.date, 1, 7) AND category = OLD.category
+            AND trans_type = OLD.trans_type;
+        DELETE FROM rollup WHERE count = 0;
+    END""",
+]
+
+INSERT_ROW = (f"INSERT INTO transactions ({', '.join(SQL_COLUMNS)}) "
+              f"VALUES ({', '.join('?' * len(SQL_COLUMNS))})")
+INSERT_ROW_WITH_ID = (f"INSERT INTO transactions (id, {', '.join(SQL_COLUMNS)}) "
+                      f"VALUES ({', '.join('?' * (len(SQL_COLUMNS) + 1))})")
+
+
+def _row_values(trans):
+    """
+    Validate a transaction and get its values in SQL_COLUMNS order.
+
+    Args:
+        trans (Transaction): Transaction to store
+
+    Returns:
+        tuple: Row values
+
+    Raises:
+        ValueError: If the date is not a valid YYYY-MM-DD date
+    """
+    date = datetime.strptime(trans.date, '%Y-%m-%d').strftime('%Y-%m-%d')
+    return (date, trans.mode, trans.category, trans.sub_category,
+            trans.trans_type, trans.amount_cents, trans.notes or '')
+
+
+def _date_clause(start_date=None, end_date=None):
+    """
+    Build a WHERE condition for an inclusive date range.
+
+    Args:
+        start_date (str): Optional start date
+        end_date (str): Optional end date
+
+    Returns:
+        tuple: (list of SQL conditions, list of parameters)
+    """
+    conditions, params = [], []
+    if start_date:
+        conditions.append("date >= ?")
+        params.append(pd.Timestamp(start_date).strftime('%Y-%m-%d'))
+    if end_date:
+        conditions.append("date <= ?")
+        params.append(pd.Timestamp(end_date).strftime('%Y-%m-%d'))
+    return conditions, params
+
+
+def _where(conditions):
+    """
+    Join SQL conditions into a WHERE clause (empty if there are none).
+    """
+    return " WHERE " + " AND ".join(conditions) if conditions else ""
+
+
+class SQLiteTransactionView(TransactionView):
+    """
+    Lazy sequence of Transaction objects read from the database on demand.
+    """
+
+    def __len__(self):
+        """
+        Returns:
+            int: Number of transactions in the database
+        """
+        return self._tracker._count()
+
+    def __getitem__(self, index):
+        """
+        Get one transaction (or a list of transactions for a slice).
+
+        Args:
+            index (int or slice): Position of the transaction(s)
+
+        Returns:
+            Transaction or list: The requested transaction(s)
+        """
+        if isinstance(index, slice):
+            return TransactionView.__getitem__(self, index)
+
+        count = len(self)
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError("transaction index out of range")
+        df = self._tracker._query(SELECT_ROWS + " ORDER BY id LIMIT 1 OFFSET ?", [index])
+        return _transaction_from_values(tuple(df.iloc[0]))
+
+    def __iter__(self):
+        """
+        Iterate over all transactions, reading BATCH_SIZE rows at a time.
+
+        Yields:
+            Transaction: Each transaction in insertion order
+        """
+        last_id = 0
+        while True:
+            rows = self._tracker.conn.execute(
+                f"SELECT id, {', '.join(SQL_COLUMNS)} FROM transactions "
+                "WHERE id > ? ORDER BY id LIMIT ?", (last_id, self.BATCH_SIZE)).fetchall()
+            if not rows:
+                return
+            for _, date, mode, category, sub_category, trans_type, cents, notes in rows:
+                trans = Transaction(date, mode, category, sub_category, trans_type, 0, notes)
+                trans.amount_cents = cents
+                yield trans
+            last_id = rows[-1][0]
+
+
+class SQLiteFinanceTracker(FinanceTracker):
+    """
+    Finance tracker that keeps its transactions in a SQLite database.
+
+    Filters and aggregates run as indexed SQL queries, so only the rows a
+    query returns are loaded into memory and memory use does not grow with
+    the size of the ledger. New rows are single INSERTs in the current
+    database transaction, which save_data commits.
+    """
+
+    def __init__(self, db_file='transactions.db'):
+        """
+        Open (or create) the database.
+
+        Args:
+            db_file (str): Path to the SQLite database file
+        """
+        self.db_file = db_file
+        self.transactions = SQLiteTransactionView(self)
+        self.budgets = {}  # Dictionary to store category budgets
+        self.budget_periods = {}  # Budget period per category ('total' if not set)
+
+        is_new = not os.path.exists(db_file)
+        # The GUI runs tracker work on its background worker thread
+        self.conn = sqlite3.connect(db_file, check_same_thread=False)
+        self.load_data(create_sample_data=is_new)
+
+    @property
+    def df(self):
+        """
+        All transactions as a DataFrame (reads the whole table).
+
+        Returns:
+            pandas.DataFrame: Transactions in insertion order
+        """
+        return self._query(SELECT_ROWS + " ORDER BY id")
+
+    @df.setter
+    def df(self, value):
+        """
+        Replace every transaction in the database.
+
+        Args:
+            value (pandas.DataFrame): New transactions frame
+        """
+        self.conn.execute("DELETE FROM transactions")
+        self._insert_frame(normalize_frame(value))
+        self.conn.commit()
+        self._changed()
+
+    def _insert_frame(self, rows):
+        """
+        Insert a normalized DataFrame of transactions (without committing).
+        Rows indexed by transaction IDs keep them as their row ids.
+
+        Args:
+            rows (pandas.DataFrame): Rows already passed through normalize_frame
+        """
+        rows = rows.assign(Date=rows['Date'].dt.strftime('%Y-%m-%d'),
+                           Amount=to_cents(rows['Amount']).tolist())
+        if has_ids(rows):
+            self.conn.executemany(INSERT_ROW_WITH_ID, rows[COLUMNS].itertuples(name=None))
+        else:
+            self.conn.executemany(INSERT_ROW, rows[COLUMNS].itertuples(index=False, name=None))
+
+    def load_data(self, create_sample_data=False):
+        """
+        Create the tables, indexes and triggers if they do not exist yet.
+
+        Args:
+            create_sample_data (bool): If True, fill a new database with sample data
+        """
+        with self.conn:
+            version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+            if version < SCHEMA_VERSION and self._has_table('transactions'):
+                self._migrate(version)
+            for statement in SCHEMA:
+                self.conn.execute(statement)
+            self.conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            if not self._has_table('rollup'):
+                for statement in ROLLUP_SCHEMA:
+                    self.conn.execute(statement)
+        if create_sample_data:
+            self._create_sample_data()
+
+    def _has_table(self, name):
+        """
+        Check whether a table exists in the database.
+        """
+        return self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (name,)).fetchone()
+
+    def _migrate(self, version):
+        """
+        Rebuild the transactions table of an older database under the current
+        schema: REAL dollar amounts become INTEGER cents (before version 1) and
+        IDs become AUTOINCREMENT (before version 2). The rollup is rebuilt afterwards.
+
+        Args:
+            version (int): Format of the database (its PRAGMA user_version)
+        """
+        amount = "CAST(round(amount * 100) AS INTEGER)" if version < 1 else "amount"
+        self.conn.execute("BEGIN")
+        self.conn.execute("DROP TABLE IF EXISTS rollup")
+        for name in ('rollup_insert', 'rollup_delete'):
+            self.conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+        for name in ('idx_transactions_date', 'idx_transactions_category', 'idx_transactions_type'):
+            self.conn.execute(f"DROP INDEX IF EXISTS {name}")
+        self.conn.execute("ALTER TABLE transactions RENAME TO transactions_old")
+        for statement in SCHEMA:
+            self.conn.execute(statement)
+        self.conn.execute(
+            f"INSERT INTO transactions (id, {', '.join(SQL_COLUMNS)}) "
+            "SELECT id, date, mode, category, sub_category, trans_type, "
+            f"{amount}, notes FROM transactions_old")
+        self.conn.execute("DROP TABLE transactions_old")
+
+    def add_transaction(self, date, mode, category, sub_category, trans_type, amount, notes=""):
+        """
+        Add a new transaction (committed by the next save_data).
+
+        Args:
+            date (str): Date of transaction
+            mode (str): Payment method
+            category (str): Transaction category
+            sub_category (str): Transaction subcategory
+            trans_type (str): "Income" or "Expense"
+            amount (float): Transaction amount
+            notes (str): Optional notes
+        """
+        new_trans = Transaction(date, mode, category, sub_category, trans_type, amount, notes)
+        self.conn.execute(INSERT_ROW, _row_values(new_trans))
+        self._changed()
+
+    def add_transactions(self, transactions):
+        """
+        Add many transactions in one database transaction.
+
+        Args:
+            transactions (iterable): Transaction objects, or tuples in the
+                argument order of add_transaction
+
+        Returns:
+            int: Number of transactions added
+        """
+        count = 0
+
+        def rows():
+            nonlocal count
+            for trans in transactions:
+                if not isinstance(trans, Transaction):
+                    trans = Transaction(*trans)
+                count += 1
+                yield _row_values(trans)
+
+        with self.conn:
+            self.conn.executemany(INSERT_ROW, rows())
+        self._changed()
+        return count
+
+    def _append_rows(self, rows):
+        """
+        Insert a normalized DataFrame of new transactions in one database transaction.
+
+        Args:
+            rows (pandas.DataFrame): Rows already passed through normalize_frame
+        """
+        with self.conn:
+            self._insert_frame(rows)
+        self._changed()
+
+    def save_data(self):
+        """
+        Commit the transactions added since the last save.
+        """
+        self.conn.commit()
+
+    def compact(self):
+        """
+        Commit pending changes and reclaim the space of deleted rows.
+        """
+        self.conn.commit()
+        self.conn.execute("VACUUM")
+
+    def sync(self):
+        """
+        Commit pending changes (SQLite syncs committed data to disk).
+        """
+        self.conn.commit()
+
+    def close(self):
+        """
+        Commit pending changes and close the database.
+        """
+        self.conn.commit()
+        self.conn.close()
+
+    def _query(self, sql, params=()):
+        """
+        Run a SELECT returning transaction rows.
+
+        Args:
+            sql (str): Query selecting the columns of SELECT_ROWS
+            params (list): Query parameters
+
+        Returns:
+            pandas.DataFrame: Rows in the tracker's schema
+        """
+        return normalize_frame(pd.read_sql_query(sql, self.conn, params=list(params)))
+
+    def _count(self):
+        """
+        Returns:
+            int: Number of transactions in the database
+        """
+        return self.conn.execute("SELECT COUNT(*) FROM transactions").fetchone()[0]
+
+    def _type_totals(self, start_date=None, end_date=None):
+        """
+        Total amount per transaction type, optionally inside a date range.
+        Unfiltered totals come from the rollup table.
+
+        Returns:
+            dict: Type -> total in integer cents
+        """
+        if not (start_date or end_date):
+            rows = self.conn.execute("SELECT trans_type, SUM(total) FROM rollup GROUP BY trans_type")
+            return dict(rows.fetchall())
+
+        conditions, params = _date_clause(start_date, end_date)
+        rows = self.conn.execute(
+            "SELECT trans_type, SUM(amount) FROM transactions" + _where(conditions) +
+            " GROUP BY trans_type", params)
+        return dict(rows.fetchall())
+
+    def _get_total(self, trans_type, start_date=None, end_date=None):
+        """
+        Total amount of one transaction type, summed in SQL.
+
+        Args:
+            trans_type (str): "Income" or "Expense"
+            start_date (str): Optional start date filter
+            end_date (str): Optional end date filter
+
+        Returns:
+            float: Total amount
+        """
+        return self._type_totals(start_date, end_date).get(trans_type, 0) / 100
+
+    def get_balance(self):
+        """
+        Calculate current balance (income - expenses).
+
+        Returns:
+            float: Current balance
+        """
+        totals = self._type_totals()
+        return (totals.get('Income', 0) - totals.get('Expense', 0)) / 100
+
+    def _filter_dates(self, start_date=None, end_date=None):
+        """
+        Select the transactions inside a date range with the date index.
+
+        Args:
+            start_date (str): Optional start date (inclusive)
+            end_date (str): Optional end date (inclusive)
+
+        Returns:
+            pandas.DataFrame: Matching transactions in insertion order
+        """
+        conditions, params = _date_clause(start_date, end_date)
+        return self._query(SELECT_ROWS + _where(conditions) + " ORDER BY id", params)
+
+    def _export_chunks(self, chunksize, start_date=None, end_date=None, category=None,
+                       trans_type=None):
+        """
+        Select the transactions to export in SQL and read them chunksize rows at a time.
+
+        Returns:
+            tuple: (number of rows, iterator of DataFrames with at most chunksize rows)
+        """
+        conditions, params = _date_clause(start_date, end_date)
+        if category:
+            conditions.append("category = ?")
+            params.append(category)
+        if trans_type:
+            conditions.append("trans_type = ?")
+            params.append(trans_type)
+
+        total = self.conn.execute("SELECT COUNT(*) FROM transactions" + _where(conditions),
+                                  params).fetchone()[0]
+        chunks = pd.read_sql_query(SELECT_ROWS + _where(conditions) + " ORDER BY id", self.conn,
+                                   params=params, chunksize=chunksize)
+        return total, (normalize_frame(chunk) for chunk in chunks)
+
+    def filter_by_date_range(self, start_date, end_date):
+        """
+        Filter transactions by date range.
+
+        Args:
+            start_date (str): Start date in YYYY-MM-DD format
+            end_date (str): End date in YYYY-MM-DD format
+
+        Returns:
+            pandas.DataFrame: Filtered transactions
+        """
+        return self._filter_dates(start_date, end_date)
+
+    def filter_by_category(self, category):
+        """
+        Filter transactions by category.
+
+        Args:
+            category (str): Category to filter by
+
+        Returns:
+            pandas.DataFrame: Filtered transactions
+        """
+        return self._query(SELECT_ROWS + " WHERE category = ? ORDER BY id", [category])
+
+    def filter_by_type(self, trans_type):
+        """
+        Filter transactions by type (Income or Expense).
+
+        Args:
+            trans_type (str): "Income" or "Expense"
+
+        Returns:
+            pandas.DataFrame: Filtered transactions
+        """
+        return self._query(SELECT_ROWS + " WHERE trans_type = ? ORDER BY id", [trans_type])
+
+    def get_expense_by_category(self, start_date=None, end_date=None):
+        """
+        Group expenses by category and calculate totals in SQL.
+        Unfiltered totals come from the rollup table.
+
+        Args:
+            start_date (str): Optional start date filter
+            end_date (str): Optional end date filter
+
+        Returns:
+            dict: Dictionary with categories as keys and total amounts as values
+        """
+        if not (start_date or end_date):
+            rows = self.conn.execute(
+                "SELECT category, SUM(total) FROM rollup WHERE trans_type = 'Expense' "
+                "GROUP BY category ORDER BY category")
+            return {category: total / 100 for category, total in rows}
+
+        conditions, params = _date_clause(start_date, end_date)
+        rows = self.conn.execute(
+            "SELECT category, SUM(amount) FROM transactions" +
+            _where(["trans_type = 'Expense'"] + conditions) +
+            " GROUP BY category ORDER BY category", params)
+        return {category: total / 100 for category, total in rows}
+
+    def get_monthly_summary(self, as_frame=False):
+        """
+        Get income and expense summary by month from the rollup table.
+
+        Args:
+            as_frame (bool): If True, return a DataFrame instead of a dict
+
+        Returns:
+            dict: Dictionary with month as key and {income, expense, balance} as value,
+                in chronological order. With as_frame=True, a DataFrame indexed by
+                month with income, expense and balance columns.
+        """
+        rows = self.conn.execute(
+            "SELECT month, "
+            "SUM(CASE WHEN trans_type = 'Income' THEN total ELSE 0 END), "
+            "SUM(CASE WHEN trans_type = 'Expense' THEN total ELSE 0 END) "
+            "FROM rollup GROUP BY month ORDER BY month")
+
+        summary = {}
+        for month, income, expense in rows:
+            summary[month] = {
+                'income': income / 100,
+                'expense': expense / 100,
+                'balance': (income - expense) / 100
+            }
+
+        if as_frame:
+            frame = pd.DataFrame.from_dict(summary, orient='index',
+                                           columns=['income', 'expense', 'balance'])
+            return frame.astype('float64').rename_axis('Month')
+        return summary
+
+    def get_recent_transactions(self, n=10):
+        """
+        Get the most recent n transactions.
+
+        Args:
+            n (int): Number of recent transactions to retrieve
+
+        Returns:
+            pandas.DataFrame: DataFrame containing recent transactions
+        """
+        df = self._query(SELECT_ROWS + " ORDER BY id DESC LIMIT ?", [n])
+        return df.iloc[::-1]
+
+    def search_transactions(self, keyword, rank=False):
+        """
+        Search transactions by keyword in subcategory or notes.
+        Several space-separated terms must all match.
+
+        Args:
+            keyword (str): Keyword(s) to search for
+            rank (bool): If True, order results by number of term matches
+
+        Returns:
+            pandas.DataFrame: Matching transactions
+        """
+        terms = keyword.lower().split()
+        text = "lower(sub_category || char(10) || notes)"
+        conditions = [f"instr({text}, ?) > 0" for _ in terms]
+        df = self._query(SELECT_ROWS + _where(conditions) + " ORDER BY id", terms)
+
+        if rank and terms and not df.empty:
+            texts = df['Sub Category'].str.lower() + '\n' + df['Notes'].str.lower()
+            scores = sum(texts.str.count(re.escape(term)) for term in terms)
+            df = df.iloc[(-scores).argsort(kind='stable')]
+        return df
+
+    def _get_period_spending(self, period, as_of=None):
+        """
+        Expenses per category for a budget period.
+        All-time and monthly totals come from the rollup table.
+
+        Args:
+            period (str): 'total', 'monthly' or 'weekly'
+            as_of (str): Date that defines the current month/week (default: today)
+
+        Returns:
+            dict: Category -> amount spent in the period
+        """
+        today = pd.Timestamp(as_of) if as_of else pd.Timestamp(datetime.now().date())
+        if period == 'monthly':
+            rows = self.conn.execute(
+                "SELECT category, SUM(total) FROM rollup "
+                "WHERE trans_type = 'Expense' AND month = ? GROUP BY category",
+                (today.strftime('%Y-%m'),))
+            return {category: total / 100 for category, total in rows}
+        if period == 'weekly':
+            week_start = today - timedelta(days=today.weekday())
+            return self.get_expense_by_category(week_start.strftime('%Y-%m-%d'),
+                                                today.strftime('%Y-%m-%d'))
+        return self.get_expense_by_category()
+
+    def delete_transaction(self, index):
+        """
+        Delete a transaction by its position in insertion order.
+
+        Args:
+            index (int): Index of transaction to delete
+        """
+        with self.conn:
+            self.conn.execute(
+                "DELETE FROM transactions WHERE id = "
+                "(SELECT id FROM transactions ORDER BY id LIMIT 1 OFFSET ?)", (index,))
+        self._changed()
+
+    def delete_transactions(self, ids):
+        """
+        Delete transactions by ID in one database transaction.
+        The rollup triggers keep the totals up to date.
+
+        Args:
+            ids (iterable): IDs of the transactions to delete
+
+        Returns:
+            int: Number of transactions deleted (unknown IDs are skipped)
+        """
+        with self.conn:
+            deleted = self.conn.executemany("DELETE FROM transactions WHERE id = ?",
+                                            ((int(i),) for i in ids)).rowcount
+        if deleted:
+            self._changed()
+        return deleted
+
+
+def import_ledger(source, db_file):
+    """
+    Copy an existing ledger (CSV, Feather or Parquet) into a SQLite database.
+
+    Args:
+        source (str): Existing data file
+        db_file (str): Database to create or replace
+
+    Returns:
+        int: Number of transactions copied
+    """
+    df = read_ledger(source)
+    if not os.path.exists(db_file):
+        open(db_file, 'wb').close()  # An empty file is an empty database (no sample data)
+    tracker = SQLiteFinanceTracker(db_file)
+    tracker.df = df
+    tracker.close()
+    return len(df)
+
+
+def main():
+    """
+    Command line entry point for importing a ledger.
+    """
+    parser = argparse.ArgumentParser(description="Import a transactions file into SQLite")
+    parser.add_argument('source', help="existing data file (e.g. transactions.csv)")
+    parser.add_argument('target', help="SQLite database to create (e.g. transactions.db)")
+    args = parser.parse_args()
+
+    count = import_ledger(args.source, args.target)
+    print(f"Copied {count} transactions from {args.source} to {args.target}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+# SearchIndex_v2.py
+# Authors: Group 3 - Vanshika Kukreja, Miloni Mehta
+# Date: October 17, 2026
+# Description: Inverted trigram index for fast keyword search over transaction texts
+
+import numpy as np
+import pandas as pd
+
+
+def _texts(sub_categories, notes):
+    """
+    Combine the searchable texts of rows.
+
+    Returns:
+        pandas.Series: Lower-cased Sub Category and Notes of each row
+    """
+    return sub_categories.astype(str).str.lower() + '\n' + notes.astype(str).str.lower()
+
+
+def _trigrams(text):
+    """
+    Get the set of 3-character substrings of a text.
+
+    Args:
+        text (str): Lower-cased text
+
+    Returns:
+        set: Trigrams of the text
+    """
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class SearchIndex:
+    """
+    Inverted index over the lower-cased Sub Category and Notes of every transaction.
+
+    Each distinct text is indexed once by its trigrams, so a keyword only has to be
+    checked against the few texts that share all of its trigrams. Rows are found
+    from the matching texts through postings sorted by text, which keeps searches
+    fast on millions of rows with repetitive descriptions.
+
+    Postings hold transaction IDs rather than row positions, so the index stays
+    valid when rows are deleted: deleted IDs are only masked out of results.
+    """
+
+    def __init__(self, ids, sub_categories, notes):
+        """
+        Build the index.
+
+        Args:
+            ids (array-like): Transaction ID of every row
+            sub_categories (pandas.Series): Sub Category of every row
+            notes (pandas.Series): Notes of every row
+        """
+        codes, uniques = pd.factorize(_texts(sub_categories, notes))
+
+        self.texts = list(uniques)
+        self.text_ids = {text: text_id for text_id, text in enumerate(self.texts)}
+        self.grams = {}  # Trigram -> set of text ids
+        for text_id, text in enumerate(self.texts):
+            self._index_text(text_id, text)
+
+        # IDs grouped by text: IDs of text i are order[starts[i]:starts[i + 1]]
+        self._base_texts = len(self.texts)
+        self._order = np.asarray(ids, dtype=np.int64)[np.argsort(codes, kind='stable')]
+        counts = np.bincount(codes, minlength=len(self.texts))
+        self._starts = np.concatenate(([0], np.cumsum(counts)))
+        self._added_rows = {}  # Text id -> IDs added after the build
+        self._deleted = set()  # IDs of deleted rows, left out of results
+
+    def _index_text(self, text_id, text):
+        """
+        Register a distinct text under each of its trigrams.
+        """
+        for gram in _trigrams(text):
+            self.grams.setdefault(gram, set()).add(text_id)
+
+    def _text_id(self, text):
+        """
+        Get the id of a distinct text, indexing it if it is new.
+        """
+        text_id = self.text_ids.get(text)
+        if text_id is None:
+            text_id = len(self.texts)
+            self.texts.append(text)
+            self.text_ids[text] = text_id
+            self._index_text(text_id, text)
+        return text_id
+
+    def add(self, row_id, sub_category, notes):
+        """
+        Add one new row to the index.
+
+        Args:
+            row_id (int): Transaction ID of the row
+            sub_category (str): Sub Category of the row
+            notes (str): Notes of the row
+        """
+        text = f"{sub_category}".lower() + '\n' + f"{notes}".lower()
+        self._added_rows.setdefault(self._text_id(text), []).append(row_id)
+
+    def add_rows(self, ids, sub_categories, notes):
+        """
+        Add many new rows to the index, looking up each distinct text once.
+
+        Args:
+            ids (array-like): Transaction IDs of the rows
+            sub_categories (pandas.Series): Sub Category of each row
+            notes (pandas.Series): Notes of each row
+        """
+        codes, uniques = pd.factorize(_texts(sub_categories, notes))
+        ids = np.asarray(ids, dtype=np.int64)[np.argsort(codes, kind='stable')]
+        starts = np.concatenate(([0], np.cumsum(np.bincount(codes, minlength=len(uniques)))))
+        for code, text in enumerate(uniques):
+            self._added_rows.setdefault(self._text_id(text), []).extend(
+                ids[starts[code]:starts[code + 1]].tolist())
+
+    def remove(self, ids):
+        """
+        Leave deleted rows out of future results.
+
+        Args:
+            ids (iterable): Transaction IDs of the deleted rows
+        """
+        self._deleted.update(int(row_id) for row_id in ids)
+
+    def _match_term(self, term):
+        """
+        Find the distinct texts that contain a term.
+
+        Args:
+            term (str): Lower-cased search term
+
+        Returns:
+            set: Ids of matching texts
+        """
+        if len(term) < 3:
+            # Too short for trigrams; check every distinct text instead
+            candidates = range(len(self.texts))
+        else:
+            postings = sorted((self.grams.get(gram, set()) for gram in _trigrams(term)), key=len)
+            candidates = set.intersection(*postings) if postings[0] else set()
+        return {text_id for text_id in candidates if term in self.texts[text_id]}
+
+    def _rows_for_text(self, text_id):
+        """
+        IDs of all rows with a given text, including deleted ones.
+        """
+        rows = []
+        if text_id < self._base_texts:
+            rows.append(self._order[self._starts[text_id]:self._starts[text_id + 1]])
+        if text_id in self._added_rows:
+            rows.append(np.asarray(self._added_rows[text_id]))
+        return rows
+
+    def search(self, keyword, rank=False):
+        """
+        Find rows matching every whitespace-separated term of a keyword.
+        A term matches when it is a substring of the Sub Category or Notes.
+
+        Args:
+            keyword (str): One or more search terms
+            rank (bool): If True, order rows by how often the terms occur
+
+        Returns:
+            numpy.ndarray: Transaction IDs, in increasing order unless rank is True
+        """
+        terms = keyword.lower().split()
+        if not terms:
+            matched = set(range(len(self.texts)))
+        else:
+            matched = self._match_term(terms[0])
+            for term in terms[1:]:
+                if not matched:
+                    break
+                matched &= self._match_term(term)
+
+        rows, scores = [], []
+        for text_id in matched:
+            score = sum(self.texts[text_id].count(term) for term in terms)
+            for part in self._rows_for_text(text_id):
+                rows.append(part)
+                scores.append(np.full(len(part), score))
+
+        if not rows:
+            return np.array([], dtype=np.int64)
+        rows = np.concatenate(rows).astype(np.int64)
+        scores = np.concatenate(scores)
+        if self._deleted:
+            live = ~np.isin(rows, np.fromiter(self._deleted, dtype=np.int64,
+                                              count=len(self._deleted)))
+            rows, scores = rows[live], scores[live]
+        if rank:
+            # Highest score first, file order among equal scores
+            return rows[np.lexsort((rows, -scores))]
+        return np.sort(rows)
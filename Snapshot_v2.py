@@ -0,0 +1,160 @@
+# Snapshot_v2.py
+# Authors: Group 3 - Vanshika Kukreja, Miloni Mehta
+# Date: October 17, 2026
+# Description: Small summary file next to the ledger, so the dashboard can be shown before the ledger is loaded
+
+import hashlib
+import json
+import os
+
+# Bumped whenever the layout of the snapshot file changes; older snapshots are ignored
+SNAPSHOT_FORMAT = 1
+
+# Number of most recent transactions kept for the dashboard list
+RECENT_ROWS = 10
+
+# Bytes read at a time when hashing the data file
+HASH_CHUNK_BYTES = 1 << 20
+
+
+def snapshot_path(data_path):
+    """
+    Get the path of the snapshot belonging to a data file.
+
+    Args:
+        data_path (str): Path of the transactions file
+
+    Returns:
+        str: Path of its summary snapshot
+    """
+    return data_path + '.summary.json'
+
+
+def file_hash(path):
+    """
+    Hash the contents of a file.
+
+    Args:
+        path (str): File to hash
+
+    Returns:
+        str: Hex SHA-256 digest of the file
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for block in iter(lambda: file.read(HASH_CHUNK_BYTES), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class Snapshot:
+    """
+    Summary of a ledger: row count, totals, per-category and per-month
+    rollups and the most recent transactions. All amounts are integer cents.
+
+    It only needs the standard library, so it can be read and shown
+    before pandas has even been imported.
+    """
+
+    def __init__(self, rows, totals, categories, months, recent):
+        """
+        Initialize a snapshot.
+
+        Args:
+            rows (int): Number of transactions
+            totals (dict): Transaction type -> total in cents
+            categories (dict): Transaction type -> {category: total in cents}
+            months (dict): Month (YYYY-MM) -> {type: total in cents}
+            recent (list): Most recent transactions, oldest first, as
+                [date, mode, category, sub category, type, cents, notes]
+        """
+        self.rows = rows
+        self.totals = totals
+        self.categories = categories
+        self.months = months
+        self.recent = recent
+
+    def summary(self):
+        """
+        Dashboard totals in dollars.
+
+        Returns:
+            tuple: (income, expenses, balance)
+        """
+        income = self.totals.get('Income', 0)
+        expenses = self.totals.get('Expense', 0)
+        return income / 100, expenses / 100, (income - expenses) / 100
+
+
+def write_snapshot(data_path, snapshot):
+    """
+    Write the snapshot of a data file, stamped with the file's size,
+    modification time and content hash. The file is written to a temporary
+    file first, so a reader never sees half a snapshot.
+
+    Args:
+        data_path (str): Path of the transactions file the snapshot summarizes
+        snapshot (Snapshot): Summary of the file's current contents
+    """
+    stat = os.stat(data_path)
+    content = {
+        'format': SNAPSHOT_FORMAT,
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'hash': file_hash(data_path),
+        'rows': snapshot.rows,
+        'totals': snapshot.totals,
+        'categories': snapshot.categories,
+        'months': snapshot.months,
+        'recent': snapshot.recent,
+    }
+
+    path = snapshot_path(data_path)
+    temp_path = path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as file:
+        json.dump(content, file)
+    os.replace(temp_path, path)
+
+
+def remove_snapshot(data_path):
+    """
+    Delete the snapshot of a data file, for changes its stamp would not notice.
+
+    Args:
+        data_path (str): Path of the transactions file
+    """
+    path = snapshot_path(data_path)
+    if os.path.exists(path):
+        os.remove(path)
+
+
+def read_snapshot(data_path, verify=False):
+    """
+    Read the snapshot of a data file if it still matches the file.
+
+    The snapshot is stale when the file's size or modification time differ
+    from the ones it was written for. With verify, the contents are hashed
+    as well, which reads the whole file but no longer needs to parse it.
+
+    Args:
+        data_path (str): Path of the transactions file
+        verify (bool): Also compare the content hash
+
+    Returns:
+        Snapshot: Summary of the file, or None if there is no valid snapshot
+    """
+    try:
+        with open(snapshot_path(data_path), encoding='utf-8') as file:
+            content = json.load(file)
+        stat = os.stat(data_path)
+    except (OSError, ValueError):
+        return None
+
+    if (content.get('format') != SNAPSHOT_FORMAT or content['size'] != stat.st_size or
+            content['mtime_ns'] != stat.st_mtime_ns):
+        return None
+    if verify and content['hash'] != file_hash(data_path):
+        return None
+
+    return Snapshot(content['rows'], content['totals'], content['categories'],
+                    content['months'], content['recent'])
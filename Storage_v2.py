@@ -0,0 +1,698 @@
+# Storage_v2.py
+# Authors: Group 3 - Vanshika Kukreja, Miloni Mehta
+# Date: October 17, 2026
+# Description: Storage backends (CSV, Feather/Arrow IPC, Parquet) for the transactions file.
+# Run as a script to migrate a ledger: python Storage_v2.py transactions.csv transactions.parquet
+
+import argparse
+import gzip
+import io
+import os
+import numpy as np
+import pandas as pd
+
+
+# Column layout of the transactions file
+COLUMNS = ['Date', 'Mode', 'Category', 'Sub Category', 'Income/Expense', 'Amount', 'Notes']
+
+# Column holding each transaction's stable ID; written first in the data file
+# and used as the DataFrame index
+ID_COLUMN = 'ID'
+
+# Label columns with few distinct values, stored as pandas categoricals:
+# one small dictionary of labels per column plus an integer code per row
+CATEGORICAL_COLUMNS = ['Mode', 'Category', 'Sub Category', 'Income/Expense']
+
+# Columns an imported file must have (Notes is optional)
+REQUIRED_COLUMNS = COLUMNS[:-1]
+
+# Valid values of the Income/Expense column
+TRANSACTION_TYPES = ('Income', 'Expense')
+
+# Explicit dtypes for parsing the CSV so pandas never has to guess column types
+CSV_DTYPES = {
+    'ID': 'int64',
+    'Mode': 'category',
+    'Category': 'category',
+    'Sub Category': 'category',
+    'Income/Expense': 'category',
+    'Amount': 'float64',
+    'Notes': str
+}
+
+
+def to_cents(amounts):
+    """
+    Convert dollar amounts to whole int64 cents (rounded to the nearest cent).
+
+    Args:
+        amounts (array-like): Amounts in dollars
+
+    Returns:
+        numpy.ndarray: Amounts in cents
+    """
+    return np.rint(np.asarray(amounts, dtype='float64') * 100).astype(np.int64)
+
+
+def normalize_frame(df):
+    """
+    Bring a DataFrame into the tracker's schema.
+
+    Adds missing columns, fills empty text fields, and casts every column to
+    its storage dtype (datetime64 dates, float64 amounts, categorical labels).
+    A missing Sub Category becomes the empty label.
+    Amounts are rounded to whole cents, so every Amount is exactly cents / 100
+    and converts back to integer cents without loss. An ID column becomes the index.
+
+    Args:
+        df (pandas.DataFrame): Raw transaction rows
+
+    Returns:
+        pandas.DataFrame: Rows with the tracker's columns and dtypes
+    """
+    if ID_COLUMN in df.columns:
+        df = df.set_index(ID_COLUMN)
+
+    # Add Notes column if it doesn't exist (backward compatibility)
+    if 'Notes' not in df.columns:
+        df['Notes'] = ''
+
+    df = df[COLUMNS]
+    df = df.assign(
+        Date=pd.to_datetime(df['Date'], format='%Y-%m-%d').astype('datetime64[ns]'),
+        Amount=to_cents(df['Amount']) / 100
+    )
+    df['Notes'] = df['Notes'].fillna('').astype(str)
+    for col in CATEGORICAL_COLUMNS:
+        if not isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype('category')
+
+    sub_categories = df['Sub Category']
+    if sub_categories.hasnans:
+        if '' not in sub_categories.cat.categories:
+            sub_categories = sub_categories.cat.add_categories([''])
+        df['Sub Category'] = sub_categories.fillna('')
+    return df
+
+
+def has_ids(df):
+    """
+    Check whether a DataFrame is indexed by usable transaction IDs.
+
+    Args:
+        df (pandas.DataFrame): Transaction rows
+
+    Returns:
+        bool: True if the index is named ID and holds unique, increasing integers
+    """
+    ids = df.index
+    return (ids.name == ID_COLUMN and pd.api.types.is_integer_dtype(ids.dtype) and
+            ids.is_unique and ids.is_monotonic_increasing)
+
+
+def validate_frame(df):
+    """
+    Check imported rows and bring them into the tracker's schema.
+
+    Args:
+        df (pandas.DataFrame): Raw rows, e.g. one chunk of a bank export
+
+    Returns:
+        pandas.DataFrame: Rows with the tracker's columns and dtypes
+
+    Raises:
+        ValueError: If columns are missing, or a row has no date or amount,
+            an unparsable date, or a type other than Income/Expense
+    """
+    missing = [col for col in REQUIRED_COLUMNS if col not in df.columns]
+    if missing:
+        raise ValueError(f"Missing columns: {', '.join(missing)}")
+
+    invalid = (df['Date'].isna() | pd.to_numeric(df['Amount'], errors='coerce').isna() |
+               ~df['Income/Expense'].isin(TRANSACTION_TYPES))
+    if invalid.any():
+        raise ValueError(f"Invalid transaction in row {invalid.idxmax() + 1}: "
+                         "needs a date, an amount and a type of Income or Expense")
+    return normalize_frame(df)
+
+
+class CSVStorage:
+    """
+    Plain-text CSV storage. The only backend that supports appending rows.
+    """
+
+    extensions = ('.csv',)
+    supports_append = True
+
+    def __init__(self, path):
+        """
+        Args:
+            path (str): Path of the data file
+        """
+        self.path = path
+
+    def read(self, columns=None):
+        """
+        Read transactions from the file.
+
+        Args:
+            columns (list): Optional subset of columns to load
+
+        Returns:
+            pandas.DataFrame: Raw rows (not yet normalized)
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+        """
+        dtypes = {col: dtype for col, dtype in CSV_DTYPES.items()
+                  if columns is None or col in columns}
+        return pd.read_csv(self.path, dtype=dtypes, usecols=columns)
+
+    def columns(self):
+        """
+        Read the column names of the file without loading any rows.
+
+        Returns:
+            list: Column names in file order
+        """
+        return list(pd.read_csv(self.path, nrows=0).columns)
+
+    def read_chunks(self, chunksize):
+        """
+        Read the file a chunk of rows at a time, so it never has to fit in memory.
+
+        Args:
+            chunksize (int): Number of rows per chunk
+
+        Yields:
+            tuple: (raw rows of the chunk, bytes of the file read so far)
+        """
+        with open(self.path, 'rb') as file:
+            for chunk in pd.read_csv(file, dtype=CSV_DTYPES, chunksize=chunksize):
+                yield chunk, file.tell()
+
+    def write(self, df):
+        """
+        Replace the file with the given rows.
+        Writes to a temporary file first so a crash never leaves a half-written ledger.
+
+        Args:
+            df (pandas.DataFrame): All transactions
+        """
+        temp_file = self.path + '.tmp'
+        with open(temp_file, 'w', newline='') as file:
+            self._write_rows(df, file, header=True)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_file, self.path)
+
+    def append(self, df, sync=False):
+        """
+        Append rows to the end of the file.
+
+        Args:
+            df (pandas.DataFrame): New transactions
+            sync (bool): If True, fsync the file afterwards
+        """
+        with open(self.path, 'a', newline='') as file:
+            self._write_rows(df, file, header=False)
+            file.flush()
+            if sync:
+                os.fsync(file.fileno())
+
+    def sync(self):
+        """
+        Force appended data onto disk.
+        """
+        if os.path.exists(self.path):
+            with open(self.path, 'a') as file:
+                os.fsync(file.fileno())
+
+    def size(self):
+        """
+        Returns:
+            int: File size in bytes, or None if the file does not exist
+        """
+        try:
+            return os.path.getsize(self.path)
+        except OSError:
+            return None
+
+    def can_append(self):
+        """
+        Check that the file ends with a line break, so appended rows start on a new line.
+
+        Returns:
+            bool: True if rows can be appended safely
+        """
+        with open(self.path, 'rb') as file:
+            file.seek(0, os.SEEK_END)
+            if file.tell() == 0:
+                return False
+            file.seek(-1, os.SEEK_END)
+            return file.read(1) == b'\n'
+
+    def _write_rows(self, df, file, header):
+        """
+        Write rows in the CSV layout to an open file.
+        """
+        df.to_csv(file, header=header, index=False, date_format='%Y-%m-%d')
+
+
+class FeatherStorage(CSVStorage):
+    """
+    Feather (Arrow IPC) storage: binary, columnar, fast to read and write.
+    Requires pyarrow. The file is rewritten on every save.
+    """
+
+    extensions = ('.feather', '.arrow', '.ipc')
+    supports_append = False
+
+    def read(self, columns=None):
+        """
+        Read transactions from the file.
+
+        Args:
+            columns (list): Optional subset of columns to load
+
+        Returns:
+            pandas.DataFrame: Raw rows (not yet normalized)
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+        """
+        if not os.path.exists(self.path):
+            raise FileNotFoundError(self.path)
+        return pd.read_feather(self.path, columns=columns)
+
+    def columns(self):
+        """
+        Read the column names from the file's schema.
+
+        Returns:
+            list: Column names in file order
+        """
+        import pyarrow as pa
+        with pa.ipc.open_file(self.path) as reader:
+            return list(reader.schema.names)
+
+    def write(self, df):
+        """
+        Replace the file with the given rows (via a synced temporary file).
+
+        Args:
+            df (pandas.DataFrame): All transactions
+        """
+        temp_file = self.path + '.tmp'
+        with open(temp_file, 'wb') as file:
+            self._write_file(df.reset_index(drop=True), file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_file, self.path)
+
+    def append(self, df, sync=False):
+        """
+        Columnar files cannot be appended to; callers check supports_append
+        and rewrite the whole file with write() instead.
+
+        Raises:
+            io.UnsupportedOperation: Always
+        """
+        raise io.UnsupportedOperation(
+            f"{type(self).__name__} cannot append rows to {self.path}; rewrite it with write()")
+
+    def can_append(self):
+        """
+        Returns:
+            bool: Always False, the file is rewritten on every save
+        """
+        return False
+
+    def _write_file(self, df, file):
+        """
+        Write all rows to an open binary file in this backend's format.
+        """
+        df.to_feather(file)
+
+
+class ParquetStorage(FeatherStorage):
+    """
+    Parquet storage: binary, columnar and compressed, the smallest files.
+    Requires pyarrow. The file is rewritten on every save.
+    """
+
+    extensions = ('.parquet', '.pq')
+
+    def read(self, columns=None):
+        """
+        Read transactions from the file.
+
+        Args:
+            columns (list): Optional subset of columns to load
+
+        Returns:
+            pandas.DataFrame: Raw rows (not yet normalized)
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+        """
+        if not os.path.exists(self.path):
+            raise FileNotFoundError(self.path)
+        return pd.read_parquet(self.path, columns=columns)
+
+    def columns(self):
+        """
+        Read the column names from the file's schema.
+
+        Returns:
+            list: Column names in file order
+        """
+        import pyarrow.parquet as pq
+        return list(pq.read_schema(self.path).names)
+
+    def _write_file(self, df, file):
+        """
+        Write all rows to an open binary file in this backend's format.
+        """
+        df.to_parquet(file, index=False)
+
+
+STORAGE_BACKENDS = [CSVStorage, FeatherStorage, ParquetStorage]
+
+
+class TombstoneLog:
+    """
+    Append-only file of the IDs of deleted transactions (int64, native byte order).
+
+    Deleting only appends to this log, so the ledger itself is not rewritten;
+    rows whose ID is in the log are skipped on load. Compacting the ledger
+    empties the log, keeping at most the highest ID ever handed out when no
+    row of the ledger has it, so that ID (and every ID below it) is never
+    handed out again.
+    """
+
+    def __init__(self, path):
+        """
+        Args:
+            path (str): Path of the log file
+        """
+        self.path = path
+
+    def read(self):
+        """
+        Read the deleted IDs, ignoring a record a crash left half-written.
+
+        Returns:
+            numpy.ndarray: Deleted IDs (int64), empty if there is no log
+        """
+        try:
+            size = os.path.getsize(self.path)
+        except OSError:
+            return np.empty(0, dtype=np.int64)
+        return np.fromfile(self.path, dtype=np.int64, count=size // 8)
+
+    def append(self, ids, sync=False):
+        """
+        Add deleted IDs to the end of the log.
+
+        Args:
+            ids (array-like): IDs of the deleted transactions
+            sync (bool): If True, fsync the file afterwards
+        """
+        with open(self.path, 'ab') as file:
+            # Drop a half-written record so the new ones stay aligned
+            if file.tell() % 8:
+                file.truncate(file.tell() - file.tell() % 8)
+            file.write(np.asarray(ids, dtype=np.int64).tobytes())
+            file.flush()
+            if sync:
+                os.fsync(file.fileno())
+
+    def replace(self, ids):
+        """
+        Replace the whole log atomically (via a synced temporary file).
+
+        Args:
+            ids (array-like): IDs the new log holds
+        """
+        temp_file = self.path + '.tmp'
+        with open(temp_file, 'wb') as file:
+            file.write(np.asarray(ids, dtype=np.int64).tobytes())
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_file, self.path)
+
+    def sync(self):
+        """
+        Force appended IDs onto disk.
+        """
+        if os.path.exists(self.path):
+            with open(self.path, 'ab') as file:
+                os.fsync(file.fileno())
+
+    def remove(self):
+        """
+        Delete the log (after the ledger was rewritten without the deleted rows).
+        """
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+class CSVExport:
+    """
+    Streaming CSV export: rows are written a chunk at a time to a temporary
+    file that replaces the target once the export is complete.
+    Use as a context manager; an export that fails leaves no partial file behind.
+    """
+
+    extensions = ('.csv',)
+
+    def __init__(self, path):
+        """
+        Args:
+            path (str): Path of the export file
+        """
+        self.path = path
+        self.temp_file = path + '.tmp'
+        self.rows = 0
+        self._file = None
+
+    def __enter__(self):
+        self._file = self._open(self.temp_file)
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        if exc_type is None:
+            if self.rows == 0:
+                self.write(normalize_frame(pd.DataFrame(columns=COLUMNS)))  # Header only
+            self._close()
+            os.replace(self.temp_file, self.path)
+        else:
+            self._close()
+            if os.path.exists(self.temp_file):
+                os.remove(self.temp_file)
+
+    def _open(self, path):
+        """
+        Open the temporary file for writing.
+        """
+        return open(path, 'w', newline='', encoding='utf-8')
+
+    def _close(self):
+        """
+        Close the temporary file.
+        """
+        self._file.close()
+
+    def write(self, df):
+        """
+        Append one chunk of rows to the export.
+
+        Args:
+            df (pandas.DataFrame): Rows in the tracker's schema
+        """
+        df.to_csv(self._file, header=self.rows == 0, index=False, date_format='%Y-%m-%d')
+        self.rows += len(df)
+
+
+class GzipCSVExport(CSVExport):
+    """
+    Streaming gzip-compressed CSV export.
+    """
+
+    extensions = ('.csv.gz', '.gz')
+
+    def _open(self, path):
+        return gzip.open(path, 'wt', newline='', encoding='utf-8')
+
+
+class JSONLinesExport(CSVExport):
+    """
+    Streaming JSON Lines export: one JSON object per transaction and line.
+    """
+
+    extensions = ('.jsonl', '.ndjson')
+
+    def write(self, df):
+        if df.empty:
+            return  # No header in JSON Lines; pandas would write a blank line
+        df = df[COLUMNS].assign(Date=df['Date'].dt.strftime('%Y-%m-%d'))
+        df.to_json(self._file, orient='records', lines=True, force_ascii=False)
+        self.rows += len(df)
+
+
+class ParquetExport(CSVExport):
+    """
+    Streaming Parquet export: every chunk becomes a row group.
+    Label columns are written as strings with one schema for all chunks
+    (Parquet dictionary-encodes them in the file anyway). Requires pyarrow.
+    """
+
+    extensions = ('.parquet', '.pq')
+
+    def _open(self, path):
+        return None  # The Parquet writer needs the schema of the first chunk
+
+    def _close(self):
+        if self._file is not None:
+            self._file.close()
+
+    def write(self, df):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        schema = pa.schema([(col, pa.timestamp('ns') if col == 'Date' else
+                             pa.float64() if col == 'Amount' else pa.string())
+                            for col in COLUMNS])
+        table = pa.Table.from_pandas(df[COLUMNS], schema=schema, preserve_index=False)
+        if self._file is None:
+            self._file = pq.ParquetWriter(self.temp_file, schema)
+        self._file.write_table(table)
+        self.rows += len(df)
+
+
+EXPORT_FORMATS = [GzipCSVExport, JSONLinesExport, ParquetExport, CSVExport]
+
+
+def get_exporter(path):
+    """
+    Pick the export format for a file from its extension (CSV by default).
+
+    Args:
+        path (str): Path of the export file
+
+    Returns:
+        CSVExport: Export object for the file
+    """
+    name = path.lower()
+    for export_format in EXPORT_FORMATS:
+        if name.endswith(export_format.extensions):
+            return export_format(path)
+    return CSVExport(path)
+
+
+def get_storage(path):
+    """
+    Pick the storage backend for a file from its extension (CSV by default).
+
+    Args:
+        path (str): Path of the data file
+
+    Returns:
+        CSVStorage: Storage object for the file
+    """
+    extension = os.path.splitext(path)[1].lower()
+    for backend in STORAGE_BACKENDS:
+        if extension in backend.extensions:
+            return backend(path)
+    return CSVStorage(path)
+
+
+def deletion_log_path(path):
+    """
+    Get the path of the deletion log belonging to a data file.
+
+    Args:
+        path (str): Path of the data file
+
+    Returns:
+        str: Path of its TombstoneLog
+    """
+    return path + '.deleted'
+
+
+def read_ledger(path):
+    """
+    Read a whole ledger without the transactions its deletion log marks deleted.
+
+    Args:
+        path (str): Path of the data file
+
+    Returns:
+        pandas.DataFrame: Rows in the tracker's schema
+    """
+    df = normalize_frame(get_storage(path).read())
+    if has_ids(df):
+        deleted = TombstoneLog(deletion_log_path(path)).read()
+        if len(deleted):
+            df = df[~df.index.isin(deleted)]
+    return df
+
+
+def load_columns(path, columns):
+    """
+    Load only some columns of a ledger, e.g. Date/Category/Amount for analytics.
+    Columnar backends (Feather, Parquet) skip the other columns entirely.
+
+    Args:
+        path (str): Path of the data file
+        columns (list): Columns to load
+
+    Returns:
+        pandas.DataFrame: The requested columns
+    """
+    # Deleted rows are filtered out by ID; a stray log next to a file
+    # without IDs (only files with IDs get one) is ignored
+    storage = get_storage(path)
+    deleted = TombstoneLog(deletion_log_path(path)).read()
+    if len(deleted) and ID_COLUMN not in storage.columns():
+        deleted = deleted[:0]
+    df = storage.read(list(columns) + [ID_COLUMN] if len(deleted) else columns)
+    if len(deleted):
+        df = df[~df[ID_COLUMN].isin(deleted)].drop(columns=ID_COLUMN)
+    if 'Date' in df.columns:
+        df['Date'] = pd.to_datetime(df['Date'], format='%Y-%m-%d')
+    return df
+
+
+def migrate(source, target):
+    """
+    Copy a ledger into another storage format, e.g. transactions.csv to transactions.parquet.
+
+    Args:
+        source (str): Existing data file
+        target (str): New data file; its extension selects the format
+
+    Returns:
+        int: Number of transactions copied
+    """
+    df = read_ledger(source)
+    get_storage(target).write(df.reset_index())
+    return len(df)
+
+
+def main():
+    """
+    Command line entry point for one-shot migrations.
+    """
+    parser = argparse.ArgumentParser(description="Convert a transactions file to another format")
+    parser.add_argument('source', help="existing data file (e.g. transactions.csv)")
+    parser.add_argument('target', help="new data file (.csv, .feather/.arrow or .parquet)")
+    args = parser.parse_args()
+
+    count = migrate(args.source, args.target)
+    print(f"Copied {count} transactions from {args.source} to {args.target}")
+
+
+if __name__ == "__main__":
+    main()
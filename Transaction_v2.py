@@ -12,6 +12,9 @@ class Transaction:
     Enhanced version with validation and additional methods.
     """
 
+    # No per-instance __dict__: a transaction takes about a third of the memory
+    __slots__ = ('date', 'mode', 'category', 'sub_category', 'trans_type', 'amount_cents', 'notes')
+
     def __init__(self, date, mode, category, sub_category, trans_type, amount, notes=""):
         """
         Initialize a Transaction object.
@@ -22,7 +25,7 @@ class Transaction:
             category (str): Main category (e.g., "Food", "Transportation")
             sub_category (str): Detailed subcategory (e.g., "Dinner", "Bus fare")
             trans_type (str): Either "Income" or "Expense"
-            amount (float): Transaction amount
+            amount (float): Transaction amount, stored as whole cents
             notes (str): Optional notes about the transaction
         """
         self.date = date
@@ -30,9 +33,29 @@ class Transaction:
         self.category = category
         self.sub_category = sub_category
         self.trans_type = trans_type  # Income or Expense
-        self.amount = float(amount)
+        self.amount = amount
         self.notes = notes
 
+    @property
+    def amount(self):
+        """
+        Transaction amount in dollars.
+
+        Returns:
+            float: amount_cents / 100
+        """
+        return self.amount_cents / 100
+
+    @amount.setter
+    def amount(self, value):
+        """
+        Set the amount, rounded to the nearest cent.
+
+        Args:
+            value (float): Amount in dollars
+        """
+        self.amount_cents = int(round(float(value) * 100))
+
     def to_dict(self):
         """
         Convert transaction to dictionary format for easy storage and processing.
@@ -0,0 +1,167 @@
+# VirtualTreeview_v2.py
+# Authors: Group 3 - Vanshika Kukreja, Miloni Mehta
+# Date: October 17, 2026
+# Description: Virtual (windowed) ttk.Treeview that only materializes the visible rows of large lists
+
+import tkinter as tk
+from tkinter import ttk
+
+
+class VirtualTreeview:
+    """
+    A ttk.Treeview that shows a window over a long list of rows.
+
+    The widget keeps one Treeview item per visible line and rewrites their values
+    while scrolling, so showing 10 or 10 million rows costs the same. Rows are
+    pulled from a fetch callback in blocks (the visible window plus a buffer on
+    each side), so small scrolls do not call back into the data source.
+    """
+
+    def __init__(self, parent, columns, height=15, buffer=50):
+        """
+        Create the tree and its scrollbar inside a parent widget.
+
+        Args:
+            parent: Parent tkinter widget
+            columns (tuple): Column names
+            height (int): Initial number of visible rows
+            buffer (int): Extra rows fetched above and below the visible window
+        """
+        self.tree = ttk.Treeview(parent, columns=columns, show='headings', height=height)
+        # The scrollbar tracks the position in the whole list, not in the Treeview items
+        self.scrollbar = ttk.Scrollbar(parent, orient=tk.VERTICAL, command=self._on_scrollbar)
+
+        self.buffer = buffer
+        self.visible = height
+        self.first = 0  # Index of the first visible row
+        self.count = 0
+        self._fetch = lambda start, stop: []
+        self._cache_start = 0
+        self._cache = []
+        self._slots = []  # Treeview item ids, one per visible line
+
+        self.tree.bind('<Configure>', self._on_resize)
+        self.tree.bind('<MouseWheel>', self._on_mousewheel)  # Windows and macOS
+        self.tree.bind('<Button-4>', lambda event: self.scroll(-3))  # Linux
+        self.tree.bind('<Button-5>', lambda event: self.scroll(3))
+
+    def pack(self):
+        """
+        Pack the tree and scrollbar side by side, filling the parent.
+        """
+        self.tree.pack(side=tk.LEFT, fill='both', expand=True)
+        self.scrollbar.pack(side=tk.RIGHT, fill='y')
+
+    def set_rows(self, count, fetch):
+        """
+        Show a new list of rows, starting from the top.
+
+        Args:
+            count (int): Total number of rows
+            fetch: Function (start, stop) returning the value tuples of rows start..stop-1
+        """
+        self.count = count
+        self._fetch = fetch
+        self._cache = []
+        self._cache_start = 0
+        self.first = 0
+        self._render()
+
+    def row_index(self, item):
+        """
+        Get the list index of a Treeview item (for example the selection).
+
+        Args:
+            item (str): Treeview item id
+
+        Returns:
+            int: Index of the row in the list, or None if the item is not a row
+        """
+        if item not in self._slots:
+            return None
+        index = self.first + self._slots.index(item)
+        return index if index < self.count else None
+
+    def scroll(self, lines):
+        """
+        Scroll by a number of rows (negative scrolls up).
+
+        Args:
+            lines (int): Rows to scroll
+        """
+        self.scroll_to(self.first + lines)
+
+    def scroll_to(self, first):
+        """
+        Make a given row the first visible row.
+
+        Args:
+            first (int): Row index
+        """
+        first = max(0, min(first, self.count - self.visible))
+        if first != self.first:
+            self.first = first
+            self._render()
+
+    def _rows(self, start, stop):
+        """
+        Get rows start..stop-1, refilling the cached block only when needed.
+        """
+        cache_stop = self._cache_start + len(self._cache)
+        if start < self._cache_start or stop > cache_stop:
+            self._cache_start = max(0, start - self.buffer)
+            self._cache = list(self._fetch(self._cache_start, min(self.count, stop + self.buffer)))
+        offset = start - self._cache_start
+        return self._cache[offset:offset + (stop - start)]
+
+    def _render(self):
+        """
+        Write the visible rows into the Treeview items.
+        """
+        rows = self._rows(self.first, min(self.count, self.first + self.visible))
+
+        # Keep exactly one item per visible row
+        while len(self._slots) < len(rows):
+            self._slots.append(self.tree.insert('', tk.END, values=()))
+        while len(self._slots) > len(rows):
+            self.tree.delete(self._slots.pop())
+
+        for item, values in zip(self._slots, rows):
+            self.tree.item(item, values=values)
+
+        if self.count:
+            self.scrollbar.set(self.first / self.count,
+                               min(1.0, (self.first + self.visible) / self.count))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def _on_scrollbar(self, action, amount, unit=None):
+        """
+        Handle scrollbar drags and arrow/trough clicks.
+        """
+        if action == 'moveto':
+            self.scroll_to(int(float(amount) * self.count))
+        elif unit == 'pages':
+            self.scroll(int(amount) * self.visible)
+        else:
+            self.scroll(int(amount))
+
+    def _on_mousewheel(self, event):
+        """
+        Scroll with the mouse wheel.
+        """
+        step = event.delta if abs(event.delta) < 120 else event.delta // 120
+        self.scroll(-step * 3)
+        return 'break'
+
+    def _on_resize(self, event):
+        """
+        Recompute how many rows fit after the tree is resized.
+        """
+        style = ttk.Style()
+        row_height = int(style.lookup('Treeview', 'rowheight') or 20)
+        visible = max(1, (event.height - row_height) // row_height)
+        if visible != self.visible:
+            self.visible = visible
+            self.first = max(0, min(self.first, self.count - self.visible))
+            self._render()
@@ -0,0 +1,741 @@
+# benchmark_finance_tracker_v2.py
+# Authors: Group 3 - Vanshika Kukreja, Miloni Mehta
+# Date: October 17, 2026
+# Description: Performance benchmarks for the FinanceTracker data layer on large synthetic ledgers.
+# Run: python benchmark_finance_tracker_v2.py [load append ...] --rows 10000 1000000 10000000
+
+import argparse
+import multiprocessing
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from FinanceTracker_v2 import FinanceTracker, COLUMNS
+from Transaction_v2 import Transaction
+from Storage_v2 import load_columns, migrate
+from SQLiteTracker_v2 import SQLiteFinanceTracker, import_ledger
+import MappedTracker_v2
+from Snapshot_v2 import read_snapshot
+
+try:
+    import resource  # Not available on Windows
+except ImportError:
+    resource = None
+
+
+MODES = ["Cash", "Card", "Online", "Bank Transfer"]
+CATEGORIES = ["Food", "Transportation", "Household", "Entertainment", "Other", "Allowance"]
+SUB_CATEGORIES = ["Lunch", "Dinner", "Bus fare", "Groceries", "Movie ticket", "Coffee", "Rent"]
+
+
+def make_ledger(rows, seed=0):
+    """
+    Build a synthetic ledger with realistic column values.
+
+    Args:
+        rows (int): Number of transactions
+        seed (int): Random seed so runs are reproducible
+
+    Returns:
+        pandas.DataFrame: Ledger in the tracker's column layout, sorted by date
+    """
+    rng = np.random.default_rng(seed)
+    days = np.sort(rng.integers(0, 3650, rows))
+    is_income = rng.random(rows) < 0.1
+    return pd.DataFrame({
+        'Date': (np.datetime64('2016-01-01') + days).astype(str),
+        'Mode': np.array(MODES)[rng.integers(0, len(MODES), rows)],
+        'Category': np.where(is_income, "Allowance",
+                             np.array(CATEGORIES[:-1])[rng.integers(0, 5, rows)]),
+        'Sub Category': np.array(SUB_CATEGORIES)[rng.integers(0, len(SUB_CATEGORIES), rows)],
+        'Income/Expense': np.where(is_income, "Income", "Expense"),
+        'Amount': rng.integers(100, 50000, rows) / 100,
+        'Notes': np.where(rng.random(rows) < 0.5, "", "note"),
+    }, columns=COLUMNS)
+
+
+def write_ledger(directory, rows):
+    """
+    Write a synthetic ledger CSV into a directory.
+
+    Args:
+        directory (str): Target directory
+        rows (int): Number of transactions
+
+    Returns:
+        str: Path of the written CSV file
+    """
+    path = os.path.join(directory, f"ledger_{rows}.csv")
+    make_ledger(rows).to_csv(path, index=False)
+    return path
+
+
+def peak_rss_mb():
+    """
+    Get the peak resident set size of the current process.
+
+    Returns:
+        float: Peak RSS in MB, or NaN where the resource module is unavailable
+    """
+    # VmHWM is reset on exec, unlike ru_maxrss which a spawned child inherits
+    if os.path.exists('/proc/self/status'):
+        with open('/proc/self/status') as status:
+            for line in status:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) / 1024
+    if resource is None:
+        return float('nan')
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def _child(queue, func, args):
+    """
+    Time one benchmark function inside a fresh process.
+    """
+    start = time.perf_counter()
+    func(*args)
+    queue.put((time.perf_counter() - start, peak_rss_mb()))
+
+
+def run_isolated(func, *args):
+    """
+    Run a function in a separate process so its peak RSS is measured in isolation.
+
+    Args:
+        func: Module-level function to run
+        *args: Arguments passed to the function
+
+    Returns:
+        tuple: (elapsed seconds, peak RSS in MB)
+    """
+    context = multiprocessing.get_context('spawn')
+    queue = context.Queue()
+    process = context.Process(target=_child, args=(queue, func, args))
+    process.start()
+    result = queue.get()
+    process.join()
+    return result
+
+
+def legacy_load(path):
+    """
+    Original row-by-row loader (iterrows into Transaction objects), kept for comparison.
+
+    Args:
+        path (str): CSV file to load
+
+    Returns:
+        list: Transaction objects for every row
+    """
+    df = pd.read_csv(path)
+    transactions = []
+    for _, row in df.iterrows():
+        transactions.append(Transaction(
+            date=row['Date'],
+            mode=row['Mode'],
+            category=row['Category'],
+            sub_category=row['Sub Category'],
+            trans_type=row['Income/Expense'],
+            amount=row['Amount'],
+            notes=row.get('Notes', '')
+        ))
+    return transactions
+
+
+def bulk_load(path):
+    """
+    Current loader: typed read_csv with a lazy transaction view.
+
+    Args:
+        path (str): CSV file to load
+
+    Returns:
+        FinanceTracker: Loaded tracker
+    """
+    return FinanceTracker(path)
+
+
+def bench_load(rows_list, directory):
+    """
+    Compare load time and peak RSS of the legacy and current loaders.
+    """
+    print(f"{'rows':>10} | {'legacy s':>9} | {'legacy MB':>9} | {'bulk s':>8} | {'bulk MB':>8}")
+    for rows in rows_list:
+        path = write_ledger(directory, rows)
+        legacy_s, legacy_mb = run_isolated(legacy_load, path)
+        bulk_s, bulk_mb = run_isolated(bulk_load, path)
+        print(f"{rows:>10} | {legacy_s:>9.2f} | {legacy_mb:>9.1f} | {bulk_s:>8.2f} | {bulk_mb:>8.1f}")
+
+
+def _empty_tracker(directory):
+    """
+    Create a tracker on an empty CSV file (no sample data).
+
+    Args:
+        directory (str): Directory for the CSV file
+
+    Returns:
+        FinanceTracker: Empty tracker
+    """
+    path = os.path.join(directory, "empty.csv")
+    pd.DataFrame(columns=COLUMNS).to_csv(path, index=False)
+    return FinanceTracker(path)
+
+
+def _ledger_rows(rows):
+    """
+    Synthetic ledger rows as tuples in add_transaction argument order.
+    """
+    return list(make_ledger(rows).itertuples(index=False, name=None))
+
+
+def bench_append(rows_list, directory, legacy_limit=50000):
+    """
+    Compare the original df.loc growth with buffered add_transaction and add_transactions.
+    The quadratic legacy path is skipped above legacy_limit rows.
+    """
+    print(f"{'rows':>10} | {'legacy s':>9} | {'add_transaction s':>17} | {'add_transactions s':>18}")
+    for rows in rows_list:
+        ledger = _ledger_rows(rows)
+
+        legacy = "skipped"
+        if rows <= legacy_limit:
+            df = pd.DataFrame(columns=COLUMNS)
+            start = time.perf_counter()
+            for values in ledger:
+                df.loc[len(df)] = Transaction(*values).to_dict()
+            legacy = f"{time.perf_counter() - start:.2f}"
+
+        tracker = _empty_tracker(directory)
+        start = time.perf_counter()
+        for values in ledger:
+            tracker.add_transaction(*values)
+        len(tracker.df)
+        single = time.perf_counter() - start
+
+        tracker = _empty_tracker(directory)
+        start = time.perf_counter()
+        tracker.add_transactions(ledger)
+        bulk = time.perf_counter() - start
+
+        print(f"{rows:>10} | {legacy:>9} | {single:>17.2f} | {bulk:>18.2f}")
+
+
+def bench_save(rows_list, directory, saves=20):
+    """
+    Compare the latency of saving after one new transaction in append-only
+    mode with a full rewrite of the file.
+    """
+    print(f"{'rows':>10} | {'rewrite ms':>10} | {'append ms':>10}")
+    for rows in rows_list:
+        path = write_ledger(directory, rows)
+        timings = []
+        for append_only in (False, True):
+            tracker = FinanceTracker(path, append_only=append_only)
+            tracker.save_data()
+            start = time.perf_counter()
+            for _ in range(saves):
+                tracker.add_transaction("2026-01-01", "Cash", "Food", "Lunch", "Expense", 10.0)
+                tracker.save_data()
+            tracker.sync()
+            timings.append((time.perf_counter() - start) / saves * 1000)
+        print(f"{rows:>10} | {timings[0]:>10.2f} | {timings[1]:>10.2f}")
+
+
+def bench_range(rows_list, directory, queries=200):
+    """
+    Compare 30-day range query latency of a full boolean-mask scan with the
+    sorted date index (ranged total and matching rows). The ranged total
+    should stay flat as rows grow.
+    """
+    print(f"{'rows':>10} | {'scan ms':>8} | {'index ms':>8} | {'index rows ms':>13}")
+    rng = np.random.default_rng(1)
+    for rows in rows_list:
+        tracker = FinanceTracker(write_ledger(directory, rows))
+        df = tracker.df
+        tracker.filter_by_date_range("2016-01-01", "2016-01-31")  # Build the index once
+
+        starts = np.datetime64('2016-01-01') + rng.integers(0, 3600, queries)
+        ranges = [(str(day), str(day + 30)) for day in starts]
+
+        start = time.perf_counter()
+        for low, high in ranges:
+            df[(df['Date'] >= low) & (df['Date'] <= high)]
+        scan = (time.perf_counter() - start) / queries * 1000
+
+        start = time.perf_counter()
+        for low, high in ranges:
+            tracker.get_total_expenses(low, high)
+        index = (time.perf_counter() - start) / queries * 1000
+
+        # Returning the rows adds O(k) for the k matches on top of the search
+        start = time.perf_counter()
+        for low, high in ranges:
+            tracker.filter_by_date_range(low, high)
+        rows_ms = (time.perf_counter() - start) / queries * 1000
+        print(f"{rows:>10} | {scan:>8.3f} | {index:>8.3f} | {rows_ms:>13.3f}")
+
+
+def bench_search(rows_list, directory, keywords=("groc", "bus fare", "coffee note", "xyz")):
+    """
+    Compare keyword search latency of the original lower-case scan with the
+    keyword index (index build time reported separately).
+    """
+    print(f"{'rows':>10} | {'scan ms':>8} | {'build s':>8} | {'index ms':>8}")
+    for rows in rows_list:
+        tracker = FinanceTracker(write_ledger(directory, rows))
+        df = tracker.df
+
+        start = time.perf_counter()
+        for keyword in keywords:
+            df[df['Sub Category'].str.lower().str.contains(keyword, na=False) |
+               df['Notes'].str.lower().str.contains(keyword, na=False)]
+        scan = (time.perf_counter() - start) / len(keywords) * 1000
+
+        start = time.perf_counter()
+        tracker.search_transactions("warm up")
+        build = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for keyword in keywords:
+            tracker._search_index.search(keyword)
+        index = (time.perf_counter() - start) / len(keywords) * 1000
+        print(f"{rows:>10} | {scan:>8.2f} | {build:>8.2f} | {index:>8.3f}")
+
+
+def _timed_load(path):
+    """
+    Load a tracker and return it with the load time in seconds.
+    """
+    start = time.perf_counter()
+    tracker = FinanceTracker(path)
+    return tracker, time.perf_counter() - start
+
+
+def bench_storage(rows_list, directory, formats=('csv', 'feather', 'parquet')):
+    """
+    Compare load time, full save time, file size and projected analytics load
+    (Date/Category/Amount only) of the CSV, Feather and Parquet backends.
+    """
+    print(f"{'rows':>10} | {'format':>8} | {'load s':>7} | {'save s':>7} | "
+          f"{'size MB':>8} | {'3-col load s':>12}")
+    for rows in rows_list:
+        source = write_ledger(directory, rows)
+        for fmt in formats:
+            path = os.path.join(directory, f"ledger_{rows}.{fmt}")
+            if fmt != 'csv':
+                migrate(source, path)
+            tracker, load = _timed_load(path)
+
+            start = time.perf_counter()
+            tracker.compact()
+            save = time.perf_counter() - start
+
+            start = time.perf_counter()
+            load_columns(path, ['Date', 'Category', 'Amount'])
+            projected = time.perf_counter() - start
+
+            size = os.path.getsize(path) / 1e6
+            print(f"{rows:>10} | {fmt:>8} | {load:>7.2f} | {save:>7.2f} | "
+                  f"{size:>8.1f} | {projected:>12.2f}")
+
+
+def _analytics(tracker):
+    """
+    Run the dashboard's aggregate and filter queries once.
+    """
+    tracker.get_balance()
+    tracker.get_expense_by_category("2016-01-01", "2016-12-31")
+    tracker.get_monthly_summary()
+    tracker.filter_by_category("Transportation")
+
+
+def memory_queries(path):
+    """
+    Load a CSV ledger into the in-memory tracker and run the analytics queries.
+    """
+    _analytics(FinanceTracker(path))
+
+
+def sqlite_queries(path):
+    """
+    Open a SQLite ledger and run the analytics queries.
+    """
+    _analytics(SQLiteFinanceTracker(path))
+
+
+def bench_sqlite(rows_list, directory):
+    """
+    Compare time and peak RSS of opening a ledger and running the analytics
+    queries with the in-memory tracker and the SQLite tracker.
+    """
+    print(f"{'rows':>10} | {'memory s':>8} | {'memory MB':>9} | {'sqlite s':>8} | {'sqlite MB':>9}")
+    for rows in rows_list:
+        path = write_ledger(directory, rows)
+        db_file = os.path.join(directory, f"ledger_{rows}.db")
+        import_ledger(path, db_file)
+        memory_s, memory_mb = run_isolated(memory_queries, path)
+        sqlite_s, sqlite_mb = run_isolated(sqlite_queries, db_file)
+        print(f"{rows:>10} | {memory_s:>8.2f} | {memory_mb:>9.1f} | {sqlite_s:>8.2f} | {sqlite_mb:>9.1f}")
+
+
+def _aggregates(tracker):
+    """
+    Run the totals, category and monthly aggregates once.
+    """
+    tracker.get_balance()
+    tracker.get_expense_by_category()
+    tracker.get_expense_by_category("2016-01-01", "2016-12-31")
+    tracker.get_monthly_summary()
+
+
+def memory_aggregates(path):
+    """
+    Load a CSV ledger into the in-memory tracker and run the aggregates.
+    """
+    _aggregates(FinanceTracker(path))
+
+
+def mapped_aggregates(directory):
+    """
+    Open a column store and run the aggregates over the mapped columns.
+    """
+    _aggregates(MappedTracker_v2.MappedFinanceTracker(directory))
+
+
+def bench_mapped(rows_list, directory):
+    """
+    Compare time and peak RSS of the aggregates with the in-memory tracker and
+    the memory-mapped column store. The mapped tracker's RSS should stay flat
+    as rows grow.
+    """
+    print(f"{'rows':>10} | {'memory s':>8} | {'memory MB':>9} | {'mapped s':>8} | {'mapped MB':>9}")
+    for rows in rows_list:
+        path = write_ledger(directory, rows)
+        store = os.path.join(directory, f"ledger_{rows}.cols")
+        MappedTracker_v2.import_ledger(path, store)
+        memory_s, memory_mb = run_isolated(memory_aggregates, path)
+        mapped_s, mapped_mb = run_isolated(mapped_aggregates, store)
+        print(f"{rows:>10} | {memory_s:>8.2f} | {memory_mb:>9.1f} | {mapped_s:>8.2f} | {mapped_mb:>9.1f}")
+
+
+class DictTransaction(Transaction):
+    """
+    Transaction with a per-instance __dict__, as before __slots__ was added.
+    """
+
+
+def _traced_mb(build):
+    """
+    Measure the memory allocated by a function that builds some objects.
+
+    Returns:
+        float: MB still allocated by the objects it returns
+    """
+    tracemalloc.start()
+    objects = build()
+    allocated = tracemalloc.get_traced_memory()[0] / 1e6
+    tracemalloc.stop()
+    del objects
+    return allocated
+
+
+def bench_objects(rows_list, directory):
+    """
+    Report the memory per million transactions of a list of dict-based
+    Transaction objects (the original second copy of the ledger), a list of
+    slotted Transaction objects, and the lazy tracker.transactions view.
+    """
+    print(f"{'rows':>10} | {'dict MB/M':>9} | {'slots MB/M':>10} | {'view MB/M':>9}")
+    for rows in rows_list:
+        ledger = _ledger_rows(rows)
+        tracker = FinanceTracker(write_ledger(directory, rows))
+        per_million = 1e6 / rows
+
+        dict_mb = _traced_mb(lambda: [DictTransaction(*values) for values in ledger])
+        slots_mb = _traced_mb(lambda: [Transaction(*values) for values in ledger])
+        view_mb = _traced_mb(lambda: tracker.transactions)
+        print(f"{rows:>10} | {dict_mb * per_million:>9.1f} | {slots_mb * per_million:>10.1f} | "
+              f"{view_mb * per_million:>9.3f}")
+
+
+def whole_file_import(path, store):
+    """
+    Read a whole CSV ledger into memory and write it to a column store.
+    """
+    MappedTracker_v2.import_ledger(path, store)
+
+
+def streamed_import(path, store):
+    """
+    Stream a CSV ledger into an empty column store with import_csv.
+    """
+    os.makedirs(store)  # Existing empty store, no sample data
+    MappedTracker_v2.MappedFinanceTracker(store).import_csv(path)
+
+
+def bench_import(rows_list, directory):
+    """
+    Compare time and peak RSS of importing a CSV into a column store in one
+    piece and chunk by chunk with import_csv. The streamed import's RSS
+    should stay flat as rows grow.
+    """
+    print(f"{'rows':>10} | {'whole s':>7} | {'whole MB':>8} | {'stream s':>8} | {'stream MB':>9}")
+    for rows in rows_list:
+        path = write_ledger(directory, rows)
+        whole_s, whole_mb = run_isolated(whole_file_import, path,
+                                         os.path.join(directory, f"whole_{rows}.cols"))
+        stream_s, stream_mb = run_isolated(streamed_import, path,
+                                           os.path.join(directory, f"stream_{rows}.cols"))
+        print(f"{rows:>10} | {whole_s:>7.2f} | {whole_mb:>8.1f} | {stream_s:>8.2f} | {stream_mb:>9.1f}")
+
+
+def _timed_peak(func):
+    """
+    Time a function and measure its peak traced allocation.
+
+    Returns:
+        tuple: (elapsed seconds, peak MB)
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1] / 1e6
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def bench_export(rows_list, directory):
+    """
+    Compare a one-shot to_csv of a filtered copy (the original export) with the
+    streamed export in each format, for one category over the whole ledger.
+    """
+    formats = ['.csv', '.csv.gz', '.parquet', '.jsonl']
+    print(f"{'rows':>10} | {'one-shot s/MB':>15} | " +
+          " | ".join(f"{name + ' s/MB':>15}" for name in formats))
+    for rows in rows_list:
+        tracker = FinanceTracker(write_ledger(directory, rows))
+        target = os.path.join(directory, "export")
+        df = tracker.df
+
+        def one_shot():
+            df[df['Category'] == "Food"].to_csv(target + '.csv', index=False,
+                                                  date_format='%Y-%m-%d')
+
+        results = [_timed_peak(one_shot)]
+        for extension in formats:
+            results.append(_timed_peak(lambda: tracker.export(target + extension, category="Food")))
+        print(f"{rows:>10} | " + " | ".join(f"{s:>7.2f}/{mb:<7.1f}" for s, mb in results))
+
+
+def bench_charts(rows_list, directory):
+    """
+    Compare showing the three Analytics charts by building a new figure and
+    recomputing the data on every click (the original behaviour) with
+    updating the persistent charts in place after one new transaction.
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from ChartView_v2 import CHARTS
+
+    print(f"{'rows':>10} | {'rebuild s':>9} | {'in-place s':>10}")
+    for rows in rows_list:
+        tracker = FinanceTracker(write_ledger(directory, rows))
+        last_day = tracker.df['Date'].max()
+        queries = {
+            'category': tracker.get_expense_by_category,
+            'monthly': lambda: tracker.get_monthly_summary(as_frame=True),
+            'trend': lambda: tracker.get_spending_trend(days=(pd.Timestamp.now() - last_day).days + 30),
+        }
+
+        def show(chart, data):
+            if chart.canvas is None:
+                chart.attach(FigureCanvasAgg(chart.figure))
+            chart.show(data)
+
+        start = time.perf_counter()
+        for name, query in queries.items():
+            show(CHARTS[name](), query())
+        rebuild_s = time.perf_counter() - start
+
+        charts = {name: CHARTS[name]() for name in queries}
+        for name, query in queries.items():
+            show(charts[name], query())
+        tracker.add_transaction(last_day.strftime('%Y-%m-%d'), "Cash", "Food", "Lunch", "Expense", 9.5)
+        start = time.perf_counter()
+        for name, query in queries.items():
+            show(charts[name], query())
+        update_s = time.perf_counter() - start
+        print(f"{rows:>10} | {rebuild_s:>9.3f} | {update_s:>10.3f}")
+
+
+def import_times(module):
+    """
+    Import a module in a fresh interpreter with python -X importtime.
+
+    Args:
+        module (str): Module to import
+
+    Returns:
+        dict: Imported module name -> cumulative import time in microseconds,
+        including everything it imported in turn
+    """
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                            cwd=os.path.dirname(os.path.abspath(__file__)),
+                            capture_output=True, text=True, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def bench_startup(rows_list, directory, modules=('main_v2', 'FinanceTracker_v2', 'ChartView_v2'),
+                  startup_target_ms=500):
+    """
+    Cold import time of the GUI module and of the modules it now loads later
+    (pandas with the tracker, matplotlib with the Analytics tab), then the
+    time to load the tracker, after which the dashboard is filled in.
+    The GUI module should import in well under startup_target_ms (about 50 ms
+    here, against 1.5 s when pandas and matplotlib were imported up front).
+    """
+    print(f"{'module':>18} | {'import ms':>9} | {'pandas':>6} | {'matplotlib':>10}")
+    for module in modules:
+        times = import_times(module)
+        print(f"{module:>18} | {times[module] / 1000:>9.1f} | {str('pandas' in times):>6} | "
+              f"{str('matplotlib' in times):>10}")
+    gui_ms = import_times('main_v2')['main_v2'] / 1000
+    verdict = "ok" if gui_ms < startup_target_ms else "SLOW"
+    print(f"main_v2 import {gui_ms:.1f} ms (target < {startup_target_ms} ms): {verdict}")
+
+    print(f"\n{'rows':>10} | {'tracker load s':>14}")
+    for rows in rows_list:
+        path = write_ledger(directory, rows)
+        start = time.perf_counter()
+        FinanceTracker(path)
+        print(f"{rows:>10} | {time.perf_counter() - start:>14.3f}")
+
+
+def bench_snapshot(rows_list, directory):
+    """
+    Compare the time until the dashboard totals are known: loading the whole
+    ledger (the original startup) with reading the summary snapshot, checked
+    against the file's size and modification time or also its content hash.
+    The synthetic ledger has no ID column, like files saved before transactions
+    had IDs; sync still writes its snapshot without rewriting it.
+    """
+    print(f"{'rows':>10} | {'full load s':>11} | {'snapshot s':>10} | {'verified s':>10} | {'sync s':>6}")
+    for rows in rows_list:
+        path = write_ledger(directory, rows)
+        start = time.perf_counter()
+        tracker = FinanceTracker(path)
+        load_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        tracker.sync()
+        sync_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        read_snapshot(path).summary()
+        snapshot_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        read_snapshot(path, verify=True).summary()
+        verified_s = time.perf_counter() - start
+        print(f"{rows:>10} | {load_s:>11.3f} | {snapshot_s:>10.4f} | {verified_s:>10.3f} | {sync_s:>6.3f}")
+
+
+def bench_delete(rows_list, directory, deletes=20, bulk=1000, legacy_limit=1000000):
+    """
+    Compare the latency of deleting one transaction and saving: the original
+    drop, renumber and rewrite of the whole file, with a tombstone appended to
+    the deletion log. Also times deleting bulk IDs at once. The legacy path
+    is skipped above legacy_limit rows.
+    """
+    print(f"{'rows':>10} | {'rewrite ms':>10} | {'tombstone ms':>12} | {f'bulk {bulk} ms':>13}")
+    rng = np.random.default_rng(2)
+    for rows in rows_list:
+        path = write_ledger(directory, rows)
+        positions = rng.choice(rows - deletes, deletes, replace=False)
+
+        legacy = "skipped"
+        if rows <= legacy_limit:
+            df = pd.read_csv(path)
+            start = time.perf_counter()
+            for position in positions:
+                df = df.drop(position).reset_index(drop=True)
+                df.to_csv(path, index=False)
+            legacy = f"{(time.perf_counter() - start) / deletes * 1000:.2f}"
+            path = write_ledger(directory, rows)
+
+        tracker = FinanceTracker(path)
+        tracker.save_data()  # Number the rows once
+        start = time.perf_counter()
+        for position in positions:
+            tracker.delete_transaction(int(position))
+        len(tracker.df)
+        single = (time.perf_counter() - start) / deletes * 1000
+
+        ids = rng.choice(tracker.df.index.to_numpy(), bulk, replace=False)
+        start = time.perf_counter()
+        tracker.delete_transactions(ids)
+        tracker.save_data()
+        len(tracker.df)
+        bulk_ms = (time.perf_counter() - start) * 1000
+        print(f"{rows:>10} | {legacy:>10} | {single:>12.2f} | {bulk_ms:>13.2f}")
+
+
+BENCHMARKS = {
+    'load': bench_load,
+    'append': bench_append,
+    'save': bench_save,
+    'range': bench_range,
+    'search': bench_search,
+    'storage': bench_storage,
+    'sqlite': bench_sqlite,
+    'mapped': bench_mapped,
+    'objects': bench_objects,
+    'import': bench_import,
+    'export': bench_export,
+    'charts': bench_charts,
+    'startup': bench_startup,
+    'snapshot': bench_snapshot,
+    'delete': bench_delete,
+}
+
+
+def main():
+    """
+    Parse command line arguments and run the selected benchmarks.
+    """
+    parser = argparse.ArgumentParser(description="FinanceTracker performance benchmarks")
+    parser.add_argument('benchmarks', nargs='*', default=None,
+                        help=f"benchmarks to run: {', '.join(BENCHMARKS)} (default: all)")
+    parser.add_argument('--rows', nargs='+', type=int, default=[10000, 1000000, 10000000],
+                        help="ledger sizes to test")
+    args = parser.parse_args()
+    # Checked here rather than with choices: argparse also checks the empty
+    # list of a bare call against choices and rejects it
+    unknown = [name for name in args.benchmarks or [] if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmark(s): {', '.join(unknown)}")
+    names = args.benchmarks or list(BENCHMARKS)
+
+    with tempfile.TemporaryDirectory() as directory:
+        for name in names:
+            print(f"\n== {name} ==")
+            BENCHMARKS[name](args.rows, directory)
+
+
+if __name__ == "__main__":
+    main()
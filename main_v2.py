@@ -6,10 +6,30 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 from datetime import datetime, timedelta
-from FinanceTracker_v2 import FinanceTracker
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
+from BackgroundWorker_v2 import BackgroundWorker
+from RefreshScheduler_v2 import RefreshScheduler
+from VirtualTreeview_v2 import VirtualTreeview
+from Snapshot_v2 import read_snapshot
+
+# pandas (FinanceTracker_v2) and matplotlib (ChartView_v2) take longer to import
+# than the rest of the application, so neither is imported at module load:
+# the tracker is loaded on the worker thread after the window is shown, and
+# the charts when the Analytics tab is first opened.
+
+# File storing the transactions
+DATA_FILE = 'transactions.csv'
+
+
+def load_chart_classes():
+    """
+    Import the chart classes and the Tk canvas for matplotlib figures.
+
+    Returns:
+        tuple: (ChartView_v2.CHARTS, FigureCanvasTkAgg)
+    """
+    from ChartView_v2 import CHARTS
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+    return CHARTS, FigureCanvasTkAgg
 
 
 class FinanceTrackerGUI:
@@ -29,8 +49,10 @@ class FinanceTrackerGUI:
         self.root.title("Student Finance Tracker - Final Version")
         self.root.geometry("1200x800")
 
-        # Initialize finance tracker
-        self.tracker = FinanceTracker()
+        # All tracker work runs on this worker, off the Tk mainloop. The tracker
+        # itself is loaded there as the first job, so the window appears at once
+        self.tracker = None
+        self.worker = BackgroundWorker(self.root)
 
         # Create notebook for tabs
         self.notebook = ttk.Notebook(self.root)
@@ -42,15 +64,100 @@ class FinanceTrackerGUI:
         self.create_analytics_tab()
         self.create_budget_tab()
 
-        # Display initial data
+        # Changes only mark views dirty; they are redrawn together once the GUI
+        # is idle, and views on hidden tabs wait until their tab is shown
+        self.refresh = RefreshScheduler(self.root)
+        self.refresh.register('summary', self.update_summary,
+                              lambda: self._is_shown(self.dashboard_frame))
+        self.refresh.register('recent', self.update_dashboard_transactions,
+                              lambda: self._is_shown(self.dashboard_frame))
+        self.refresh.register('transactions', self.display_transactions,
+                              lambda: self._is_shown(self.trans_frame))
+        self.refresh.register('budgets', self.update_budget_display,
+                              lambda: self._is_shown(self.budget_frame))
+        self.refresh.register('chart', self._refresh_chart,
+                              lambda: self._is_shown(self.analytics_frame))
+
+        # Show the dashboard from the summary snapshot while the ledger loads
+        snapshot = read_snapshot(DATA_FILE)
+        if snapshot is not None:
+            self._show_summary(snapshot.summary())
+            self._show_recent_rows([(date, category, trans_type, cents / 100)
+                                    for date, _, category, _, trans_type, cents, _
+                                    in reversed(snapshot.recent)])
+
+        # Load the transactions, then display them. Jobs run in order, so
+        # anything submitted meanwhile runs after the tracker is loaded
+        self.progress_var.set("Loading transactions...")
+        self.worker.submit(self._load_tracker, on_done=self._on_tracker_loaded,
+                           on_error=lambda e: messagebox.showerror(
+                               "Error", f"Failed to load transactions: {str(e)}"))
         self.update_all_displays()
 
-        def create_dashboard_tab(self):
+        # Refresh views when their tab is shown, and start importing
+        # matplotlib when the Analytics tab is first opened
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
+
+        # Make sure appended transactions reach the disk before exiting
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+
+    def _load_tracker(self):
+        """
+        Import pandas and load the saved transactions (runs on the worker thread).
+        """
+        from FinanceTracker_v2 import FinanceTracker
+        self.tracker = FinanceTracker(DATA_FILE)
+
+    def _on_tracker_loaded(self, _):
+        """
+        Clear the loading message once the transactions are loaded.
+        """
+        self.progress_var.set("")
+
+    def _tracker_job(self, method, *args, **kwargs):
+        """
+        Call a tracker method by name (runs on the worker thread).
+        The method is looked up when the job runs, since the tracker may
+        still be loading when the job is submitted.
+
+        Args:
+            method (str): FinanceTracker method name
+            *args: Positional arguments for the method
+            **kwargs: Keyword arguments for the method
+
+        Returns:
+            The method's result
+        """
+        return getattr(self.tracker, method)(*args, **kwargs)
+
+    def _is_shown(self, frame):
+        """
+        Check whether a tab is the selected one.
+
+        Args:
+            frame: Tab frame of the notebook
+
+        Returns:
+            bool: True if the tab is shown
+        """
+        return self.notebook.select() == str(frame)
+
+    def _on_tab_changed(self, event):
+        """
+        Refresh the newly shown tab if its data changed while it was hidden, and
+        import the chart modules in the background when the Analytics tab is opened.
+        """
+        self.refresh.visibility_changed()
+        if self._is_shown(self.analytics_frame) and not self.charts:
+            self.worker.submit(load_chart_classes, key='chart-classes')
+
+    def create_dashboard_tab(self):
         """
         Create the main dashboard tab with summary and quick actions.
         """
         dashboard_frame = ttk.Frame(self.notebook)
         self.notebook.add(dashboard_frame, text="📊 Dashboard")
+        self.dashboard_frame = dashboard_frame
 
         # Title
         title_label = ttk.Label(dashboard_frame, text="Financial Dashboard",
@@ -116,6 +223,7 @@ class FinanceTrackerGUI:
         """
         trans_frame = ttk.Frame(self.notebook)
         self.notebook.add(trans_frame, text="💳 Transactions")
+        self.trans_frame = trans_frame
 
         # Add transaction form
         form_frame = ttk.LabelFrame(trans_frame, text="Add New Transaction", padding=10)
@@ -213,6 +321,10 @@ class FinanceTrackerGUI:
                    command=self.clear_filter).pack(side=tk.LEFT, padx=5)
         ttk.Button(filter_frame, text="📥 Export CSV",
                    command=self.export_transactions).pack(side=tk.LEFT, padx=5)
+        ttk.Button(filter_frame, text="📤 Import CSV",
+                   command=self.import_transactions).pack(side=tk.LEFT, padx=5)
+        ttk.Button(filter_frame, text="🗑 Delete Selected",
+                   command=self.delete_selected).pack(side=tk.LEFT, padx=5)
 
         # Search bar
         search_frame = ttk.Frame(display_frame)
@@ -225,10 +337,15 @@ class FinanceTrackerGUI:
         ttk.Button(search_frame, text="🔍 Search",
                    command=self.search_transactions).pack(side=tk.LEFT, padx=5)
 
-        # Transaction list
+        # Progress of long imports/exports
+        self.progress_var = tk.StringVar()
+        ttk.Label(search_frame, textvariable=self.progress_var).pack(side=tk.RIGHT, padx=5)
+
+        # Transaction list (virtual: only the visible rows exist in the Treeview)
         columns = ('Date', 'Mode', 'Category', 'Sub Category', 'Type', 'Amount', 'Notes')
-        self.trans_tree = ttk.Treeview(display_frame, columns=columns,
-                                       show='headings', height=15)
+        self.trans_view = VirtualTreeview(display_frame, columns, height=15)
+        self.trans_tree = self.trans_view.tree
+        self._shown_ids = []  # Transaction IDs of the listed rows, oldest first
 
         for col in columns:
             self.trans_tree.heading(col, text=col)
@@ -237,12 +354,7 @@ class FinanceTrackerGUI:
             else:
                 self.trans_tree.column(col, width=100)
 
-        scrollbar = ttk.Scrollbar(display_frame, orient=tk.VERTICAL,
-                                  command=self.trans_tree.yview)
-        self.trans_tree.configure(yscroll=scrollbar.set)
-
-        self.trans_tree.pack(side=tk.LEFT, fill='both', expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill='y')
+        self.trans_view.pack()
 
     def create_analytics_tab(self):
         """
@@ -250,6 +362,7 @@ class FinanceTrackerGUI:
         """
         analytics_frame = ttk.Frame(self.notebook)
         self.notebook.add(analytics_frame, text="📈 Analytics")
+        self.analytics_frame = analytics_frame
 
         # Title
         ttk.Label(analytics_frame, text="Financial Analytics",
@@ -270,12 +383,20 @@ class FinanceTrackerGUI:
         self.chart_frame = ttk.Frame(analytics_frame)
         self.chart_frame.pack(fill='both', expand=True, padx=20, pady=10)
 
+        # One persistent chart per button, created the first time it is shown
+        self.charts = {}  # Chart name -> (Chart, Tk widget)
+        self._chart_data = {}  # Chart name -> (data version, chart input)
+        self._drawn_versions = {}  # Chart name -> data version currently plotted
+        self._current_chart = None
+        self.chart_message = ttk.Label(self.chart_frame, font=('Arial', 14))
+
     def create_budget_tab(self):
         """
         Create the budget management tab.
         """
         budget_frame = ttk.Frame(self.notebook)
         self.notebook.add(budget_frame, text="💰 Budget")
+        self.budget_frame = budget_frame
 
         # Title
         ttk.Label(budget_frame, text="Budget Management",
@@ -301,6 +422,13 @@ class FinanceTrackerGUI:
         self.budget_amount_entry = ttk.Entry(budget_row, width=15)
         self.budget_amount_entry.pack(side=tk.LEFT, padx=5)
 
+        ttk.Label(budget_row, text="Period:").pack(side=tk.LEFT, padx=5)
+        self.budget_period_var = tk.StringVar(value="Total")
+        budget_period_combo = ttk.Combobox(budget_row, textvariable=self.budget_period_var,
+                                           values=["Total", "Monthly", "Weekly"],
+                                           width=10, state='readonly')
+        budget_period_combo.pack(side=tk.LEFT, padx=5)
+
         ttk.Button(budget_row, text="Set Budget",
                    command=self.set_budget).pack(side=tk.LEFT, padx=5)
 
@@ -340,24 +468,43 @@ class FinanceTrackerGUI:
                 messagebox.showwarning("Input Error", "Amount must be greater than 0!")
                 return
 
-            # Add transaction
-            self.tracker.add_transaction(date, mode, category, subcategory,
-                                         trans_type, amount, notes)
-            self.tracker.save_data()
-
-            # Clear input fields
-            self.subcategory_entry.delete(0, tk.END)
-            self.amount_entry.delete(0, tk.END)
-            self.notes_entry.delete(0, tk.END)
-
-            # Update all displays
-            self.update_all_displays()
+            try:
+                datetime.strptime(date, "%Y-%m-%d")
+            except ValueError:
+                messagebox.showerror("Input Error", "Please enter the date as YYYY-MM-DD!")
+                return
 
-            messagebox.showinfo("Success", "Transaction added successfully!")
+            # Add and save the transaction in the background
+            self.worker.submit(self._add_and_save, date, mode, category, subcategory,
+                               trans_type, amount, notes,
+                               on_done=self._on_transaction_added,
+                               on_error=lambda e: messagebox.showerror(
+                                   "Error", f"Failed to add transaction: {str(e)}"))
 
         except ValueError:
             messagebox.showerror("Input Error", "Please enter a valid amount!")
 
+    def _add_and_save(self, *transaction):
+        """
+        Add a transaction and save it (runs on the worker thread).
+        """
+        self.tracker.add_transaction(*transaction)
+        self.tracker.save_data()
+
+    def _on_transaction_added(self, _):
+        """
+        Clear the form and refresh the views once a transaction is saved.
+        """
+        # Clear input fields
+        self.subcategory_entry.delete(0, tk.END)
+        self.amount_entry.delete(0, tk.END)
+        self.notes_entry.delete(0, tk.END)
+
+        # Update all displays
+        self.update_all_displays()
+
+        messagebox.showinfo("Success", "Transaction added successfully!")
+
     def apply_filter(self):
         """
         Apply filters to transaction display.
@@ -381,24 +528,122 @@ class FinanceTrackerGUI:
             messagebox.showwarning("Search", "Please enter a search keyword!")
             return
 
-        results = self.tracker.search_transactions(keyword)
-        self.display_filtered_transactions(results)
+        # Shares its key with the filters, so only the newest query is shown
+        self.worker.submit(self._tracker_job, 'search_transactions', keyword,
+                           on_done=self.display_filtered_transactions, key='transactions')
+
+    def delete_selected(self):
+        """
+        Delete the selected transactions by ID, after asking for confirmation.
+        """
+        total = len(self._shown_ids)
+        rows = [self.trans_view.row_index(item) for item in self.trans_tree.selection()]
+        # Row i from the top is row (total - 1 - i) of the listed frame
+        ids = [int(self._shown_ids[total - 1 - row]) for row in rows if row is not None]
+        if not ids:
+            messagebox.showwarning("Delete", "Please select the transactions to delete!")
+            return
+        if not messagebox.askyesno("Delete", f"Delete {len(ids)} selected transaction(s)?"):
+            return
+
+        self.worker.submit(self._delete_and_save, ids,
+                           on_done=lambda _: self.update_all_displays(),
+                           on_error=lambda e: messagebox.showerror(
+                               "Error", f"Failed to delete transactions: {str(e)}"))
+
+    def _delete_and_save(self, ids):
+        """
+        Delete transactions by ID and save (runs on the worker thread).
+        """
+        self.tracker.delete_transactions(ids)
+        self.tracker.save_data()
 
     def export_transactions(self):
         """
-        Export transactions to CSV file.
+        Export the transactions matching the current filters.
+        The file type picks the format; rows are written in chunks on the
+        worker thread, with progress shown below the filters.
         """
         filename = filedialog.asksaveasfilename(
             defaultextension=".csv",
+            filetypes=[("CSV files", "*.csv"), ("Compressed CSV", "*.csv.gz"),
+                       ("Parquet files", "*.parquet"), ("JSON Lines", "*.jsonl"),
+                       ("All files", "*.*")]
+        )
+
+        if filename:
+            category = self.filter_category_var.get()
+            trans_type = self.filter_type_var.get()
+            self.progress_var.set("Exporting...")
+            self.worker.submit(
+                self._tracker_job, 'export', filename,
+                category=None if category == "All" else category,
+                trans_type=None if trans_type == "All" else trans_type,
+                on_progress=self._show_export_progress,
+                on_done=lambda count: self._on_export_finished(
+                    lambda: messagebox.showinfo(
+                        "Success", f"{count} transactions exported to {filename}")),
+                on_error=lambda e: self._on_export_finished(
+                    lambda: messagebox.showerror("Error", f"Failed to export: {str(e)}")))
+
+    def _show_export_progress(self, rows, total):
+        """
+        Show how far an export has got.
+        """
+        percent = 100 * rows / total if total else 100
+        self.progress_var.set(f"Exported {rows:,} of {total:,} rows ({percent:.0f}%)")
+
+    def _on_export_finished(self, show_message):
+        """
+        Clear the progress text and report the outcome.
+        """
+        self.progress_var.set("")
+        show_message()
+
+    def import_transactions(self):
+        """
+        Import transactions from a CSV file (e.g. a bank export).
+        The file is streamed in chunks on the worker thread, with progress shown below the filters.
+        """
+        filename = filedialog.askopenfilename(
             filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
         )
 
         if filename:
-            try:
-                self.tracker.export_to_csv(filename)
-                messagebox.showinfo("Success", f"Transactions exported to {filename}")
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to export: {str(e)}")
+            self.progress_var.set("Importing...")
+            self.worker.submit(
+                self._import_and_save, filename,
+                on_progress=self._show_import_progress,
+                on_done=lambda count: self._on_import_finished(
+                    lambda: messagebox.showinfo(
+                        "Success", f"Imported {count} transactions from {filename}")),
+                on_error=lambda e: self._on_import_finished(
+                    lambda: messagebox.showerror("Error", f"Failed to import: {str(e)}")))
+
+    def _import_and_save(self, filename, progress):
+        """
+        Import a CSV file and save the new rows (runs on the worker thread).
+        Rows imported before an invalid chunk are saved as well.
+        """
+        try:
+            return self.tracker.import_csv(filename, progress=progress)
+        finally:
+            self.tracker.save_data()
+
+    def _show_import_progress(self, rows, bytes_read, total_bytes):
+        """
+        Show how far an import has got.
+        """
+        percent = 100 * bytes_read / total_bytes if total_bytes else 100
+        self.progress_var.set(f"Imported {rows:,} rows ({percent:.0f}%)")
+
+    def _on_import_finished(self, show_message):
+        """
+        Clear the progress text, refresh the views and report the outcome.
+        """
+        self.progress_var.set("")
+        self.update_all_displays()
+        show_message()
 
     def set_budget(self):
         """
@@ -407,6 +652,7 @@ class FinanceTrackerGUI:
         try:
             category = self.budget_category_var.get()
             amount = float(self.budget_amount_entry.get())
+            period = self.budget_period_var.get().lower()
 
             if not category:
                 messagebox.showwarning("Input Error", "Please select a category!")
@@ -416,7 +662,7 @@ class FinanceTrackerGUI:
                 messagebox.showwarning("Input Error", "Budget must be greater than 0!")
                 return
 
-            self.tracker.set_budget(category, amount)
+            self.worker.submit(self._tracker_job, 'set_budget', category, amount, period)
             self.budget_amount_entry.delete(0, tk.END)
             self.update_budget_display()
 
@@ -429,9 +675,19 @@ class FinanceTrackerGUI:
         """
         Update the financial summary on dashboard.
         """
-        income = self.tracker.get_total_income()
-        expenses = self.tracker.get_total_expenses()
-        balance = self.tracker.get_balance()
+        self.worker.submit(
+            lambda: (self.tracker.get_total_income(), self.tracker.get_total_expenses(),
+                     self.tracker.get_balance()),
+            on_done=self._show_summary, key='summary')
+
+    def _show_summary(self, totals):
+        """
+        Show income, expense and balance totals on the dashboard cards.
+
+        Args:
+            totals (tuple): (income, expenses, balance)
+        """
+        income, expenses, balance = totals
 
         self.income_label.config(text=f"${income:.2f}")
         self.expense_label.config(text=f"${expenses:.2f}")
@@ -446,84 +702,122 @@ class FinanceTrackerGUI:
     def display_transactions(self):
         """
         Display transactions with current filters.
+        The filtering runs in the background; if the filters change again before
+        it finishes, the outdated result is discarded.
         """
-        # Clear existing items
-        for item in self.trans_tree.get_children():
-            self.trans_tree.delete(item)
+        self.worker.submit(self._filter_transactions, self.filter_category_var.get(),
+                           self.filter_type_var.get(),
+                           on_done=self.display_filtered_transactions, key='transactions')
 
-        # Get filtered data
-        df = self.tracker.df.copy()
+    def _filter_transactions(self, category, trans_type):
+        """
+        Apply the category and type filters (runs on the worker thread).
 
-        # Apply category filter
-        if self.filter_category_var.get() != "All":
-            df = df[df['Category'] == self.filter_category_var.get()]
+        Args:
+            category (str): Category or "All"
+            trans_type (str): "Income", "Expense" or "All"
 
-        # Apply type filter
-        if self.filter_type_var.get() != "All":
-            df = df[df['Income/Expense'] == self.filter_type_var.get()]
+        Returns:
+            pandas.DataFrame: Matching transactions
+        """
+        # Let the tracker apply the first filter (indexed SQL on a SQLite tracker)
+        if category != "All":
+            df = self.tracker.filter_by_category(category)
+            if trans_type != "All":
+                df = df[df['Income/Expense'] == trans_type]
+            return df
 
-        # Display transactions (newest first)
-        for idx in range(len(df) - 1, -1, -1):
-            row = df.iloc[idx]
-            self.trans_tree.insert('', tk.END, values=(
-                row['Date'],
-                row['Mode'],
-                row['Category'],
-                row['Sub Category'],
-                row['Income/Expense'],
-                f"${row['Amount']:.2f}",
-                row.get('Notes', '')
-            ))
+        if trans_type != "All":
+            return self.tracker.filter_by_type(trans_type)
+        return self.tracker.df
 
     def display_filtered_transactions(self, df):
         """
-        Display a filtered DataFrame of transactions.
+        Display a filtered DataFrame of transactions (newest first).
+        Rows are only formatted when they scroll into view.
         """
-        # Clear existing items
-        for item in self.trans_tree.get_children():
-            self.trans_tree.delete(item)
-
-        # Display filtered transactions
-        for idx in range(len(df) - 1, -1, -1):
-            row = df.iloc[idx]
-            self.trans_tree.insert('', tk.END, values=(
-                row['Date'],
-                row['Mode'],
-                row['Category'],
-                row['Sub Category'],
-                row['Income/Expense'],
-                f"${row['Amount']:.2f}",
-                row.get('Notes', '')
-            ))
+        columns = ['Date', 'Mode', 'Category', 'Sub Category', 'Income/Expense', 'Amount', 'Notes']
+        total = len(df)
+        self._shown_ids = df.index
+
+        def fetch(start, stop):
+            # Row i from the top is row (total - 1 - i) of the frame
+            block = df[columns].iloc[total - stop:total - start]
+            rows = [self._format_transaction_row(values)
+                    for values in block.itertuples(index=False, name=None)]
+            rows.reverse()
+            return rows
+
+        self.trans_view.set_rows(total, fetch)
+
+    def _format_transaction_row(self, values):
+        """
+        Format one transaction for the transactions list.
+
+        Args:
+            values (tuple): Date, mode, category, sub category, type, amount, notes
+
+        Returns:
+            tuple: Display values for the Treeview
+        """
+        date, mode, category, sub_category, trans_type, amount, notes = values
+        return (date.strftime('%Y-%m-%d'), mode, category, sub_category,
+                trans_type, f"${amount:.2f}", notes)
 
     def update_dashboard_transactions(self):
         """
         Update recent transactions on dashboard.
         """
-        # Clear existing items
-        for item in self.dashboard_tree.get_children():
-            self.dashboard_tree.delete(item)
+        self.worker.submit(self._tracker_job, 'get_recent_transactions', 10,
+                           on_done=self._show_recent_transactions, key='recent')
 
-        # Get recent transactions
-        recent = self.tracker.get_recent_transactions(10)
+    def _show_recent_transactions(self, recent):
+        """
+        Fill the dashboard list with recent transactions.
 
+        Args:
+            recent (pandas.DataFrame): Most recent transactions, oldest first
+        """
         # Display transactions (newest first)
+        rows = []
         for idx in range(len(recent) - 1, -1, -1):
             row = recent.iloc[idx]
+            rows.append((row['Date'].strftime('%Y-%m-%d'), row['Category'],
+                         row['Income/Expense'], row['Amount']))
+        self._show_recent_rows(rows)
+
+    def _show_recent_rows(self, rows):
+        """
+        Replace the rows of the dashboard list.
+
+        Args:
+            rows (list): (date, category, type, amount) tuples, newest first
+        """
+        # Clear existing items
+        for item in self.dashboard_tree.get_children():
+            self.dashboard_tree.delete(item)
+
+        for date, category, trans_type, amount in rows:
             self.dashboard_tree.insert('', tk.END, values=(
-                row['Date'],
-                row['Category'],
-                row['Income/Expense'],
-                f"${row['Amount']:.2f}"
-            ))
+                date, category, trans_type, f"${amount:.2f}"))
 
     def update_budget_display(self):
         """
         Update budget status display.
         """
+        self.worker.submit(self._tracker_job, 'check_all_budgets',
+                           on_done=self._show_budget_statuses, key='budgets')
+
+    def _show_budget_statuses(self, statuses):
+        """
+        Write the budget status report.
+
+        Args:
+            statuses (dict): Category -> status from check_all_budgets
+        """
         self.budget_text.delete(1.0, tk.END)
 
-        if not self.tracker.budgets:
+        if not statuses:
             self.budget_text.insert(tk.END, "No budgets set yet.\n")
             return
 
@@ -531,10 +825,10 @@ class FinanceTrackerGUI:
         self.budget_text.insert(tk.END, "BUDGET STATUS REPORT\n")
         self.budget_text.insert(tk.END, "=" * 80 + "\n\n")
 
-        for category in self.tracker.budgets:
-            status = self.tracker.check_budget_status(category)
+        # All budgets were checked together in one pass
+        for category, status in statuses.items():
             if status:
-                self.budget_text.insert(tk.END, f"Category: {category}\n")
+                self.budget_text.insert(tk.END, f"Category: {category} ({status['period']})\n")
                 self.budget_text.insert(tk.END, f"  Budget:    ${status['budget']:.2f}\n")
                 self.budget_text.insert(tk.END, f"  Spent:     ${status['spent']:.2f}\n")
                 self.budget_text.insert(tk.END, f"  Remaining: ${status['remaining']:.2f}\n")
@@ -557,125 +851,122 @@ class FinanceTrackerGUI:
         """
         Show pie chart of expenses by category.
         """
-        # Clear previous chart
-        for widget in self.chart_frame.winfo_children():
-            widget.destroy()
-
-        # Get category data
-        categories = self.tracker.get_expense_by_category()
-
-        if not categories:
-            ttk.Label(self.chart_frame, text="No expense data available",
-                      font=('Arial', 14)).pack(pady=20)
-            return
-
-        # Create pie chart
-        fig = Figure(figsize=(8, 6), dpi=100)
-        ax = fig.add_subplot(111)
-
-        labels = list(categories.keys())
-        sizes = list(categories.values())
-        colors = ['#ff9999', '#66b3ff', '#99ff99', '#ffcc99', '#ff99cc', '#c2c2f0']
-
-        ax.pie(sizes, labels=labels, autopct='%1.1f%%', startangle=90, colors=colors)
-        ax.set_title('Expense Distribution by Category', fontsize=14, fontweight='bold')
-
-        # Embed chart in tkinter
-        canvas = FigureCanvasTkAgg(fig, master=self.chart_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill='both', expand=True)
+        self._show_chart('category', 'get_expense_by_category')
 
     def show_monthly_trend(self):
         """
         Show bar chart of monthly income vs expenses.
         """
-        # Clear previous chart
-        for widget in self.chart_frame.winfo_children():
-            widget.destroy()
-
-        # Get monthly data
-        monthly_data = self.tracker.get_monthly_summary()
-
-        if not monthly_data:
-            ttk.Label(self.chart_frame, text="No data available",
-                      font=('Arial', 14)).pack(pady=20)
-            return
+        self._show_chart('monthly', 'get_monthly_summary', as_frame=True)
 
-        # Prepare data
-        months = list(monthly_data.keys())
-        incomes = [monthly_data[m]['income'] for m in months]
-        expenses = [monthly_data[m]['expense'] for m in months]
-
-        # Create bar chart
-        fig = Figure(figsize=(10, 6), dpi=100)
-        ax = fig.add_subplot(111)
+    def show_spending_trend(self):
+        """
+        Show line chart of daily spending trend.
+        """
+        self._show_chart('trend', 'get_spending_trend', days=30)
 
-        x = range(len(months))
-        width = 0.35
+    def _chart_version(self):
+        """
+        Version of the data behind the charts: the tracker's data version,
+        plus today's date because the spending trend covers the last 30 days.
+        """
+        return self.tracker.version, datetime.now().date()
 
-        ax.bar([i - width / 2 for i in x], incomes, width, label='Income', color='green', alpha=0.7)
-        ax.bar([i + width / 2 for i in x], expenses, width, label='Expenses', color='red', alpha=0.7)
+    def _show_chart(self, name, query, **kwargs):
+        """
+        Show one of the analytics charts.
+        Chart inputs are cached per data version, so showing a chart again while
+        the transactions are unchanged only repaints it. Otherwise the input is
+        recomputed on the worker thread and the chart is updated in place.
 
-        ax.set_xlabel('Month', fontsize=12)
-        ax.set_ylabel('Amount ($)', fontsize=12)
-        ax.set_title('Monthly Income vs Expenses', fontsize=14, fontweight='bold')
-        ax.set_xticks(x)
-        ax.set_xticklabels(months, rotation=45)
-        ax.legend()
-        ax.grid(axis='y', alpha=0.3)
+        Args:
+            name (str): Chart name in ChartView_v2.CHARTS
+            query (str): Name of the tracker method computing the chart input
+            **kwargs: Arguments for the query
+        """
+        self._current_chart = name
+        cached = self._chart_data.get(name)
+        if cached is not None and cached[0] == self._chart_version():
+            self._draw_chart(name, cached)
+            return
 
-        fig.tight_layout()
+        def compute():
+            # Read the version on the worker thread, where all changes to the tracker happen
+            return self._chart_version(), self._tracker_job(query, **kwargs)
 
-        # Embed chart
-        canvas = FigureCanvasTkAgg(fig, master=self.chart_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill='both', expand=True)
+        self.worker.submit(compute, on_done=lambda result: self._draw_chart(name, result),
+                           key=f'chart-{name}')
 
-    def show_spending_trend(self):
+    def _draw_chart(self, name, result):
         """
-        Show line chart of daily spending trend.
+        Cache a chart input and plot it if the chart is still the selected one.
+
+        Args:
+            name (str): Chart name
+            result (tuple): (data version, chart input)
         """
-        # Clear previous chart
-        for widget in self.chart_frame.winfo_children():
-            widget.destroy()
+        self._chart_data[name] = result
+        if name != self._current_chart:
+            return
 
-        # Get spending trend
-        trend_data = self.tracker.get_spending_trend(days=30)
+        chart, widget = self._get_chart(name)
+        for _, other in self.charts.values():
+            if other is not widget:
+                other.pack_forget()
 
-        if trend_data.empty:
-            ttk.Label(self.chart_frame, text="No spending data available for last 30 days",
-                      font=('Arial', 14)).pack(pady=20)
+        version, data = result
+        if chart.is_empty(data):
+            widget.pack_forget()
+            self.chart_message.config(text=chart.empty_message)
+            self.chart_message.pack(pady=20)
             return
 
-        # Create line chart
-        fig = Figure(figsize=(10, 6), dpi=100)
-        ax = fig.add_subplot(111)
+        self.chart_message.pack_forget()
+        if self._drawn_versions.get(name) != version:
+            chart.show(data)
+            self._drawn_versions[name] = version
+        widget.pack(fill='both', expand=True)
 
-        ax.plot(trend_data['Date'], trend_data['Amount'], marker='o',
-                linewidth=2, markersize=6, color='#ff6b6b')
-
-        ax.set_xlabel('Date', fontsize=12)
-        ax.set_ylabel('Daily Spending ($)', fontsize=12)
-        ax.set_title('30-Day Spending Trend', fontsize=14, fontweight='bold')
-        ax.grid(True, alpha=0.3)
+    def _get_chart(self, name):
+        """
+        Get a chart and its Tk widget, creating them the first time.
 
-        # Rotate x-axis labels
-        fig.autofmt_xdate()
-        fig.tight_layout()
+        Returns:
+            tuple: (Chart, Tk widget of its canvas)
+        """
+        if name not in self.charts:
+            CHARTS, FigureCanvasTkAgg = load_chart_classes()
+            chart = CHARTS[name]()
+            canvas = FigureCanvasTkAgg(chart.figure, master=self.chart_frame)
+            chart.attach(canvas)
+            self.charts[name] = (chart, canvas.get_tk_widget())
+        return self.charts[name]
 
-        # Embed chart
-        canvas = FigureCanvasTkAgg(fig, master=self.chart_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill='both', expand=True)
+    def _refresh_chart(self):
+        """
+        Show the selected analytics chart again with the current data.
+        """
+        shows = {'category': self.show_category_chart, 'monthly': self.show_monthly_trend,
+                 'trend': self.show_spending_trend}
+        if self._current_chart is not None:
+            shows[self._current_chart]()
 
     def update_all_displays(self):
         """
         Update all displays in the application.
+        Cheap to call after every change: the views are only marked dirty and
+        redrawn once, in one pass when the GUI is idle (see RefreshScheduler).
         """
-        self.update_summary()
-        self.display_transactions()
-        self.update_dashboard_transactions()
-        self.update_budget_display()
+        self.refresh.mark_dirty()
+
+    def on_close(self):
+        """
+        Flush pending writes and close the application window.
+        """
+        self.worker.shutdown()
+        if self.tracker is not None:
+            self.tracker.sync()
+        self.root.destroy()
 
 
 def main():
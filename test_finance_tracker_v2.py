@@ -4,10 +4,20 @@
 # Description: Enhanced pytest test cases for final Finance Tracker
 
 import pytest
+import numpy as np
 import pandas as pd
 import os
+import subprocess
+import sys
+import tracemalloc
 from Transaction_v2 import Transaction
-from FinanceTracker_v2 import FinanceTracker
+from FinanceTracker_v2 import FinanceTracker, COLUMNS
+from BackgroundWorker_v2 import BackgroundWorker
+from RefreshScheduler_v2 import RefreshScheduler
+from Storage_v2 import TombstoneLog, deletion_log_path, load_columns, migrate, normalize_frame
+from SQLiteTracker_v2 import SQLiteFinanceTracker
+from Snapshot_v2 import read_snapshot, snapshot_path
+import MappedTracker_v2
 
 
 @pytest.fixture
@@ -54,9 +64,10 @@ def temp_tracker():
 
     yield tracker
 
-    # Cleanup: remove test file after test
-    if os.path.exists(test_file):
-        os.remove(test_file)
+    # Cleanup: remove test file, its summary snapshot and deletion log after test
+    for path in (test_file, snapshot_path(test_file), deletion_log_path(test_file)):
+        if os.path.exists(path):
+            os.remove(path)
 
 
 def test_transaction_creation(sample_transaction):
@@ -100,6 +111,24 @@ def test_transaction_is_income():
     assert expense_trans.is_expense() == True
 
 
+def test_transaction_is_slotted(sample_transaction):
+    """
+    Test that transactions carry no per-instance __dict__.
+    """
+    assert not hasattr(sample_transaction, '__dict__')
+    with pytest.raises(AttributeError):
+        sample_transaction.tag = "extra"
+
+
+def test_transaction_amount_in_cents():
+    """
+    Test that amounts are kept as whole cents.
+    """
+    trans = Transaction("2025-11-18", "Cash", "Food", "Lunch", "Expense", 0.1 + 0.2)
+    assert trans.amount_cents == 30
+    assert trans.amount == 0.30
+
+
 def test_add_transaction(temp_tracker):
     """
     Test adding a transaction to the finance tracker.
@@ -345,4 +374,1024 @@ def test_export_functionality(temp_tracker):
     os.remove(export_file)
 
 
+def test_load_data_uses_typed_columns(temp_tracker):
+    """
+    Test that loading parses the CSV with explicit column types.
+    """
+    temp_tracker.add_transaction("2025-11-18", "Cash", "Food",
+                                 "Lunch", "Expense", 15.00)
+    temp_tracker.save_data()
+
+    loaded = FinanceTracker(temp_tracker.csv_file)
+
+    assert isinstance(loaded.df['Category'].dtype, pd.CategoricalDtype)
+    assert isinstance(loaded.df['Income/Expense'].dtype, pd.CategoricalDtype)
+    assert loaded.df['Amount'].dtype == 'float64'
+    assert pd.api.types.is_datetime64_any_dtype(loaded.df['Date'])
+
+
+def test_transaction_view(temp_tracker):
+    """
+    Test that tracker.transactions builds Transaction objects on demand.
+    """
+    temp_tracker.add_transaction("2025-11-18", "Cash", "Food",
+                                 "Lunch", "Expense", 15.00, "First")
+    temp_tracker.add_transaction("2025-11-19", "Card", "Allowance",
+                                 "From Parents", "Income", 100.00, "Second")
+
+    first = temp_tracker.transactions[0]
+    assert isinstance(first, Transaction)
+    assert first.date == "2025-11-18"
+    assert first.is_expense()
+    assert temp_tracker.transactions[-1].notes == "Second"
+    assert [t.amount for t in temp_tracker.transactions] == [15.00, 100.00]
+
+
+def test_add_transactions_bulk(temp_tracker, sample_transaction):
+    """
+    Test adding many transactions at once from objects and tuples.
+    """
+    count = temp_tracker.add_transactions([
+        sample_transaction,
+        ("2025-11-19", "Card", "Allowance", "From Parents", "Income", 100.00),
+        ("2025-11-20", "Online", "Gifts", "Birthday", "Expense", 25.00, "New category"),
+    ])
+
+    assert count == 3
+    assert len(temp_tracker.df) == 3
+    assert temp_tracker.get_total_income() == 100.00
+    assert temp_tracker.get_expense_by_category() == {'Food': 15.50, 'Gifts': 25.00}
+    assert isinstance(temp_tracker.df['Category'].dtype, pd.CategoricalDtype)
+
+
+def test_buffered_rows_are_visible(temp_tracker):
+    """
+    Test that rows buffered by add_transaction show up in queries and saves.
+    """
+    for day in range(1, 6):
+        temp_tracker.add_transaction(f"2025-11-0{day}", "Cash", "Food",
+                                     "Snack", "Expense", 2.00)
+
+    assert temp_tracker.get_total_expenses() == 10.00
+    temp_tracker.add_transaction("2025-11-06", "Cash", "Food", "Snack", "Expense", 2.00)
+    temp_tracker.save_data()
+
+    assert len(pd.read_csv(temp_tracker.csv_file)) == 6
+
+
+def test_save_appends_new_rows(temp_tracker, monkeypatch):
+    """
+    Test that append-only saves add rows without rewriting the file.
+    """
+    temp_tracker.add_transaction("2025-11-18", "Cash", "Food", "Lunch", "Expense", 15.00)
+    temp_tracker.save_data()
+
+    # Any further full rewrite would fail the test
+    def fail_compact():
+        raise AssertionError("save_data rewrote the whole file")
+    monkeypatch.setattr(temp_tracker, 'compact', fail_compact)
+
+    temp_tracker.add_transaction("2025-11-19", "Card", "Allowance",
+                                 "From Parents", "Income", 100.00, "Second")
+    temp_tracker.save_data()
+    temp_tracker.sync()
+
+    reloaded = FinanceTracker(temp_tracker.csv_file)
+    assert len(reloaded.df) == 2
+    assert reloaded.transactions[1].notes == "Second"
+    assert reloaded.get_balance() == 85.00
+
+
+@pytest.mark.parametrize('header, row', [
+    ("ID,Date,Mode,Category,Sub Category,Income/Expense,Amount",
+     "0,2025-01-01,Cash,Food,Lunch,Expense,15.00"),
+    ("Date,ID,Mode,Category,Sub Category,Income/Expense,Amount,Notes",
+     "2025-01-01,0,Cash,Food,Lunch,Expense,15.00,"),
+])
+def test_save_rewrites_a_file_with_another_layout(tmp_path, header, row):
+    """
+    Test that a file with IDs but not the ID + COLUMNS header (no Notes column,
+    or another column order) is rewritten on the first save instead of appended to.
+    """
+    path = str(tmp_path / "ledger.csv")
+    with open(path, 'w') as file:
+        file.write(f"{header}\n{row}\n")
+
+    tracker = FinanceTracker(path)
+    tracker.add_transaction("2025-01-02", "Card", "Food", "Dinner", "Expense", 20.00, "Late")
+    tracker.save_data()
+
+    assert list(pd.read_csv(path, nrows=0).columns) == ['ID'] + COLUMNS
+    reloaded = FinanceTracker(path)
+    assert reloaded.df.index.tolist() == [0, 1]
+    assert reloaded.transactions[1].notes == "Late"
+    assert reloaded.get_total_expenses() == 35.00
+
+
+def test_delete_rewrites_file(temp_tracker):
+    """
+    Test that deleting a transaction compacts the file instead of appending.
+    """
+    temp_tracker.add_transaction("2025-11-18", "Cash", "Food", "Lunch", "Expense", 15.00)
+    temp_tracker.add_transaction("2025-11-19", "Cash", "Food", "Dinner", "Expense", 20.00)
+    temp_tracker.save_data()
+
+    temp_tracker.delete_transaction(0)
+    temp_tracker.add_transaction("2025-11-20", "Cash", "Food", "Snack", "Expense", 5.00)
+    temp_tracker.save_data()
+
+    saved = pd.read_csv(temp_tracker.csv_file)
+    assert saved['Sub Category'].tolist() == ["Dinner", "Snack"]
+
 
+def test_running_totals_follow_deletes(temp_tracker):
+    """
+    Test that cached totals stay correct after adding and deleting transactions.
+    """
+    temp_tracker.add_transaction("2025-11-18", "Bank Transfer", "Allowance",
+                                 "From Parents", "Income", 500.00)
+    temp_tracker.add_transaction("2025-11-18", "Cash", "Food", "Lunch", "Expense", 50.00)
+    temp_tracker.add_transaction("2025-11-19", "Cash", "Food", "Dinner", "Expense", 30.00)
+
+    temp_tracker.delete_transaction(1)
+
+    assert temp_tracker.get_total_income() == 500.00
+    assert temp_tracker.get_total_expenses() == 30.00
+    assert temp_tracker.get_balance() == 470.00
+
+
+def test_deletes_are_logged_by_id(temp_tracker, monkeypatch):
+    """
+    Test that deleting by ID only appends to the deletion log, keeps IDs stable
+    across reloads, and compacts once too many rows are deleted.
+    """
+    temp_tracker.add_transactions(
+        [("2025-11-01", "Cash", "Food", f"Meal {i}", "Expense", 10.00 + i) for i in range(8)])
+    temp_tracker.save_data()
+    ids = temp_tracker.df.index.tolist()
+    assert ids == list(range(8))
+
+    # A bulk delete of 2 of 8 rows stays under COMPACT_DEAD_FRACTION: no rewrite
+    def fail_compact():
+        raise AssertionError("deleting rewrote the whole file")
+    monkeypatch.setattr(temp_tracker, 'compact', fail_compact)
+    size = os.path.getsize(temp_tracker.csv_file)
+    assert temp_tracker.delete_transactions([ids[1], ids[5], 99]) == 2
+    temp_tracker.save_data()
+    assert os.path.getsize(temp_tracker.csv_file) == size
+    assert os.path.getsize(deletion_log_path(temp_tracker.csv_file)) == 16
+
+    reloaded = FinanceTracker(temp_tracker.csv_file)
+    assert reloaded.df.index.tolist() == [0, 2, 3, 4, 6, 7]
+    assert reloaded.get_total_expenses() == temp_tracker.get_total_expenses() == 82.00
+    assert reloaded.transactions[1].sub_category == "Meal 2"
+
+    # A third deleted row passes the threshold; the file is compacted, IDs kept
+    reloaded.delete_transactions([2])
+    reloaded.save_data()
+    assert not os.path.exists(deletion_log_path(reloaded.csv_file))
+    assert pd.read_csv(reloaded.csv_file)['ID'].tolist() == [0, 3, 4, 6, 7]
+    reloaded.add_transaction("2025-11-02", "Cash", "Food", "Snack", "Expense", 1.00)
+    assert reloaded.df.index[-1] == 8
+
+
+def test_date_ranged_totals(temp_tracker):
+    """
+    Test ranged totals with open-ended and inclusive date bounds.
+    """
+    temp_tracker.add_transaction("2025-11-20", "Cash", "Food", "Dinner", "Expense", 20.00)
+    temp_tracker.add_transaction("2025-11-01", "Cash", "Food", "Lunch", "Expense", 10.00)
+    temp_tracker.add_transaction("2025-11-30", "Cash", "Allowance", "Gift", "Income", 50.00)
+    temp_tracker.add_transaction("2025-12-05", "Cash", "Food", "Snack", "Expense", 4.00)
+
+    assert temp_tracker.get_total_expenses(start_date="2025-11-20") == 24.00
+    assert temp_tracker.get_total_expenses(end_date="2025-11-20") == 30.00
+    assert temp_tracker.get_total_expenses("2025-11-02", "2025-11-19") == 0.0
+    assert temp_tracker.get_total_income("2025-11-30", "2025-11-30") == 50.00
+
+
+def test_filter_by_date_range_keeps_file_order(temp_tracker):
+    """
+    Test that indexed date filtering returns matching rows in the order they were added.
+    """
+    temp_tracker.add_transaction("2025-11-15", "Cash", "Food", "Dinner", "Expense", 20.00)
+    temp_tracker.add_transaction("2025-11-01", "Cash", "Food", "Lunch", "Expense", 10.00)
+    temp_tracker.add_transaction("2025-11-10", "Cash", "Food", "Breakfast", "Expense", 8.00)
+    temp_tracker.add_transaction("2025-12-01", "Cash", "Food", "Snack", "Expense", 3.00)
+
+    results = temp_tracker.filter_by_date_range("2025-11-01", "2025-11-15")
+
+    assert results['Sub Category'].tolist() == ["Dinner", "Lunch", "Breakfast"]
+    assert temp_tracker.get_expense_by_category("2025-11-10", "2025-12-31") == {'Food': 31.00}
+
+
+def test_monthly_summary_values(temp_tracker):
+    """
+    Test monthly totals in both the dict and DataFrame forms.
+    """
+    temp_tracker.add_transaction("2025-12-10", "Bank Transfer", "Allowance",
+                                 "Monthly", "Income", 800.00)
+    temp_tracker.add_transaction("2025-11-10", "Bank Transfer", "Allowance",
+                                 "Monthly", "Income", 800.00)
+    temp_tracker.add_transaction("2025-11-15", "Cash", "Food", "Lunch", "Expense", 50.00)
+    temp_tracker.add_transaction("2025-11-20", "Cash", "Food", "Dinner", "Expense", 25.00)
+
+    summary = temp_tracker.get_monthly_summary()
+    assert list(summary) == ['2025-11', '2025-12']
+    assert summary['2025-11'] == {'income': 800.00, 'expense': 75.00, 'balance': 725.00}
+    assert summary['2025-12'] == {'income': 800.00, 'expense': 0.0, 'balance': 800.00}
+
+    frame = temp_tracker.get_monthly_summary(as_frame=True)
+    assert frame.loc['2025-11', 'expense'] == 75.00
+    assert list(frame.columns) == ['income', 'expense', 'balance']
+
+
+def test_rollup_matches_raw_rows(temp_tracker):
+    """
+    Test that the incremental rollup agrees with a fresh scan after adds, deletes and reloads.
+    """
+    temp_tracker.add_transaction("2025-11-10", "Cash", "Food", "Lunch", "Expense", 12.00)
+    temp_tracker.add_transaction("2025-11-12", "Card", "Household", "Soap", "Expense", 6.00)
+    temp_tracker.add_transaction("2025-12-01", "Cash", "Food", "Dinner", "Expense", 20.00)
+    temp_tracker.add_transaction("2025-12-01", "Online", "Allowance", "Gift", "Income", 40.00)
+    temp_tracker.delete_transaction(1)
+
+    assert temp_tracker.get_expense_by_category() == {'Food': 32.00}
+    assert temp_tracker.get_monthly_summary()['2025-11']['expense'] == 12.00
+
+    reloaded = FinanceTracker(temp_tracker.csv_file)
+    assert reloaded.get_expense_by_category() == temp_tracker.get_expense_by_category()
+    assert reloaded.get_monthly_summary() == temp_tracker.get_monthly_summary()
+
+
+def test_check_all_budgets_with_periods(temp_tracker):
+    """
+    Test checking total, monthly and weekly budgets together.
+    """
+    temp_tracker.set_budget("Food", 100.00)
+    temp_tracker.set_budget("Household", 50.00, period='monthly')
+    temp_tracker.set_budget("Entertainment", 20.00, period='weekly')
+
+    temp_tracker.add_transaction("2025-10-30", "Cash", "Food", "Lunch", "Expense", 40.00)
+    temp_tracker.add_transaction("2025-11-18", "Cash", "Food", "Dinner", "Expense", 30.00)
+    temp_tracker.add_transaction("2025-10-30", "Card", "Household", "Soap", "Expense", 45.00)
+    temp_tracker.add_transaction("2025-11-03", "Card", "Household", "Towels", "Expense", 10.00)
+    temp_tracker.add_transaction("2025-11-16", "Card", "Entertainment", "Movie", "Expense", 15.00)
+    temp_tracker.add_transaction("2025-11-17", "Card", "Entertainment", "Concert", "Expense", 25.00)
+
+    # 2025-11-19 is a Wednesday; its week starts on Monday 2025-11-17
+    statuses = temp_tracker.check_all_budgets(as_of="2025-11-19")
+
+    assert statuses['Food']['spent'] == 70.00
+    assert statuses['Household']['spent'] == 10.00
+    assert statuses['Entertainment']['spent'] == 25.00
+    assert statuses['Entertainment']['over_budget'] == True
+    assert statuses['Household']['period'] == 'monthly'
+    assert temp_tracker.check_budget_status("Household", as_of="2025-11-19") == statuses['Household']
+
+    with pytest.raises(ValueError):
+        temp_tracker.set_budget("Food", 10.00, period='yearly')
+
+
+def test_search_index_terms_and_ranking(temp_tracker):
+    """
+    Test multi-term AND search, ranking, short terms, and rows added after indexing.
+    """
+    temp_tracker.add_transaction("2025-11-18", "Cash", "Food", "Pizza", "Expense", 20.00,
+                                 notes="Friday pizza night")
+    temp_tracker.add_transaction("2025-11-19", "Card", "Food", "Burger lunch", "Expense", 12.00)
+    temp_tracker.add_transaction("2025-11-20", "Cash", "Food", "Pizza slice", "Expense", 4.00)
+
+    assert len(temp_tracker.search_transactions("pizza")) == 2
+    assert temp_tracker.search_transactions("pizza night")['Amount'].tolist() == [20.00]
+    assert len(temp_tracker.search_transactions("BURGER")) == 1
+    assert len(temp_tracker.search_transactions("un")) == 1
+    assert temp_tracker.search_transactions("sushi").empty
+
+    # Added after the index was built
+    temp_tracker.add_transaction("2025-11-21", "Cash", "Food", "Pizza", "Expense", 9.00,
+                                 notes="pizza pizza")
+    ranked = temp_tracker.search_transactions("pizza", rank=True)
+    assert ranked['Amount'].tolist() == [9.00, 20.00, 4.00]
+
+
+def test_search_index_follows_deletes_and_imports(temp_tracker, tmp_path):
+    """
+    Test that deletes and imports update the keyword index instead of dropping it.
+    """
+    temp_tracker.add_transaction("2025-11-18", "Cash", "Food", "Pizza", "Expense", 20.00)
+    temp_tracker.add_transaction("2025-11-19", "Cash", "Food", "Pizza slice", "Expense", 4.00)
+    temp_tracker.add_transaction("2025-11-20", "Cash", "Food", "Shop pizza", "Expense", 7.00)
+    assert len(temp_tracker.search_transactions("pizza")) == 3
+    index = temp_tracker._search_index
+
+    temp_tracker.delete_transactions([1])
+    assert temp_tracker.search_transactions("pizza")['Amount'].tolist() == [20.00, 7.00]
+
+    source = str(tmp_path / "bank.csv")
+    _write_bank_export(source, 10)  # Sub categories "Shop 0" to "Shop 6"
+    temp_tracker.import_csv(source)
+    shops = temp_tracker.search_transactions("shop")
+    assert len(shops) == 11
+    assert shops.index.tolist() == sorted(shops.index)
+    assert len(temp_tracker.search_transactions("shop 3")) == 1
+    assert temp_tracker._search_index is index  # Never rebuilt
+
+
+def test_add_transaction_rejects_bad_dates(temp_tracker):
+    """
+    Test that invalid dates are rejected when the transaction is added.
+    """
+    with pytest.raises(ValueError):
+        temp_tracker.add_transaction("18/11/2025", "Cash", "Food", "Lunch", "Expense", 15.00)
+
+    temp_tracker.add_transaction("2025-1-5", "Cash", "Food", "Lunch", "Expense", 15.00)
+    assert temp_tracker.transactions[0].date == "2025-01-05"
+    assert len(temp_tracker.df) == 1
+
+
+@pytest.mark.parametrize('extension', ['.feather', '.parquet'])
+def test_columnar_storage_round_trip(temp_tracker, tmp_path, extension):
+    """
+    Test migrating the CSV to a columnar format, saving there, and loading selected columns.
+    """
+    pytest.importorskip('pyarrow')
+    temp_tracker.add_transaction("2025-11-18", "Cash", "Food", "Lunch", "Expense", 15.00)
+    temp_tracker.save_data()
+
+    path = str(tmp_path / f"ledger{extension}")
+    assert migrate(temp_tracker.csv_file, path) == 1
+
+    tracker = FinanceTracker(path)
+    tracker.add_transaction("2025-11-19", "Card", "Allowance", "From Parents", "Income", 100.00)
+    tracker.save_data()
+
+    reloaded = FinanceTracker(path)
+    assert reloaded.transactions[1].sub_category == "From Parents"
+    assert reloaded.get_balance() == 85.00
+
+    columns = load_columns(path, ['Date', 'Category', 'Amount'])
+    assert list(columns.columns) == ['Date', 'Category', 'Amount']
+    assert columns['Amount'].tolist() == [15.00, 100.00]
+
+
+def test_load_columns_applies_only_a_matching_deletion_log(tmp_path):
+    """
+    Test that load_columns skips logged rows of a file with IDs and ignores
+    a stray deletion log next to a file without them.
+    """
+    path = str(tmp_path / "ledger.csv")
+    rows = pd.DataFrame({'Date': ["2025-11-18", "2025-11-19", "2025-11-20"],
+                         'Category': "Food", 'Amount': [1.00, 2.00, 3.00]})
+    rows.to_csv(path, index=False)
+    TombstoneLog(deletion_log_path(path)).append([1])
+    assert load_columns(path, ['Amount'])['Amount'].tolist() == [1.00, 2.00, 3.00]
+
+    rows.rename_axis('ID').reset_index().to_csv(path, index=False)
+    assert load_columns(path, ['Amount'])['Amount'].tolist() == [1.00, 3.00]
+
+
+def test_sqlite_tracker_matches_in_memory(temp_tracker, tmp_path):
+    """
+    Test that the SQL queries of the SQLite tracker give the same answers as the DataFrame tracker.
+    """
+    db_file = str(tmp_path / "ledger.db")
+    open(db_file, 'wb').close()  # Empty database, no sample data
+    sqlite_tracker = SQLiteFinanceTracker(db_file)
+
+    rows = [
+        ("2025-10-30", "Card", "Food", "Groceries", "Expense", 40.00, "Weekly shop"),
+        ("2025-11-01", "Bank Transfer", "Allowance", "From Parents", "Income", 800.00, ""),
+        ("2025-11-02", "Cash", "Food", "Lunch", "Expense", 12.00, "Campus cafe"),
+        ("2025-11-03", "Card", "Transportation", "Bus fare", "Expense", 3.00, "Lunch trip"),
+    ]
+    for tracker in (temp_tracker, sqlite_tracker):
+        tracker.add_transactions(rows)
+        tracker.save_data()
+
+    assert sqlite_tracker.get_balance() == temp_tracker.get_balance()
+    assert sqlite_tracker.get_total_expenses("2025-11-01", "2025-11-30") == 15.00
+    assert sqlite_tracker.get_expense_by_category() == temp_tracker.get_expense_by_category()
+    assert (sqlite_tracker.get_expense_by_category("2025-11-01", "2025-11-30") ==
+            temp_tracker.get_expense_by_category("2025-11-01", "2025-11-30"))
+    assert sqlite_tracker.get_monthly_summary() == temp_tracker.get_monthly_summary()
+    assert (sqlite_tracker.filter_by_category("Food")['Notes'].tolist() ==
+            ["Weekly shop", "Campus cafe"])
+    assert len(sqlite_tracker.filter_by_type("Income")) == 1
+    assert sqlite_tracker.search_transactions("lunch")['Sub Category'].tolist() == ["Lunch", "Bus fare"]
+    assert (sqlite_tracker.search_transactions("lunch", rank=True)['Notes'].tolist() ==
+            temp_tracker.search_transactions("lunch", rank=True)['Notes'].tolist())
+    for tracker in (temp_tracker, sqlite_tracker):
+        tracker.set_budget("Food", 50.00, period='monthly')
+    assert (sqlite_tracker.check_all_budgets(as_of="2025-11-15") ==
+            temp_tracker.check_all_budgets(as_of="2025-11-15"))
+
+    sqlite_tracker.delete_transaction(0)
+    sqlite_tracker.close()
+    reopened = SQLiteFinanceTracker(db_file)
+    assert len(reopened.transactions) == 3
+    assert reopened.transactions[0].sub_category == "From Parents"
+    assert [t.amount for t in reopened.transactions] == [800.00, 12.00, 3.00]
+    reopened.close()
+
+
+def test_mapped_tracker_matches_in_memory(temp_tracker, tmp_path, monkeypatch):
+    """
+    Test that chunked aggregates over the memory-mapped columns match the DataFrame tracker.
+    """
+    monkeypatch.setattr(MappedTracker_v2, 'CHUNK_ROWS', 2)  # Cross chunk boundaries
+    directory = str(tmp_path / "ledger.cols")
+    os.makedirs(directory)  # Existing empty store, no sample data
+    mapped = MappedTracker_v2.MappedFinanceTracker(directory)
+
+    rows = [
+        ("2025-10-30", "Card", "Food", "Groceries", "Expense", 40.00, "Weekly shop"),
+        ("2025-11-01", "Bank Transfer", "Allowance", "From Parents", "Income", 800.00, ""),
+        ("2025-11-02", "Cash", "Food", "Lunch", "Expense", 12.00, "Café"),
+        ("2025-11-03", "Card", "Transportation", "Bus fare", "Expense", 3.00, "Lunch trip"),
+        ("2025-12-01", "Cash", "Food", "Dinner", "Expense", 20.00, ""),
+    ]
+    for tracker in (temp_tracker, mapped):
+        tracker.add_transactions(rows)
+        tracker.save_data()
+
+    assert mapped.get_balance() == temp_tracker.get_balance()
+    assert mapped.get_total_expenses("2025-11-01", "2025-11-30") == 15.00
+    assert mapped.get_expense_by_category() == temp_tracker.get_expense_by_category()
+    assert mapped.get_monthly_summary() == temp_tracker.get_monthly_summary()
+    assert mapped.filter_by_category("Food").index.tolist() == [0, 2, 4]
+    assert mapped.search_transactions("lunch")['Notes'].tolist() == ["Café", "Lunch trip"]
+
+    mapped.delete_transaction(0)
+    reopened = MappedTracker_v2.MappedFinanceTracker(directory)
+    assert len(reopened.transactions) == 4
+    assert [t.notes for t in reopened.transactions] == ["", "Café", "Lunch trip", ""]
+    assert reopened.get_expense_by_category() == {'Food': 32.00, 'Transportation': 3.00}
+
+
+def test_cents_totals_are_exact_on_10m_rows(temp_tracker):
+    """
+    Test that totals over 10 million random amounts match exact integer sums to the cent.
+    """
+    rows = 10_000_000
+    rng = np.random.default_rng(16)
+    cents = rng.integers(1, 10_000_000, rows)  # $0.01 to $100,000.00
+    is_income = rng.random(rows) < 0.2
+    category_codes = rng.integers(0, 4, rows)
+    dates = np.datetime64('2015-01-01') + rng.integers(0, 3650, rows)
+
+    temp_tracker.df = normalize_frame(pd.DataFrame({
+        'Date': dates.astype('datetime64[ns]'),
+        'Mode': pd.Categorical.from_codes(np.zeros(rows, dtype=np.int8), ['Card']),
+        'Category': pd.Categorical.from_codes(category_codes, ['Books', 'Food', 'Rent', 'Travel']),
+        'Sub Category': np.full(rows, '', dtype=object),
+        'Income/Expense': pd.Categorical.from_codes(is_income.astype(np.int8), ['Expense', 'Income']),
+        'Amount': cents / 100,
+        'Notes': np.full(rows, '', dtype=object),
+    }))
+
+    income = int(cents[is_income].sum())
+    expense = int(cents[~is_income].sum())
+    assert temp_tracker.get_total_income() == income / 100
+    assert temp_tracker.get_balance() == (income - expense) / 100
+
+    expected = pd.Series(cents[~is_income]).groupby(category_codes[~is_income]).sum()
+    by_category = temp_tracker.get_expense_by_category()
+    for code, name in enumerate(['Books', 'Food', 'Rent', 'Travel']):
+        assert by_category[name] == int(expected[code]) / 100
+
+    in_2016 = (dates >= np.datetime64('2016-01-01')) & (dates <= np.datetime64('2016-12-31'))
+    assert (temp_tracker.get_total_expenses("2016-01-01", "2016-12-31") ==
+            int(cents[in_2016 & ~is_income].sum()) / 100)
+
+    summary = temp_tracker.get_monthly_summary()
+    months = dates.astype('datetime64[M]')
+    january = months == np.datetime64('2020-01')
+    assert summary['2020-01']['income'] == int(cents[january & is_income].sum()) / 100
+    assert summary['2020-01']['expense'] == int(cents[january & ~is_income].sum()) / 100
+
+
+def test_label_columns_are_dictionary_encoded(temp_tracker):
+    """
+    Test that label columns stay categorical as new labels are added,
+    and take far less memory than plain strings.
+    """
+    temp_tracker.add_transaction("2025-11-18", "Cash", "Food", "Lunch", "Expense", 15.00)
+    temp_tracker.save_data()
+    loaded = FinanceTracker(temp_tracker.csv_file)
+    loaded.add_transaction("2025-11-19", "UPI", "Gifts", "Birthday", "Expense", 40.00)
+    loaded.add_transaction("2025-11-20", "Cash", "Food", "", "Expense", 5.00)
+
+    for col in ['Mode', 'Category', 'Sub Category', 'Income/Expense']:
+        assert isinstance(loaded.df[col].dtype, pd.CategoricalDtype)
+    assert 'Birthday' in loaded.df['Sub Category'].cat.categories
+    assert list(loaded.filter_by_category("Gifts")['Amount']) == [40.00]
+    assert loaded.filter_by_category("Unknown").empty
+    assert loaded.get_expense_by_category() == {'Food': 20.00, 'Gifts': 40.00}
+
+    labels = pd.DataFrame({
+        'Category': np.array(['Food', 'Rent', 'Transportation', 'Entertainment'])[np.arange(100_000) % 4],
+        'Sub Category': np.array(['Lunch', 'Bus', 'Movies'])[np.arange(100_000) % 3],
+    })
+    encoded = normalize_frame(labels.assign(Date='2025-11-18', Mode='Cash',
+                                            **{'Income/Expense': 'Expense', 'Amount': 1.0}))
+    encoded_bytes = encoded[['Category', 'Sub Category']].memory_usage(deep=True).sum()
+    object_bytes = labels.astype(object).memory_usage(deep=True).sum()
+    assert encoded_bytes * 10 < object_bytes
+
+
+def test_queries_do_not_copy_the_ledger(temp_tracker):
+    """
+    Test that queries allocate less than a single column of the ledger.
+    """
+    rows = 200_000
+    rng = np.random.default_rng(18)
+    temp_tracker.df = normalize_frame(pd.DataFrame({
+        'Date': (np.datetime64('2020-01-01') + rng.integers(0, 1500, rows)).astype('datetime64[ns]'),
+        'Mode': 'Cash',
+        'Category': np.array(['Food', 'Rent', 'Books'])[rng.integers(0, 3, rows)],
+        'Sub Category': 'Groceries',
+        'Income/Expense': np.array(['Income', 'Expense'])[rng.integers(0, 2, rows)],
+        'Amount': rng.integers(1, 100_000, rows) / 100,
+        'Notes': '',
+    }))
+    temp_tracker.get_total_income("2021-01-01", "2021-01-31")  # Build the date index once
+
+    queries = [
+        temp_tracker.get_total_income,
+        temp_tracker.get_total_expenses,
+        temp_tracker.get_balance,
+        temp_tracker.get_expense_by_category,
+        temp_tracker.get_monthly_summary,
+        lambda: temp_tracker.get_total_expenses("2021-01-01", "2021-01-31"),
+        lambda: temp_tracker.get_expense_by_category("2021-01-01", "2021-01-31"),
+        lambda: temp_tracker.get_recent_transactions(10),
+    ]
+    column_bytes = rows * 8
+    for query in queries:
+        tracemalloc.start()
+        query()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        assert peak < column_bytes
+
+
+def _write_bank_export(path, rows):
+    """
+    Write a bank-style CSV export (no Notes column, an extra Balance column).
+    """
+    months = ["2025-10", "2025-11", "2025-12"]
+    pd.DataFrame({
+        'Date': [f"{months[i % 3]}-{i % 28 + 1:02d}" for i in range(rows)],
+        'Mode': "Card",
+        'Category': [["Food", "Rent", "Books"][i % 3] for i in range(rows)],
+        'Sub Category': [f"Shop {i % 7}" for i in range(rows)],
+        'Income/Expense': ["Income" if i % 5 == 0 else "Expense" for i in range(rows)],
+        'Amount': [round(1 + i * 0.37, 2) for i in range(rows)],
+        'Balance': 0.0,
+    }).to_csv(path, index=False)
+
+
+def test_import_csv_streams_chunks(temp_tracker, tmp_path):
+    """
+    Test that import_csv appends a CSV chunk by chunk and reports progress.
+    """
+    source = str(tmp_path / "bank.csv")
+    _write_bank_export(source, 25)
+    expected = FinanceTracker(str(tmp_path / "expected.csv"))
+    expected.df = normalize_frame(pd.read_csv(source))
+
+    progress = []
+    count = temp_tracker.import_csv(source, chunksize=10,
+                                    progress=lambda *values: progress.append(values))
+
+    assert count == 25
+    assert [rows for rows, _, _ in progress] == [10, 20, 25]
+    assert progress[-1][1] == progress[-1][2] == os.path.getsize(source)
+    assert temp_tracker.get_balance() == expected.get_balance()
+    assert temp_tracker.get_monthly_summary() == expected.get_monthly_summary()
+    assert temp_tracker.get_total_income("2025-11-01", "2025-11-30") == \
+        expected.get_total_income("2025-11-01", "2025-11-30")
+    assert temp_tracker.search_transactions("shop 3")['Amount'].tolist() == \
+        expected.search_transactions("shop 3")['Amount'].tolist()
+
+    temp_tracker.save_data()
+    assert len(FinanceTracker(temp_tracker.csv_file).transactions) == 25
+
+    bad = pd.read_csv(source)
+    bad.loc[15, 'Income/Expense'] = "Refund"
+    bad.to_csv(source, index=False)
+    with pytest.raises(ValueError, match="row 16"):
+        temp_tracker.import_csv(source, chunksize=10)
+    assert len(temp_tracker.transactions) == 35  # The chunk before the bad row was imported
+
+    bad.drop(columns=['Amount']).to_csv(source, index=False)
+    with pytest.raises(ValueError, match="Missing columns: Amount"):
+        temp_tracker.import_csv(source)
+
+
+def test_import_csv_into_sqlite_and_mapped(tmp_path):
+    """
+    Test that the SQLite and memory-mapped trackers import through their bulk paths.
+    """
+    source = str(tmp_path / "bank.csv")
+    _write_bank_export(source, 25)
+    expected = FinanceTracker(str(tmp_path / "expected.csv"))
+    expected.df = normalize_frame(pd.read_csv(source))
+
+    db_file = str(tmp_path / "ledger.db")
+    open(db_file, 'wb').close()
+    directory = str(tmp_path / "ledger.cols")
+    os.makedirs(directory)
+    for tracker in (SQLiteFinanceTracker(db_file), MappedTracker_v2.MappedFinanceTracker(directory)):
+        assert tracker.import_csv(source, chunksize=10) == 25
+        assert tracker.get_balance() == expected.get_balance()
+        assert tracker.get_monthly_summary() == expected.get_monthly_summary()
+
+
+def _read_export(path):
+    """
+    Read an exported file back into the tracker's schema.
+    """
+    if path.endswith('.parquet'):
+        df = pd.read_parquet(path)
+    elif path.endswith('.jsonl') and os.path.getsize(path) == 0:
+        df = pd.DataFrame(columns=COLUMNS)  # JSON Lines has no header
+    elif path.endswith('.jsonl'):
+        df = pd.read_json(path, lines=True, dtype={'Date': str, 'Notes': str})
+    else:
+        df = pd.read_csv(path)
+    return normalize_frame(df)
+
+
+@pytest.mark.parametrize('extension', ['.csv', '.csv.gz', '.parquet', '.jsonl'])
+def test_export_streams_filtered_rows(temp_tracker, tmp_path, extension):
+    """
+    Test that export writes the filtered rows in chunks in every format.
+    """
+    source = str(tmp_path / "bank.csv")
+    _write_bank_export(source, 25)
+    temp_tracker.import_csv(source)
+
+    target = str(tmp_path / f"export{extension}")
+    progress = []
+    count = temp_tracker.export(target, "2025-11-01", "2025-12-31", category="Rent",
+                                trans_type="Expense", chunksize=2,
+                                progress=lambda *values: progress.append(values))
+
+    expected = temp_tracker.filter_by_date_range("2025-11-01", "2025-12-31")
+    expected = expected[(expected['Category'] == "Rent") & (expected['Income/Expense'] == "Expense")]
+    exported = _read_export(target)
+    assert count == len(expected) > 0
+    assert progress[-1] == (count, count) and len(progress) == (count + 1) // 2
+    assert exported['Amount'].tolist() == expected['Amount'].tolist()
+    assert exported['Date'].tolist() == expected['Date'].tolist()
+    assert exported['Sub Category'].tolist() == expected['Sub Category'].tolist()
+
+    assert temp_tracker.export(target, category="Unknown") == 0
+    assert list(_read_export(target).columns) == COLUMNS and _read_export(target).empty
+
+    def fail(rows, total):
+        raise OSError("disk full")
+    temp_tracker.export(target, chunksize=2)
+    with pytest.raises(OSError):
+        temp_tracker.export(target, chunksize=2, progress=fail)
+    assert len(_read_export(target)) == 25  # The previous export is left intact
+    assert not os.path.exists(target + '.tmp')
+
+
+def test_export_from_sqlite_and_mapped(tmp_path):
+    """
+    Test that the SQLite and memory-mapped trackers export the same rows as the DataFrame tracker.
+    """
+    source = str(tmp_path / "bank.csv")
+    _write_bank_export(source, 25)
+    expected = FinanceTracker(str(tmp_path / "expected.csv"))
+    expected.df = normalize_frame(pd.read_csv(source))
+    expected.export(str(tmp_path / "expected.csv.gz"), "2025-11-01", "2025-11-30",
+                    trans_type="Expense")
+    expected_rows = _read_export(str(tmp_path / "expected.csv.gz"))
+
+    db_file = str(tmp_path / "ledger.db")
+    open(db_file, 'wb').close()
+    directory = str(tmp_path / "ledger.cols")
+    os.makedirs(directory)
+    for tracker in (SQLiteFinanceTracker(db_file), MappedTracker_v2.MappedFinanceTracker(directory)):
+        tracker.import_csv(source)
+        target = str(tmp_path / f"{type(tracker).__name__}.parquet")
+        assert tracker.export(target, "2025-11-01", "2025-11-30", trans_type="Expense",
+                              chunksize=3) == len(expected_rows)
+        pd.testing.assert_frame_equal(_read_export(target), expected_rows)
+
+
+def test_delete_by_id_in_sqlite_and_mapped(tmp_path, monkeypatch):
+    """
+    Test that SQLite and the column store delete by the same stable IDs.
+    """
+    monkeypatch.setattr(MappedTracker_v2, 'CHUNK_ROWS', 3)  # Cross chunk boundaries
+    rows = [("2025-11-01", "Cash", "Food", f"Meal {i}", "Expense", 10.00 + i) for i in range(10)]
+    directory = str(tmp_path / "ledger.cols")
+    os.makedirs(directory)
+    db_file = str(tmp_path / "ledger.db")
+    open(db_file, 'wb').close()
+    sqlite = SQLiteFinanceTracker(db_file)
+    mapped = MappedTracker_v2.MappedFinanceTracker(directory)
+
+    for tracker in (sqlite, mapped):
+        tracker.add_transactions(rows)
+        tracker.save_data()
+        ids = tracker.df.index.tolist()
+        assert tracker.delete_transactions([ids[0], ids[4], ids[4]]) == 2
+        assert tracker.get_total_expenses() == 121.00
+        assert tracker.get_recent_transactions(2).index.tolist() == ids[-2:]
+
+    # The column store only logged the deletes and skips the rows when reopened
+    assert mapped.store.count == 10
+    reopened = MappedTracker_v2.MappedFinanceTracker(directory)
+    assert reopened.df.index.tolist() == [1, 2, 3, 5, 6, 7, 8, 9]
+    assert reopened.get_monthly_summary() == sqlite.get_monthly_summary()
+    assert reopened.transactions[3].sub_category == "Meal 5"
+
+    reopened.delete_transactions([1, 2])  # Past the threshold: compacted
+    assert reopened.store.count == 6
+    assert reopened.df.index.tolist() == [3, 5, 6, 7, 8, 9]
+
+
+def test_ids_are_not_reused_after_compaction(temp_tracker, tmp_path):
+    """
+    Test that deleting the newest rows, compacting and reloading never hands
+    their IDs out again, in every backend.
+    """
+    rows = [("2025-11-01", "Cash", "Food", f"Meal {i}", "Expense", 10.00 + i) for i in range(8)]
+    temp_tracker.add_transactions(rows)
+    temp_tracker.save_data()
+    temp_tracker.delete_transactions([5, 6, 7])  # Past the threshold: compacted on save
+    temp_tracker.save_data()
+    assert pd.read_csv(temp_tracker.csv_file)['ID'].tolist() == [0, 1, 2, 3, 4]
+    reloaded = FinanceTracker(temp_tracker.csv_file)
+    reloaded.add_transaction("2025-11-02", "Cash", "Food", "Snack", "Expense", 1.00)
+    assert reloaded.df.index[-1] == 8
+
+    # A row deleted before it was ever saved keeps its ID too
+    reloaded.add_transaction("2025-11-02", "Cash", "Food", "Snack", "Expense", 2.00)
+    reloaded.delete_transactions([9])
+    reloaded.save_data()
+    reloaded = FinanceTracker(temp_tracker.csv_file)
+    reloaded.add_transaction("2025-11-03", "Cash", "Food", "Snack", "Expense", 3.00)
+    assert reloaded.df.index.tolist() == [0, 1, 2, 3, 4, 8, 10]
+
+    directory = str(tmp_path / "ledger.cols")
+    os.makedirs(directory)
+    db_file = str(tmp_path / "ledger.db")
+    open(db_file, 'wb').close()
+    mapped = MappedTracker_v2.MappedFinanceTracker(directory)
+    sqlite = SQLiteFinanceTracker(db_file)
+    for tracker in (mapped, sqlite):
+        tracker.add_transactions(rows)
+        tracker.save_data()
+        tracker.delete_transactions(tracker.df.index[-3:])
+        tracker.compact()
+    assert mapped.store.count == 5
+
+    for tracker in (MappedTracker_v2.MappedFinanceTracker(directory), SQLiteFinanceTracker(db_file)):
+        tracker.add_transaction("2025-11-02", "Cash", "Food", "Snack", "Expense", 1.00)
+        ids = tracker.df.index.tolist()
+        assert len(ids) == 6 and ids[-1] == ids[-2] + 4
+
+
+def test_data_version_changes_with_transactions(temp_tracker, tmp_path):
+    """
+    Test that the data version moves on every change and not on queries.
+    """
+    version = temp_tracker.version
+    temp_tracker.add_transaction("2025-11-18", "Cash", "Food", "Lunch", "Expense", 15.00)
+    assert temp_tracker.version > version
+
+    version = temp_tracker.version
+    temp_tracker.get_expense_by_category()
+    temp_tracker.get_monthly_summary()
+    temp_tracker.save_data()
+    assert temp_tracker.version == version
+
+    source = str(tmp_path / "bank.csv")
+    _write_bank_export(source, 5)
+    temp_tracker.import_csv(source)
+    assert temp_tracker.version > version
+
+    version = temp_tracker.version
+    temp_tracker.delete_transaction(0)
+    assert temp_tracker.version > version
+
+
+def test_snapshot_summarizes_the_saved_ledger(temp_tracker):
+    """
+    Test that sync writes a snapshot matching the tracker's totals and rollups.
+    """
+    for day in range(1, 13):
+        temp_tracker.add_transaction(f"2025-{day:02d}-05", "Card", "Food", "Lunch", "Expense", 10.10)
+        temp_tracker.add_transaction(f"2025-{day:02d}-01", "Bank Transfer", "Allowance",
+                                     "Monthly", "Income", 500.00)
+    temp_tracker.save_data()
+    temp_tracker.sync()
+
+    snapshot = read_snapshot(temp_tracker.csv_file, verify=True)
+    assert snapshot.rows == 24
+    assert snapshot.summary() == (temp_tracker.get_total_income(), temp_tracker.get_total_expenses(),
+                                  temp_tracker.get_balance())
+    assert snapshot.categories['Expense'] == {'Food': 12 * 1010}
+    assert snapshot.months['2025-03'] == {'Expense': 1010, 'Income': 50000}
+    assert len(snapshot.recent) == 10
+    assert snapshot.recent[-1] == ["2025-12-01", "Bank Transfer", "Allowance", "Monthly",
+                                   "Income", 50000, ""]
+
+    # Reloading an unchanged ledger does not write the snapshot again
+    reloaded = FinanceTracker(temp_tracker.csv_file)
+    assert reloaded.save_snapshot() is False
+
+
+def test_snapshot_is_invalidated_by_file_changes(temp_tracker):
+    """
+    Test that a snapshot is ignored once the data file changes, and that
+    verify catches edits that keep the size and modification time.
+    """
+    temp_tracker.add_transaction("2025-11-18", "Cash", "Food", "Lunch", "Expense", 15.00)
+    temp_tracker.save_data()
+    temp_tracker.sync()
+    path = temp_tracker.csv_file
+    assert read_snapshot(path) is not None
+
+    # Saving more rows without a sync leaves the old snapshot stale
+    temp_tracker.add_transaction("2025-11-19", "Cash", "Food", "Dinner", "Expense", 20.00)
+    temp_tracker.save_data()
+    assert read_snapshot(path) is None
+    temp_tracker.sync()
+    assert read_snapshot(path).rows == 2
+
+    # Same size and modification time, different contents
+    stat = os.stat(path)
+    with open(path, 'r+b') as file:
+        content = file.read()
+        file.seek(0)
+        file.write(content.replace(b"Dinner", b"Supper"))
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert read_snapshot(path) is not None
+    assert read_snapshot(path, verify=True) is None
+
+
+def test_snapshot_is_written_for_a_file_without_ids(tmp_path):
+    """
+    Test that sync writes the snapshot of a ledger saved before transactions had IDs.
+    """
+    path = str(tmp_path / "legacy.csv")
+    with open(path, 'w') as file:
+        file.write("Date,Mode,Category,Sub Category,Income/Expense,Amount,Notes\n"
+                   "2025-11-18,Cash,Food,Lunch,Expense,15.00,\n"
+                   "2025-11-19,Bank Transfer,Allowance,Monthly,Income,500.00,\n")
+
+    tracker = FinanceTracker(path)
+    tracker.sync()
+    snapshot = read_snapshot(path, verify=True)
+    assert snapshot is not None
+    assert snapshot.rows == 2
+    assert snapshot.summary() == (500.00, 15.00, 485.00)
+
+
+def test_charts_update_artists_in_place():
+    """
+    Test that charts move their existing artists and only redraw fully when the axes change.
+    """
+    pytest.importorskip('matplotlib')
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from ChartView_v2 import CategoryChart, TrendChart
+
+    chart = CategoryChart()
+    canvas = FigureCanvasAgg(chart.figure)
+    chart.attach(canvas)
+    full_draws = []
+    canvas.mpl_connect('draw_event', full_draws.append)
+
+    chart.show({'Food': 10.0, 'Rent': 30.0})
+    wedges = list(chart.wedges)
+    chart.show({'Food': 30.0, 'Rent': 10.0})
+    assert chart.wedges == wedges and len(full_draws) == 1  # Blitted, not redrawn
+
+    fresh = CategoryChart()
+    fresh.show({'Food': 30.0, 'Rent': 10.0})
+    for moved, built in zip(chart.wedges + chart.autotexts, fresh.wedges + fresh.autotexts):
+        if hasattr(moved, 'theta1'):
+            assert (moved.theta1, moved.theta2) == pytest.approx((built.theta1, built.theta2))
+        else:
+            assert moved.get_text() == built.get_text()
+            assert moved.get_position() == pytest.approx(built.get_position())
+
+    chart.show({'Books': 5.0, 'Food': 30.0, 'Rent': 10.0})
+    assert len(chart.wedges) == 3 and len(full_draws) == 2
+
+    trend = TrendChart()
+    trend.attach(FigureCanvasAgg(trend.figure))
+    days = pd.to_datetime(["2025-11-01", "2025-11-02", "2025-11-03"])
+    trend.show(pd.DataFrame({'Date': days, 'Amount': [10.0, 20.0, 15.0]}))
+    line = trend.line
+    trend.show(pd.DataFrame({'Date': days, 'Amount': [12.0, 18.0, 15.0]}))
+    assert trend.line is line and list(line.get_ydata()) == [12.0, 18.0, 15.0]
+
+
+class _FakeRoot:
+    """
+    Stand-in for a Tk root that runs after() and after_idle() callbacks when asked to.
+    """
+
+    def __init__(self):
+        self.callbacks = []
+
+    def after(self, delay, callback):
+        self.callbacks.append(callback)
+
+    def after_idle(self, callback):
+        self.callbacks.append(callback)
+
+    def run_pending(self):
+        while self.callbacks:
+            self.callbacks.pop(0)()
+
+
+def test_background_worker_drops_stale_results():
+    """
+    Test that only the newest job per key delivers its result.
+    """
+    root = _FakeRoot()
+    worker = BackgroundWorker(root)
+    results = []
+
+    worker.submit(lambda: "old", on_done=results.append, key='filter')
+    worker.submit(lambda: "new", on_done=results.append, key='filter')
+    worker.submit(lambda: 1 / 0, on_error=lambda e: results.append(type(e).__name__))
+    worker.shutdown()
+    root.run_pending()
+
+    assert results == ["new", "ZeroDivisionError"]
+
+
+def test_background_worker_reports_progress():
+    """
+    Test that progress reported on the worker thread reaches on_progress before on_done.
+    """
+    root = _FakeRoot()
+    worker = BackgroundWorker(root)
+    events = []
+
+    def job(progress):
+        for step in range(3):
+            progress(step, 3)
+        return "done"
+
+    worker.submit(job, on_progress=lambda *values: events.append(values), on_done=events.append)
+    worker.shutdown()
+    root.run_pending()
+
+    assert events == [(0, 3), (1, 3), (2, 3), "done"]
+
+
+def test_refresh_scheduler_coalesces_bursts(temp_tracker):
+    """
+    Test that 50 quick additions redraw each visible view once,
+    and that a hidden view waits until it is shown.
+    """
+    root = _FakeRoot()
+    worker = BackgroundWorker(root)
+    scheduler = RefreshScheduler(root)
+    redraws = []
+    shown = {'dashboard': False}
+    scheduler.register('transactions', lambda: redraws.append('transactions'))
+    scheduler.register('dashboard', lambda: redraws.append('dashboard'),
+                       lambda: shown['dashboard'])
+
+    for day in range(1, 51):
+        worker.submit(temp_tracker.add_transaction, f"2025-01-{day % 28 + 1:02d}", "Cash", "Food",
+                      "Lunch", "Expense", 5.00, on_done=lambda _: scheduler.mark_dirty())
+    worker.shutdown()
+    root.run_pending()
+
+    assert len(temp_tracker.df) == 50
+    assert redraws == ['transactions']
+
+    # Showing the dashboard redraws the view left dirty while hidden, once
+    shown['dashboard'] = True
+    scheduler.visibility_changed()
+    scheduler.visibility_changed()
+    root.run_pending()
+    assert redraws == ['transactions', 'dashboard']
+
+
+def test_gui_starts_without_pandas_or_matplotlib():
+    """
+    Test that importing the GUI loads neither pandas nor matplotlib, so the
+    window can be shown before the tracker and the charts are loaded.
+    The import time itself is measured by the startup benchmark.
+    """
+    # A fresh interpreter, since this one has imported both already
+    check = ("import sys, main_v2; "
+             "print(sorted({'pandas', 'matplotlib'} & set(sys.modules)))")
+    result = subprocess.run([sys.executable, '-c', check], capture_output=True, text=True,
+                            check=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+    assert result.stdout.strip() == "[]"